@@ -21,6 +21,9 @@ class ApiPrefix(BaseModel):
     notifications: str = "/notifications"
     conferences: str = "/conferences"
     admin: str = "/admin"
+    deletion_jobs: str = "/deletion-jobs"
+    analytics: str = "/analytics"
+    search: str = "/search"
 
 
 class DatabaseConfig(BaseModel):
@@ -75,6 +78,14 @@ class RabbitMQConfig(BaseModel):
     notifications_exchange: str = Field("notifications", env="APP_CONFIG__RABBITMQ__NOTIFICATIONS_EXCHANGE")
     dlq_queue: str = Field("notifications_dlq", env="APP_CONFIG__RABBITMQ__DLQ_QUEUE")
     
+    audit_queue: str = Field("audit", env="APP_CONFIG__RABBITMQ__AUDIT_QUEUE")
+    audit_exchange: str = Field("audit", env="APP_CONFIG__RABBITMQ__AUDIT_EXCHANGE")
+    audit_dlq_queue: str = Field("audit_dlq", env="APP_CONFIG__RABBITMQ__AUDIT_DLQ_QUEUE")
+    
+    analytics_queue: str = Field("analytics", env="APP_CONFIG__RABBITMQ__ANALYTICS_QUEUE")
+    analytics_exchange: str = Field("analytics", env="APP_CONFIG__RABBITMQ__ANALYTICS_EXCHANGE")
+    analytics_dlq_queue: str = Field("analytics_dlq", env="APP_CONFIG__RABBITMQ__ANALYTICS_DLQ_QUEUE")
+    
     @property
     def url(self) -> str:
         """Формирует URL для подключения к RabbitMQ"""
@@ -89,6 +100,13 @@ class LiveKitConfig(BaseModel):
     api_secret: str = Field("secretsecretsecretsecretsecret12", env="APP_CONFIG__LIVEKIT__API_SECRET")
     ws_port: int = Field(7880, env="APP_CONFIG__LIVEKIT__WS_PORT")
     http_port: int = Field(7881, env="APP_CONFIG__LIVEKIT__HTTP_PORT")
+    request_timeout_seconds: float = Field(5.0, env="APP_CONFIG__LIVEKIT__REQUEST_TIMEOUT_SECONDS")
+    max_retries: int = Field(2, env="APP_CONFIG__LIVEKIT__MAX_RETRIES")
+    retry_backoff_seconds: float = Field(0.2, env="APP_CONFIG__LIVEKIT__RETRY_BACKOFF_SECONDS")
+    breaker_failure_threshold: int = Field(5, env="APP_CONFIG__LIVEKIT__BREAKER_FAILURE_THRESHOLD")
+    breaker_reset_seconds: float = Field(30.0, env="APP_CONFIG__LIVEKIT__BREAKER_RESET_SECONDS")
+    webhook_flush_interval_seconds: float = Field(1.0, env="APP_CONFIG__LIVEKIT__WEBHOOK_FLUSH_INTERVAL_SECONDS")
+    webhook_max_apply_attempts: int = Field(10, env="APP_CONFIG__LIVEKIT__WEBHOOK_MAX_APPLY_ATTEMPTS")
     
     @property
     def ws_url(self) -> str:
@@ -106,6 +124,92 @@ class LiveKitConfig(BaseModel):
         return f"http://{self.host}:{self.http_port}"
 
 
+class DeletionConfig(BaseModel):
+    """Конфигурация фонового удаления групп и проектов"""
+    batch_size: int = Field(500, env="APP_CONFIG__DELETION__BATCH_SIZE")
+    stale_after_seconds: int = Field(300, env="APP_CONFIG__DELETION__STALE_AFTER_SECONDS")
+
+
+class ConferenceChatConfig(BaseModel):
+    """Конфигурация буфера чата созвонов в Redis"""
+    flush_interval_seconds: float = Field(2.0, env="APP_CONFIG__CONFERENCE_CHAT__FLUSH_INTERVAL_SECONDS")
+    flush_batch_size: int = Field(500, env="APP_CONFIG__CONFERENCE_CHAT__FLUSH_BATCH_SIZE")
+    roster_ttl_seconds: int = Field(30, env="APP_CONFIG__CONFERENCE_CHAT__ROSTER_TTL_SECONDS")
+    id_block_size: int = Field(100, env="APP_CONFIG__CONFERENCE_CHAT__ID_BLOCK_SIZE")
+
+
+class ConferencePresenceConfig(BaseModel):
+    """Конфигурация живых счётчиков участников созвонов в Redis"""
+    max_samples: int = Field(5000, env="APP_CONFIG__CONFERENCE_PRESENCE__MAX_SAMPLES")
+    timeline_points: int = Field(60, env="APP_CONFIG__CONFERENCE_PRESENCE__TIMELINE_POINTS")
+    ttl_seconds: int = Field(86400, env="APP_CONFIG__CONFERENCE_PRESENCE__TTL_SECONDS")
+
+
+class ConferenceReaperConfig(BaseModel):
+    """Конфигурация фонового завершения зависших созвонов"""
+    interval_seconds: int = Field(60, env="APP_CONFIG__CONFERENCE_REAPER__INTERVAL_SECONDS")
+    idle_minutes: int = Field(10, env="APP_CONFIG__CONFERENCE_REAPER__IDLE_MINUTES")
+    batch_size: int = Field(50, env="APP_CONFIG__CONFERENCE_REAPER__BATCH_SIZE")
+
+
+class AdminConfig(BaseModel):
+    """Конфигурация админ-панели"""
+    stats_cache_seconds: int = Field(60, env="APP_CONFIG__ADMIN__STATS_CACHE_SECONDS")
+
+
+class AuditConfig(BaseModel):
+    """Конфигурация асинхронной записи журнала аудита"""
+    batch_size: int = Field(500, env="APP_CONFIG__AUDIT__BATCH_SIZE")
+    flush_interval_seconds: float = Field(1.0, env="APP_CONFIG__AUDIT__FLUSH_INTERVAL_SECONDS")
+
+
+class AnalyticsConfig(BaseModel):
+    """Конфигурация потока событий аналитики и дневных агрегатов"""
+    batch_size: int = Field(1000, env="APP_CONFIG__ANALYTICS__BATCH_SIZE")
+    flush_interval_seconds: float = Field(5.0, env="APP_CONFIG__ANALYTICS__FLUSH_INTERVAL_SECONDS")
+    default_period_days: int = Field(30, env="APP_CONFIG__ANALYTICS__DEFAULT_PERIOD_DAYS")
+    max_period_days: int = Field(366, env="APP_CONFIG__ANALYTICS__MAX_PERIOD_DAYS")
+    flow_interval_seconds: float = Field(10.0, env="APP_CONFIG__ANALYTICS__FLOW_INTERVAL_SECONDS")
+    flow_batch_size: int = Field(5000, env="APP_CONFIG__ANALYTICS__FLOW_BATCH_SIZE")
+    flow_settle_seconds: int = Field(5, env="APP_CONFIG__ANALYTICS__FLOW_SETTLE_SECONDS")
+
+
+class DeadlinesConfig(BaseModel):
+    """Конфигурация уведомлений о приближающихся и просроченных дедлайнах"""
+    lead_minutes: list[int] = Field([1440, 60], env="APP_CONFIG__DEADLINES__LEAD_MINUTES")
+    horizon_hours: int = Field(24, env="APP_CONFIG__DEADLINES__HORIZON_HOURS")
+    reload_interval_seconds: int = Field(600, env="APP_CONFIG__DEADLINES__RELOAD_INTERVAL_SECONDS")
+    catch_up_hours: int = Field(24, env="APP_CONFIG__DEADLINES__CATCH_UP_HOURS")
+    batch_size: int = Field(500, env="APP_CONFIG__DEADLINES__BATCH_SIZE")
+    max_sleep_seconds: float = Field(60.0, env="APP_CONFIG__DEADLINES__MAX_SLEEP_SECONDS")
+
+
+class MaintenanceConfig(BaseModel):
+    """Конфигурация обслуживающих задач по расписанию (время расписаний — UTC)"""
+    batch_size: int = Field(1000, env="APP_CONFIG__MAINTENANCE__BATCH_SIZE")
+    jitter_seconds: float = Field(30.0, env="APP_CONFIG__MAINTENANCE__JITTER_SECONDS")
+    lease_seconds: int = Field(600, env="APP_CONFIG__MAINTENANCE__LEASE_SECONDS")
+    refresh_tokens_cron: str = Field("17 * * * *", env="APP_CONFIG__MAINTENANCE__REFRESH_TOKENS_CRON")
+    invitations_cron: str = Field("*/15 * * * *", env="APP_CONFIG__MAINTENANCE__INVITATIONS_CRON")
+    deadline_claims_cron: str = Field("40 3 * * *", env="APP_CONFIG__MAINTENANCE__DEADLINE_CLAIMS_CRON")
+    deadline_claims_retention_days: int = Field(7, env="APP_CONFIG__MAINTENANCE__DEADLINE_CLAIMS_RETENTION_DAYS")
+
+
+class SearchConfig(BaseModel):
+    """Конфигурация полнотекстового поиска"""
+    default_limit: int = Field(20, env="APP_CONFIG__SEARCH__DEFAULT_LIMIT")
+    max_limit: int = Field(100, env="APP_CONFIG__SEARCH__MAX_LIMIT")
+
+
+class AutocompleteConfig(BaseModel):
+    """Конфигурация автодополнения пользователей"""
+    default_limit: int = Field(10, env="APP_CONFIG__AUTOCOMPLETE__DEFAULT_LIMIT")
+    max_limit: int = Field(50, env="APP_CONFIG__AUTOCOMPLETE__MAX_LIMIT")
+    candidate_limit: int = Field(200, env="APP_CONFIG__AUTOCOMPLETE__CANDIDATE_LIMIT")
+    cache_ttl_seconds: float = Field(30.0, env="APP_CONFIG__AUTOCOMPLETE__CACHE_TTL_SECONDS")
+    cache_max_entries: int = Field(5000, env="APP_CONFIG__AUTOCOMPLETE__CACHE_MAX_ENTRIES")
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         case_sensitive=False,
@@ -120,6 +224,17 @@ class Settings(BaseSettings):
     redis: RedisConfig = RedisConfig()
     rabbitmq: RabbitMQConfig = RabbitMQConfig()
     livekit: LiveKitConfig = LiveKitConfig()
+    deletion: DeletionConfig = DeletionConfig()
+    conference_chat: ConferenceChatConfig = ConferenceChatConfig()
+    conference_presence: ConferencePresenceConfig = ConferencePresenceConfig()
+    conference_reaper: ConferenceReaperConfig = ConferenceReaperConfig()
+    admin: AdminConfig = AdminConfig()
+    audit: AuditConfig = AuditConfig()
+    analytics: AnalyticsConfig = AnalyticsConfig()
+    deadlines: DeadlinesConfig = DeadlinesConfig()
+    maintenance: MaintenanceConfig = MaintenanceConfig()
+    search: SearchConfig = SearchConfig()
+    autocomplete: AutocompleteConfig = AutocompleteConfig()
     
     @property
     def debug(self) -> bool:
@@ -0,0 +1,118 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from core.database.models import OPEN_TASK_CONDITION, search_vector_sql
+from core.logger import logger
+
+
+def _cascade_foreign_key(table: str, column: str, referenced_table: str) -> str:
+    """DDL, переводящий внешний ключ на ON DELETE CASCADE, если он ещё не каскадный."""
+    constraint = f"{table}_{column}_fkey"
+    return f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_constraint
+                WHERE conname = '{constraint}' AND confdeltype <> 'c'
+            ) THEN
+                ALTER TABLE {table} DROP CONSTRAINT {constraint};
+                ALTER TABLE {table} ADD CONSTRAINT {constraint}
+                    FOREIGN KEY ({column}) REFERENCES {referenced_table} (id) ON DELETE CASCADE;
+            END IF;
+        END $$;
+    """
+
+
+def _search_vector_column(table: str, title_column: str, body_column: str | None = None) -> list[str]:
+    """DDL генерируемой колонки полнотекстового поиска и её GIN-индекса."""
+    return [
+        f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({search_vector_sql(title_column, body_column)}) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_search_vector ON {table} USING gin (search_vector)",
+    ]
+
+
+# Расширения нужны индексам моделей, поэтому ставятся до create_all
+SCHEMA_EXTENSIONS: list[str] = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+]
+
+# create_all создаёт только недостающие таблицы, поэтому индексы и ограничения
+# для уже существующих таблиц догоняем идемпотентными DDL-запросами.
+SCHEMA_UPDATES: list[str] = [
+    "CREATE INDEX IF NOT EXISTS ix_task_history_task_id_created_at "
+    "ON task_history (task_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_task_comments_task_id_created_at "
+    "ON task_comments (task_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_task_comments_task_id_parent_id_id "
+    "ON task_comments (task_id, parent_id, id)",
+    "CREATE INDEX IF NOT EXISTS ix_project_group_association_group_id "
+    "ON project_group_association (group_id)",
+    "CREATE INDEX IF NOT EXISTS ix_group_members_group_id_user_id "
+    "ON group_members (group_id, user_id)",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_group_id_id ON tasks (group_id, id)",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_project_id_id ON tasks (project_id, id)",
+    # Фильтры по тегам (tags @> ...) обслуживает GIN-индекс, а он есть только у jsonb
+    """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'tasks' AND column_name = 'tags' AND data_type = 'json'
+            ) THEN
+                ALTER TABLE tasks ALTER COLUMN tags TYPE jsonb USING tags::jsonb;
+            END IF;
+        END $$;
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_tasks_tags ON tasks USING gin (tags jsonb_path_ops)",
+    f"CREATE INDEX IF NOT EXISTS ix_tasks_open_deadline ON tasks (deadline) WHERE {OPEN_TASK_CONDITION}",
+    "CREATE INDEX IF NOT EXISTS ix_conference_messages_room_id_created_at_id "
+    "ON conference_messages (room_id, created_at, id)",
+    "DROP INDEX IF EXISTS ix_conference_messages_room_id_id",
+    "CREATE INDEX IF NOT EXISTS ix_conference_rooms_is_active_started_at "
+    "ON conference_rooms (is_active, started_at DESC NULLS LAST)",
+    "CREATE INDEX IF NOT EXISTS ix_admin_audit_logs_action_created_at "
+    "ON admin_audit_logs (action, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_admin_audit_logs_target_type_target_id "
+    "ON admin_audit_logs (target_type, target_id)",
+    "CREATE INDEX IF NOT EXISTS ix_refresh_tokens_expires_at ON refresh_tokens (expires_at)",
+    "CREATE INDEX IF NOT EXISTS ix_group_invitations_status_expires_at "
+    "ON group_invitations (status, expires_at)",
+    "CREATE INDEX IF NOT EXISTS ix_task_deadline_notifications_deadline "
+    "ON task_deadline_notifications (deadline)",
+    *(
+        f"CREATE INDEX IF NOT EXISTS ix_users_{column}_trgm ON users USING gin ({column} gin_trgm_ops)"
+        for column in ("login", "name", "email")
+    ),
+    "ALTER TABLE groups ADD COLUMN IF NOT EXISTS deleting_at TIMESTAMP WITH TIME ZONE",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS deleting_at TIMESTAMP WITH TIME ZONE",
+    "ALTER TABLE conference_stats ADD COLUMN IF NOT EXISTS average_participants DOUBLE PRECISION",
+    "ALTER TABLE conference_stats ADD COLUMN IF NOT EXISTS timeline JSON",
+    *_search_vector_column("tasks", "title", "description"),
+    *_search_vector_column("projects", "title", "description"),
+    *_search_vector_column("task_comments", "content"),
+    _cascade_foreign_key("task_history", "task_id", "tasks"),
+    _cascade_foreign_key("task_comments", "task_id", "tasks"),
+    _cascade_foreign_key("task_comments", "parent_id", "task_comments"),
+    _cascade_foreign_key("task_comment_mentions", "comment_id", "task_comments"),
+    _cascade_foreign_key("task_comment_reads", "comment_id", "task_comments"),
+    _cascade_foreign_key("task_user_association", "task_id", "tasks"),
+    _cascade_foreign_key("task_user_association", "user_id", "users"),
+    _cascade_foreign_key("conference_rooms", "task_id", "tasks"),
+    _cascade_foreign_key("conference_invited_users", "room_id", "conference_rooms"),
+    _cascade_foreign_key("conference_stats", "room_id", "conference_rooms"),
+]
+
+
+async def apply_schema_extensions(conn: AsyncConnection) -> None:
+    """Установка расширений PostgreSQL, от которых зависит схема."""
+    for statement in SCHEMA_EXTENSIONS:
+        await conn.execute(text(statement))
+
+
+async def apply_schema_updates(conn: AsyncConnection) -> None:
+    """Применение идемпотентных изменений схемы при старте приложения."""
+    for statement in SCHEMA_UPDATES:
+        await conn.execute(text(statement))
+
+    logger.info(f"Applied {len(SCHEMA_UPDATES)} schema update statements")
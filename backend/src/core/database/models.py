@@ -1,7 +1,8 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy import JSON, Boolean, Column, ForeignKey, String, DateTime, Table, Text, func, Integer, Enum, UniqueConstraint
+from sqlalchemy import JSON, Boolean, Column, Computed, Date, Float, ForeignKey, Index, String, DateTime, Table, Text, func, Integer, Enum, UniqueConstraint, text
 from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from typing import Any, Dict, List, Optional
 import enum
 
@@ -80,6 +81,25 @@ class NotificationPriority(enum.Enum):
     URGENT = "urgent"
 
 
+class DeletionJobStatus(enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+# Конфигурация полнотекстового поиска: интерфейс и данные в основном на русском
+TEXT_SEARCH_CONFIG = "russian"
+
+
+def search_vector_sql(title_column: str, body_column: Optional[str] = None) -> str:
+    """Выражение генерируемой колонки search_vector: заголовок с весом A, текст с весом B."""
+    expression = f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce({title_column}, '')), 'A')"
+    if body_column:
+        expression += f" || setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce({body_column}, '')), 'B')"
+    return expression
+
+
 class ConferenceRoomType(enum.Enum):
     PROJECT = "project"
     GROUP = "group"
@@ -89,8 +109,8 @@ class ConferenceRoomType(enum.Enum):
 task_user_association = Table(
     "task_user_association",
     Base.metadata,
-    Column("task_id", Integer, ForeignKey("tasks.id"), primary_key=True),
-    Column("user_id", Integer, ForeignKey("users.id"), primary_key=True),
+    Column("task_id", Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
 )
 
 project_group_association = Table(
@@ -98,12 +118,13 @@ project_group_association = Table(
     Base.metadata,
     Column("project_id", Integer, ForeignKey("projects.id"), primary_key=True),
     Column("group_id", Integer, ForeignKey("groups.id"), primary_key=True),
+    Index("ix_project_group_association_group_id", "group_id"),
 )
 
 conference_invited_users = Table(
     "conference_invited_users",
     Base.metadata,
-    Column("room_id", Integer, ForeignKey("conference_rooms.id"), primary_key=True),
+    Column("room_id", Integer, ForeignKey("conference_rooms.id", ondelete="CASCADE"), primary_key=True),
     Column("user_id", Integer, ForeignKey("users.id"), primary_key=True),
 )
 
@@ -132,6 +153,9 @@ task_comment_reads = Table(
 
 class GroupInvitation(Base):
     __tablename__ = "group_invitations"
+    __table_args__ = (
+        Index("ix_group_invitations_status_expires_at", "status", "expires_at"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id", ondelete="CASCADE"))
@@ -179,6 +203,12 @@ class Notification(Base):
 
 class User(Base):
     __tablename__ = "users"
+    # Триграммные индексы (pg_trgm) обслуживают поиск пользователей по подстроке через ILIKE
+    __table_args__ = (
+        Index("ix_users_login_trgm", "login", postgresql_using="gin", postgresql_ops={"login": "gin_trgm_ops"}),
+        Index("ix_users_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     login: Mapped[str] = mapped_column(String, unique=True)
@@ -250,6 +280,7 @@ class Group(Base):
         DateTime(timezone=True), 
         server_default=func.now()
     )
+    deleting_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     group_members: Mapped[List["GroupMember"]] = relationship(
         "GroupMember", back_populates="group", cascade="all, delete-orphan"
@@ -286,6 +317,7 @@ class GroupMember(Base):
     )
     __table_args__ = (
         UniqueConstraint('user_id', 'group_id', name='uq_user_group'),
+        Index("ix_group_members_group_id_user_id", "group_id", "user_id"),
     )
     
     user: Mapped["User"] = relationship("User", back_populates="group_memberships")
@@ -294,10 +326,18 @@ class GroupMember(Base):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String)
     description: Mapped[str | None] = mapped_column(String, nullable=True)
+    search_vector: Mapped[Optional[Any]] = mapped_column(
+        TSVECTOR,
+        Computed(search_vector_sql("title", "description"), persisted=True),
+        deferred=True,
+    )
     start_date: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), 
         server_default=func.now(), 
@@ -305,6 +345,7 @@ class Project(Base):
     )
     end_date: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     status: Mapped[str] = mapped_column(String)
+    deleting_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     groups: Mapped[List["Group"]] = relationship(
         "Group", 
@@ -322,12 +363,29 @@ class Project(Base):
     )
 
 
+# Условие частичного индекса по дедлайнам; в запросах к индексу повторяется литералом,
+# иначе планировщик не сопоставит связанные параметры с предикатом индекса
+OPEN_TASK_CONDITION = "status NOT IN ('DONE', 'CANCELLED')"
+
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_group_id_id", "group_id", "id"),
+        Index("ix_tasks_project_id_id", "project_id", "id"),
+        Index("ix_tasks_open_deadline", "deadline", postgresql_where=text(OPEN_TASK_CONDITION)),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_tasks_tags", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String)
     description: Mapped[str | None] = mapped_column(String, nullable=True)
+    search_vector: Mapped[Optional[Any]] = mapped_column(
+        TSVECTOR,
+        Computed(search_vector_sql("title", "description"), persisted=True),
+        deferred=True,
+    )
     
     status: Mapped[TaskStatus] = mapped_column(
         Enum(TaskStatus), 
@@ -362,7 +420,7 @@ class Task(Base):
     group_id: Mapped[Optional[int]] = mapped_column(ForeignKey("groups.id", ondelete="SET NULL"))
     group: Mapped["Group"] = relationship("Group", back_populates="tasks")
     
-    tags: Mapped[List[str]] = mapped_column(JSON, default=list, nullable=True)
+    tags: Mapped[List[str]] = mapped_column(JSONB, default=list, nullable=True)
     
     conferences: Mapped[List["ConferenceRoom"]] = relationship(
         "ConferenceRoom", back_populates="task"
@@ -371,6 +429,9 @@ class Task(Base):
 
 class TaskHistory(Base):
     __tablename__ = "task_history"
+    __table_args__ = (
+        Index("ix_task_history_task_id_created_at", "task_id", "created_at"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"))
@@ -393,6 +454,11 @@ class TaskHistory(Base):
 
 class TaskComment(Base):
     __tablename__ = "task_comments"
+    __table_args__ = (
+        Index("ix_task_comments_task_id_created_at", "task_id", "created_at"),
+        Index("ix_task_comments_task_id_parent_id_id", "task_id", "parent_id", "id"),
+        Index("ix_task_comments_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), index=True)
@@ -400,6 +466,11 @@ class TaskComment(Base):
     parent_id: Mapped[Optional[int]] = mapped_column(ForeignKey("task_comments.id", ondelete="CASCADE"), nullable=True, index=True)
 
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    search_vector: Mapped[Optional[Any]] = mapped_column(
+        TSVECTOR,
+        Computed(search_vector_sql("content"), persisted=True),
+        deferred=True,
+    )
     is_edited: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -432,6 +503,10 @@ class TaskComment(Base):
 
 class AdminAuditLog(Base):
     __tablename__ = "admin_audit_logs"
+    __table_args__ = (
+        Index("ix_admin_audit_logs_action_created_at", "action", "created_at"),
+        Index("ix_admin_audit_logs_target_type_target_id", "target_type", "target_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     actor_id: Mapped[Optional[int]] = mapped_column(
@@ -455,6 +530,9 @@ class AdminAuditLog(Base):
 
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+    )
 
     token_hash: Mapped[str] = mapped_column(String, unique=True, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -469,6 +547,9 @@ class RefreshToken(Base):
 
 class ConferenceRoom(Base):
     __tablename__ = "conference_rooms"
+    __table_args__ = (
+        Index("ix_conference_rooms_is_active_started_at", "is_active", text("started_at DESC NULLS LAST")),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     room_name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
@@ -542,6 +623,9 @@ class ConferenceParticipant(Base):
 
 class ConferenceMessage(Base):
     __tablename__ = "conference_messages"
+    __table_args__ = (
+        Index("ix_conference_messages_room_id_created_at_id", "room_id", "created_at", "id"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     room_id: Mapped[int] = mapped_column(ForeignKey("conference_rooms.id", ondelete="CASCADE"))
@@ -561,14 +645,124 @@ class ConferenceStats(Base):
     __tablename__ = "conference_stats"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    room_id: Mapped[int] = mapped_column(ForeignKey("conference_rooms.id"))
+    room_id: Mapped[int] = mapped_column(ForeignKey("conference_rooms.id", ondelete="CASCADE"))
     participant_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     peak_participants: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     duration_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     messages_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    average_participants: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    timeline: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
         server_default=func.now()
     )
     
-    room: Mapped["ConferenceRoom"] = relationship("ConferenceRoom", back_populates="stats")
\ No newline at end of file
+    room: Mapped["ConferenceRoom"] = relationship("ConferenceRoom", back_populates="stats")
+
+
+class DeletionJob(Base):
+    __tablename__ = "deletion_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    entity_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[DeletionJobStatus] = mapped_column(
+        Enum(DeletionJobStatus),
+        default=DeletionJobStatus.PENDING,
+        nullable=False,
+        index=True,
+    )
+    stage: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    processed_rows: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    requested_by_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(timezone.utc),
+    )
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    requested_by: Mapped[Optional["User"]] = relationship("User")
+
+
+class AnalyticsDailyRollup(Base):
+    """Дневные агрегаты событий по проекту или группе; пополняются консьюмером аналитики."""
+    __tablename__ = "analytics_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint("scope_type", "scope_id", "day", name="uq_analytics_daily_rollup"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    scope_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    scope_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    tasks_created: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    tasks_completed: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    tasks_reopened: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    cycle_time_seconds_total: Mapped[float] = mapped_column(Float, default=0, server_default="0", nullable=False)
+    cycle_time_samples: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    comments_created: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    meetings_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    meeting_minutes: Mapped[float] = mapped_column(Float, default=0, server_default="0", nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+
+class AnalyticsCheckpoint(Base):
+    """Позиция инкрементальной обработки исходной таблицы фоновым агрегатором."""
+    __tablename__ = "analytics_checkpoints"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    last_id: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+
+class TaskFlowMetrics(Base):
+    """Сводка движения задачи по статусам, собранная из task_history."""
+    __tablename__ = "task_flow_metrics"
+
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    first_started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    reopened_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    current_status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    status_since: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    backlog_seconds: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    todo_seconds: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    in_progress_seconds: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    review_seconds: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    done_seconds: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    cancelled_seconds: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+
+
+class TaskDeadlineNotification(Base):
+    """Отметка об отправленном уведомлении о дедлайне; уникальность делает отправку однократной между воркерами."""
+    __tablename__ = "task_deadline_notifications"
+    __table_args__ = (
+        UniqueConstraint("task_id", "kind", "deadline", name="uq_task_deadline_notification"),
+        Index("ix_task_deadline_notifications_deadline", "deadline"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    deadline: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    sent_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(timezone.utc),
+    )
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+from typing import Set
+
+# (минимум, максимум) для полей: минута, час, день месяца, месяц, день недели (0 и 7 — воскресенье)
+FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+MAX_LOOKAHEAD = timedelta(days=366 * 5)
+
+
+def _parse_field(field: str, low: int, high: int) -> Set[int]:
+    values: Set[int] = set()
+
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"Invalid cron step: {field}")
+
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            # "5/15" — с 5 до конца диапазона с шагом 15
+            end = high if step > 1 else start
+
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron field out of range: {field}")
+
+        values.update(range(start, end + 1, step))
+
+    return values
+
+
+class CronSchedule:
+    """Расписание в формате cron из пяти полей: минута, час, день месяца, месяц, день недели.
+
+    Поддерживаются *, списки, диапазоны и шаги; время считается в часовом поясе переданного момента.
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron expression: {expression}")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            _parse_field(field, low, high) for field, (low, high) in zip(fields, FIELD_RANGES)
+        )
+        self.weekdays = {weekday % 7 for weekday in weekdays}
+        # Как в cron: если ограничены и день месяца, и день недели, подходит любой из них
+        self._days_restricted = fields[2] != "*"
+        self._weekdays_restricted = fields[4] != "*"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_matches = moment.day in self.days
+        weekday_matches = (moment.weekday() + 1) % 7 in self.weekdays
+
+        if self._days_restricted and self._weekdays_restricted:
+            return day_matches or weekday_matches
+        return day_matches and weekday_matches
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Ближайшее срабатывание строго позже moment."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + MAX_LOOKAHEAD
+
+        while candidate < limit:
+            if candidate.month not in self.months:
+                month_start = candidate.replace(day=1, hour=0, minute=0)
+                candidate = (month_start + timedelta(days=32)).replace(day=1)
+                continue
+
+            if not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+
+            if candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+
+            return candidate
+
+        raise ValueError(f"Cron expression never fires: {self.expression}")
@@ -1,13 +1,9 @@
-import base64
 import json
 import time
 import jwt
 import secrets
 from typing import Optional, Dict, Any
 from core.config.settings import settings
-from core.logger import logger
-import httpx
-import requests
 
 
 class LiveKitTokenGenerator:
@@ -55,68 +51,7 @@ class LiveKitTokenGenerator:
             })
         }
         
-        token = jwt.encode(payload, self.api_secret, algorithm="HS256")
-            
-        # ----- ДИАГНОСТИКА -----
-        # Разбираем токен и печатаем его содержимое
-        header, body, signature = token.split('.')
-        # Дополняем padding, если нужно
-        body += '=' * (-len(body) % 4)
-        decoded_body = base64.urlsafe_b64decode(body).decode('utf-8')
-        logger.info(f"Generated JWT Payload: {decoded_body}")
-        # -----------------------
-
-        return token
-
-    def create_room(self, room_name: str) -> bool:
-        """
-        Создает комнату в LiveKit через HTTP API.
-        """
-        url = f"{settings.livekit.api_url}/twirp/livekit.RoomService/CreateRoom"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "name": room_name,
-            "emptyTimeout": 3600,  # 1 час
-            "maxParticipants": 30,
-        }
-        
-        try:
-            response = requests.post(url, headers=headers, json=payload, timeout=5)
-            if response.status_code == 200:
-                logger.info(f"LiveKit room '{room_name}' created successfully")
-                return True
-            else:
-                logger.error(f"Failed to create LiveKit room: {response.text}")
-                return False
-        except Exception as e:
-            logger.error(f"Error creating LiveKit room: {e}")
-            return False
-
-    def delete_room(self, room_name: str) -> bool:
-        """Удаляет комнату в LiveKit."""
-        import requests
-        
-        url = f"{settings.livekit.api_url}/twirp/livekit.RoomService/DeleteRoom"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        payload = {"name": room_name}
-        
-        try:
-            response = requests.post(url, headers=headers, json=payload, timeout=5)
-            if response.status_code == 200:
-                logger.info(f"LiveKit room '{room_name}' deleted successfully")
-                return True
-            else:
-                logger.error(f"Failed to delete LiveKit room: {response.text}")
-                return False
-        except Exception as e:
-            logger.error(f"Error deleting LiveKit room: {e}")
-            return False
+        return jwt.encode(payload, self.api_secret, algorithm="HS256")
 
 
 def generate_room_name(prefix: str = "room") -> str:
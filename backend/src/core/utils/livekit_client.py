@@ -0,0 +1,191 @@
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+import jwt
+
+from core.config.settings import settings
+from core.logger import logger
+
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+SERVER_TOKEN_TTL_SECONDS = 10 * 60
+
+
+class CircuitBreaker:
+    """Размыкается после failure_threshold ошибок подряд и через reset_seconds пропускает один пробный запрос."""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_seconds
+
+    def allow_request(self) -> bool:
+        """Можно ли выполнить запрос; в полуоткрытом состоянии пропускает только один пробный."""
+        if self.opened_at is None:
+            return True
+
+        now = time.monotonic()
+        if now - self.opened_at < self.reset_seconds:
+            return False
+
+        # Полуоткрытое состояние: пробный запрос снова взводит таймер, остальные ждут его результата.
+        # Если проба не завершится (например, задачу отменили), следующая пройдёт через reset_seconds
+        self.opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class LiveKitRoomClient:
+    """Асинхронный клиент Twirp API LiveKit с пулом соединений, повторами и предохранителем."""
+
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str,
+        api_secret: str,
+        timeout_seconds: float,
+        max_retries: int,
+        retry_backoff_seconds: float,
+        breaker_failure_threshold: int,
+        breaker_reset_seconds: float,
+        max_connections: int = 20,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.api_url = api_url.rstrip("/")
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.max_connections = max_connections
+        self.transport = transport
+        self.breaker = CircuitBreaker(breaker_failure_threshold, breaker_reset_seconds)
+        self.logger = logger
+        self._client: Optional[httpx.AsyncClient] = None
+        self._server_token: Optional[str] = None
+        self._server_token_expires_at = 0.0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.api_url,
+                timeout=httpx.Timeout(self.timeout_seconds),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self.transport,
+            )
+        return self._client
+
+    def _get_server_token(self) -> str:
+        # Серверный API LiveKit принимает только подписанный JWT с правами на управление комнатами
+        now = time.time()
+        if self._server_token is None or now >= self._server_token_expires_at - 60:
+            issued_at = int(now)
+            self._server_token = jwt.encode(
+                {
+                    "iss": self.api_key,
+                    "nbf": issued_at,
+                    "exp": issued_at + SERVER_TOKEN_TTL_SECONDS,
+                    "video": {"roomCreate": True, "roomList": True, "roomAdmin": True},
+                },
+                self.api_secret,
+                algorithm="HS256",
+            )
+            self._server_token_expires_at = issued_at + SERVER_TOKEN_TTL_SECONDS
+        return self._server_token
+
+    def _backoff(self, attempt: int) -> float:
+        # Экспоненциальная задержка с полным джиттером
+        return random.uniform(0, self.retry_backoff_seconds * (2 ** attempt))
+
+    async def _call(self, method: str, payload: Dict[str, Any]) -> Optional[httpx.Response]:
+        """Вызов метода RoomService; None — сервер недоступен или предохранитель разомкнут."""
+        if not self.breaker.allow_request():
+            self.logger.warning(f"LiveKit circuit is open, skipping {method}")
+            return None
+
+        url = f"/twirp/livekit.RoomService/{method}"
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._get_client().post(
+                    url,
+                    json=payload,
+                    headers={"Authorization": f"Bearer {self._get_server_token()}"},
+                )
+            except httpx.TransportError as e:
+                self.logger.warning(f"LiveKit {method} transport error (attempt {attempt + 1}): {e}")
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES and response.status_code < 500:
+                    self.breaker.record_success()
+                    return response
+                self.logger.warning(
+                    f"LiveKit {method} returned {response.status_code} (attempt {attempt + 1})"
+                )
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self._backoff(attempt))
+
+        self.breaker.record_failure()
+        return None
+
+    async def delete_room(self, room_name: str) -> bool:
+        response = await self._call("DeleteRoom", {"room": room_name})
+
+        if response is None:
+            self.logger.error(f"Failed to delete LiveKit room '{room_name}': unavailable")
+            return False
+
+        if response.status_code == 404:
+            # Комната уже закрыта самим LiveKit по emptyTimeout
+            return True
+
+        if response.status_code != 200:
+            self.logger.error(f"Failed to delete LiveKit room '{room_name}': {response.text}")
+            return False
+
+        self.logger.info(f"LiveKit room '{room_name}' deleted successfully")
+        return True
+
+    async def list_room_names(self, room_names: List[str]) -> Optional[Set[str]]:
+        """Имена комнат, существующих в LiveKit; None — ответ получить не удалось."""
+        response = await self._call("ListRooms", {"names": room_names})
+
+        if response is None or response.status_code != 200:
+            return None
+
+        return {room["name"] for room in response.json().get("rooms", [])}
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+livekit_client = LiveKitRoomClient(
+    api_url=settings.livekit.api_url,
+    api_key=settings.livekit.api_key,
+    api_secret=settings.livekit.api_secret,
+    timeout_seconds=settings.livekit.request_timeout_seconds,
+    max_retries=settings.livekit.max_retries,
+    retry_backoff_seconds=settings.livekit.retry_backoff_seconds,
+    breaker_failure_threshold=settings.livekit.breaker_failure_threshold,
+    breaker_reset_seconds=settings.livekit.breaker_reset_seconds,
+)
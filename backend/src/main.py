@@ -7,10 +7,14 @@ import uvicorn
 from core.config import settings
 from core.database.session import db_session
 from core.database.models import Base
+from core.database.migrations import apply_schema_extensions, apply_schema_updates
 from modules.notifications.redis_client import redis_client
 from shared.messaging import RabbitMQClient, MessagingModule
 from modules.notifications.consumer import NotificationConsumer
 from modules.notifications.publisher import NotificationPublisher
+from modules.notifications.deadlines import deadline_scheduler
+from modules.audit import AuditConsumer, audit_log_writer, audit_publisher
+from modules.analytics import AnalyticsConsumer, analytics_publisher, analytics_rollup_writer
 from core.logger import logger
 
 from modules.auth.router import router as auth_router
@@ -22,11 +26,28 @@ from modules.notifications.router import router as notifications_ws_router
 from modules.notifications.http_router import router as notifications_http_router
 from modules.conferences.router import router as conferences_router
 from modules.admin.router import router as admin_router
+from modules.deletion.router import router as deletion_jobs_router
+from modules.analytics.router import router as analytics_router
+from modules.search.router import router as search_router
+from modules.analytics.flow import task_flow_engine
+from modules.deletion.runner import deletion_runner
+from modules.maintenance import maintenance_runner
+from modules.conferences.chat_buffer import conference_chat_buffer
+from modules.conferences.livekit_events import livekit_event_buffer
+from modules.conferences.reaper import conference_reaper
+from core.utils.livekit_client import livekit_client
 
 rabbitmq_client = RabbitMQClient(settings.rabbitmq_url)
 notifications_messaging = MessagingModule(rabbitmq_client, "notifications")
 notification_publisher = NotificationPublisher(notifications_messaging)
 notification_consumer = NotificationConsumer(notifications_messaging)
+deadline_scheduler.bind(notification_publisher)
+audit_messaging = MessagingModule(rabbitmq_client, "audit")
+audit_publisher.bind(audit_messaging)
+audit_consumer = AuditConsumer(audit_messaging, prefetch_count=settings.audit.batch_size)
+analytics_messaging = MessagingModule(rabbitmq_client, "analytics")
+analytics_publisher.bind(analytics_messaging)
+analytics_consumer = AnalyticsConsumer(analytics_messaging, prefetch_count=settings.analytics.batch_size)
 
 
 @asynccontextmanager
@@ -34,12 +55,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting application lifespan...")
     
     async with db_session.engine.begin() as conn:
+        await apply_schema_extensions(conn)
         await conn.run_sync(Base.metadata.create_all)
+        await apply_schema_updates(conn)
     logger.info("Database tables created/verified")
     
     await redis_client.connect()
     logger.info(f"Redis connected: {redis_client.is_connected}")
     
+    await audit_log_writer.start()
+    logger.info("Audit log writer started")
+    
+    await analytics_rollup_writer.start()
+    logger.info("Analytics rollup writer started")
+    
     connected = await rabbitmq_client.connect()
     logger.info(f"RabbitMQ connected: {connected}")
     
@@ -53,18 +82,85 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         
         await notification_consumer.start()
         logger.info("Notification consumer started")
+        
+        await audit_messaging.setup(
+            exchange_name=settings.rabbitmq.audit_exchange,
+            queue_name=settings.rabbitmq.audit_queue,
+            dlq_name=settings.rabbitmq.audit_dlq_queue
+        )
+        await audit_consumer.start()
+        logger.info("Audit consumer started")
+        
+        await analytics_messaging.setup(
+            exchange_name=settings.rabbitmq.analytics_exchange,
+            queue_name=settings.rabbitmq.analytics_queue,
+            dlq_name=settings.rabbitmq.analytics_dlq_queue
+        )
+        await analytics_consumer.start()
+        logger.info("Analytics consumer started")
     else:
         logger.warning("RabbitMQ not connected, messaging not available")
     
+    await deletion_runner.start_watcher()
+    logger.info("Deletion job runner started")
+    
+    await conference_chat_buffer.start()
+    logger.info("Conference chat flusher started")
+    
+    await livekit_event_buffer.start()
+    logger.info("LiveKit event flusher started")
+    
+    await conference_reaper.start()
+    logger.info("Stale conference reaper started")
+    
+    await task_flow_engine.start()
+    logger.info("Task flow engine started")
+    
+    await deadline_scheduler.start()
+    logger.info("Deadline notification scheduler started")
+    
+    await maintenance_runner.start()
+    logger.info(f"Maintenance jobs scheduled: {', '.join(maintenance_runner.jobs)}")
+    
     yield
     
     logger.info("Shutting down application...")
     
+    await deletion_runner.stop()
+    logger.info("Deletion job runner stopped")
+    
+    await maintenance_runner.stop()
+    logger.info("Maintenance jobs stopped")
+    
+    await conference_reaper.stop()
+    logger.info("Stale conference reaper stopped")
+    
+    await task_flow_engine.stop()
+    logger.info("Task flow engine stopped")
+    
+    await deadline_scheduler.stop()
+    logger.info("Deadline notification scheduler stopped")
+    
+    await livekit_event_buffer.stop()
+    logger.info("LiveKit events applied")
+    
+    await conference_chat_buffer.stop()
+    logger.info("Conference chat buffers flushed")
+    
     await notification_consumer.stop()
     logger.info("Notification consumer stopped")
     
+    await audit_consumer.stop()
+    await audit_log_writer.stop()
+    logger.info("Audit log written")
+    
+    await analytics_consumer.stop()
+    await analytics_rollup_writer.stop()
+    logger.info("Analytics rollups written")
+    
     await rabbitmq_client.disconnect()
     await redis_client.disconnect()
+    await livekit_client.close()
     await db_session.dispose()
     logger.info("All connections closed")
 
@@ -89,6 +185,9 @@ app.include_router(notifications_ws_router, prefix=settings.api.notifications, t
 app.include_router(notifications_http_router, prefix=settings.api.notifications, tags=["Notifications HTTP"])
 app.include_router(conferences_router, prefix=settings.api.conferences, tags=["Conferences"])
 app.include_router(admin_router, prefix=settings.api.admin, tags=["Admin"])
+app.include_router(deletion_jobs_router, prefix=settings.api.deletion_jobs, tags=["Deletion jobs"])
+app.include_router(analytics_router, prefix=settings.api.analytics, tags=["Analytics"])
+app.include_router(search_router, prefix=settings.api.search, tags=["Search"])
 
 
 if __name__ == "__main__":
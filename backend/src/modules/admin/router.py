@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from core.database.models import TaskPriority, TaskStatus, User
 from core.services import ServiceFactory
@@ -14,6 +15,7 @@ from .schemas import (
     AdminConferenceRead,
     AdminGroupDetailRead,
     AdminGroupRead,
+    AdminMaintenanceJobRead,
     AdminProjectDetailRead,
     AdminProjectRead,
     AdminStatsRead,
@@ -57,14 +59,41 @@ def _get_admin_service(service_factory: ServiceFactory) -> AdminService:
     return service_factory.get("admin")
 
 
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _export_response(admin_service: AdminService, entity: str, export_format: str, **filters) -> StreamingResponse:
+    return StreamingResponse(
+        admin_service.stream_export(entity, export_format, **filters),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{export_format}"'},
+    )
+
+
 @router.get("/stats", response_model=AdminStatsRead)
 async def get_admin_stats(
+    refresh: bool = Query(False, description="Пересчитать показатели, минуя кэш"),
+    current_user: User = Depends(get_current_user),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+):
+    try:
+        admin_service = _get_admin_service(service_factory)
+        return await admin_service.get_stats(current_user, refresh=refresh)
+    except Exception as error:
+        raise _map_admin_error(error) from error
+
+
+@router.get("/maintenance/jobs", response_model=list[AdminMaintenanceJobRead])
+async def get_admin_maintenance_jobs(
     current_user: User = Depends(get_current_user),
     service_factory: ServiceFactory = Depends(get_service_factory),
 ):
     try:
         admin_service = _get_admin_service(service_factory)
-        return await admin_service.get_stats(current_user)
+        return await admin_service.get_maintenance_jobs(current_user)
     except Exception as error:
         raise _map_admin_error(error) from error
 
@@ -74,6 +103,8 @@ async def get_admin_users(
     q: str | None = Query(None, description="Поиск по логину, имени или email"),
     blocked: bool | None = Query(None, description="Фильтр по блокировке"),
     global_admin: bool | None = Query(None, description="Фильтр по системной роли global_admin"),
+    after_id: int | None = Query(None, description="Вернуть записи с id больше указанного"),
+    limit: int | None = Query(None, ge=1, le=1000, description="Размер страницы"),
     current_user: User = Depends(get_current_user),
     service_factory: ServiceFactory = Depends(get_service_factory),
 ):
@@ -84,6 +115,32 @@ async def get_admin_users(
             q=q,
             blocked=blocked,
             global_admin=global_admin,
+            after_id=after_id,
+            limit=limit,
+        )
+    except Exception as error:
+        raise _map_admin_error(error) from error
+
+
+@router.get("/users/export")
+async def export_admin_users(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$", description="csv или ndjson"),
+    q: str | None = Query(None, description="Поиск по логину, имени или email"),
+    blocked: bool | None = Query(None, description="Фильтр по блокировке"),
+    global_admin: bool | None = Query(None, description="Фильтр по системной роли global_admin"),
+    current_user: User = Depends(get_current_user),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+):
+    try:
+        admin_service = _get_admin_service(service_factory)
+        await admin_service.ensure_global_admin(current_user)
+        return _export_response(
+            admin_service,
+            "users",
+            export_format,
+            q=q,
+            blocked=blocked,
+            global_admin=global_admin,
         )
     except Exception as error:
         raise _map_admin_error(error) from error
@@ -131,13 +188,30 @@ async def make_user_global_admin(
 
 @router.get("/groups", response_model=list[AdminGroupRead])
 async def get_admin_groups(
+    q: str | None = Query(None, description="Поиск по названию или описанию группы"),
+    after_id: int | None = Query(None, description="Вернуть записи с id больше указанного"),
+    limit: int | None = Query(None, ge=1, le=1000, description="Размер страницы"),
+    current_user: User = Depends(get_current_user),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+):
+    try:
+        admin_service = _get_admin_service(service_factory)
+        return await admin_service.get_groups(current_user, q=q, after_id=after_id, limit=limit)
+    except Exception as error:
+        raise _map_admin_error(error) from error
+
+
+@router.get("/groups/export")
+async def export_admin_groups(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$", description="csv или ndjson"),
     q: str | None = Query(None, description="Поиск по названию или описанию группы"),
     current_user: User = Depends(get_current_user),
     service_factory: ServiceFactory = Depends(get_service_factory),
 ):
     try:
         admin_service = _get_admin_service(service_factory)
-        return await admin_service.get_groups(current_user, q=q)
+        await admin_service.ensure_global_admin(current_user)
+        return _export_response(admin_service, "groups", export_format, q=q)
     except Exception as error:
         raise _map_admin_error(error) from error
 
@@ -163,14 +237,37 @@ async def emergency_delete_group(
 ):
     try:
         admin_service = _get_admin_service(service_factory)
-        await admin_service.emergency_delete_group(current_user, group_id)
-        return AdminActionResult(detail="Группа аварийно удалена")
+        job = await admin_service.emergency_delete_group(current_user, group_id)
+        return AdminActionResult(detail="Группа аварийно удаляется", job_id=job.id if job else None)
     except Exception as error:
         raise _map_admin_error(error) from error
 
 
 @router.get("/projects", response_model=list[AdminProjectRead])
 async def get_admin_projects(
+    q: str | None = Query(None, description="Поиск по названию или описанию проекта"),
+    project_status: str | None = Query(None, alias="status", description="Статус проекта"),
+    after_id: int | None = Query(None, description="Вернуть записи с id больше указанного"),
+    limit: int | None = Query(None, ge=1, le=1000, description="Размер страницы"),
+    current_user: User = Depends(get_current_user),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+):
+    try:
+        admin_service = _get_admin_service(service_factory)
+        return await admin_service.get_projects(
+            current_user,
+            q=q,
+            status=project_status,
+            after_id=after_id,
+            limit=limit,
+        )
+    except Exception as error:
+        raise _map_admin_error(error) from error
+
+
+@router.get("/projects/export")
+async def export_admin_projects(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$", description="csv или ndjson"),
     q: str | None = Query(None, description="Поиск по названию или описанию проекта"),
     project_status: str | None = Query(None, alias="status", description="Статус проекта"),
     current_user: User = Depends(get_current_user),
@@ -178,7 +275,8 @@ async def get_admin_projects(
 ):
     try:
         admin_service = _get_admin_service(service_factory)
-        return await admin_service.get_projects(current_user, q=q, status=project_status)
+        await admin_service.ensure_global_admin(current_user)
+        return _export_response(admin_service, "projects", export_format, q=q, status=project_status)
     except Exception as error:
         raise _map_admin_error(error) from error
 
@@ -204,8 +302,8 @@ async def emergency_delete_project(
 ):
     try:
         admin_service = _get_admin_service(service_factory)
-        await admin_service.emergency_delete_project(current_user, project_id)
-        return AdminActionResult(detail="Проект аварийно удалён")
+        job = await admin_service.emergency_delete_project(current_user, project_id)
+        return AdminActionResult(detail="Проект аварийно удаляется", job_id=job.id if job else None)
     except Exception as error:
         raise _map_admin_error(error) from error
 
@@ -324,6 +422,8 @@ async def get_admin_audit(
     offset: int = Query(0, ge=0),
     action: str | None = Query(None, description="Фильтр по действию"),
     target_type: str | None = Query(None, description="Фильтр по типу объекта"),
+    target_id: int | None = Query(None, description="Фильтр по id объекта"),
+    before_id: int | None = Query(None, description="Вернуть события старше события с указанным id"),
     current_user: User = Depends(get_current_user),
     service_factory: ServiceFactory = Depends(get_service_factory),
 ):
@@ -335,6 +435,8 @@ async def get_admin_audit(
             offset=offset,
             action=action,
             target_type=target_type,
+            target_id=target_id,
+            before_id=before_id,
         )
     except Exception as error:
         raise _map_admin_error(error) from error
\ No newline at end of file
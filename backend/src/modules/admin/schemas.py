@@ -18,6 +18,23 @@ class AdminStatsRead(BaseModel):
     tasks_overdue: int
     active_conferences_total: int
     audit_events_total: int
+    # Время подсчёта каждого показателя: снимок может быть взят из кэша
+    computed_at: dict[str, datetime] = Field(default_factory=dict)
+
+
+class AdminMaintenanceJobRead(BaseModel):
+    name: str
+    schedule: str
+    next_run_at: datetime
+    runs: int = 0
+    failures: int = 0
+    total_rows: int = 0
+    average_duration_ms: Optional[float] = None
+    last_started_at: Optional[datetime] = None
+    last_duration_ms: Optional[float] = None
+    last_rows: Optional[int] = None
+    last_status: Optional[str] = None
+    last_error: Optional[str] = None
 
 
 class AdminShortUserRead(BaseModel):
@@ -238,4 +255,5 @@ class AdminAuditLogRead(BaseModel):
 
 
 class AdminActionResult(BaseModel):
-    detail: str
\ No newline at end of file
+    detail: str
+    job_id: Optional[int] = None
\ No newline at end of file
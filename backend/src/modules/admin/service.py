@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import csv
+import io
+import json
 from datetime import datetime, timezone
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Optional, TYPE_CHECKING
 
-from sqlalchemy import delete, func, or_, select
+from sqlalchemy import and_, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -15,6 +18,7 @@ from core.database.models import (
     ConferenceRoom,
     ConferenceRoomType,
     ConferenceStats,
+    DeletionJob,
     Group,
     GroupMember,
     Project,
@@ -25,11 +29,19 @@ from core.database.models import (
     TaskStatus,
     User,
     UserRole,
-    conference_invited_users,
+    project_group_association,
     task_user_association,
 )
+from core.config import settings
+from core.database.session import db_session
 from core.logger import logger
-from core.utils.livekit import livekit_token
+from core.utils.livekit_client import livekit_client
+from modules.analytics import analytics_publisher
+from modules.audit import audit_publisher
+from modules.maintenance import maintenance_runner
+from modules.search import search_match
+from modules.notifications.redis_client import redis_client
+from shared.messaging import AuditMessage
 from .exceptions import AdminActionError, AdminObjectNotFoundError, AdminPermissionError
 from .schemas import (
     AdminActionResult,
@@ -44,6 +56,7 @@ from .schemas import (
     AdminGroupRead,
     AdminGroupDetailRead,
     AdminGroupMemberRead,
+    AdminMaintenanceJobRead,
     AdminProjectRead,
     AdminProjectDetailRead,
     AdminShortGroupRead,
@@ -61,6 +74,10 @@ if TYPE_CHECKING:
     from core.services import ServiceFactory
 
 
+STATS_CACHE_KEY = "admin:stats:snapshot"
+EXPORT_BATCH_SIZE = 1000
+
+
 class AdminService:
     def __init__(self, session: AsyncSession, service_factory: Optional["ServiceFactory"] = None):
         self.session = session
@@ -87,55 +104,93 @@ class AdminService:
         target_type: str,
         target_id: Optional[int] = None,
         details: Optional[dict[str, Any]] = None,
-    ) -> AdminAuditLog:
-        audit_log = AdminAuditLog(
+    ) -> AuditMessage:
+        # Запись уходит в очередь аудита только после коммита действия
+        return audit_publisher.emit(
+            self.session,
             actor_id=actor.id,
             action=action,
-            target_type=target_type,
-            target_id=target_id,
-            details=details or {},
+            resource_type=target_type,
+            resource_id=target_id,
+            details=details,
         )
-        self.session.add(audit_log)
-        return audit_log
 
-    async def get_stats(self, actor: User) -> AdminStatsRead:
+    async def get_stats(self, actor: User, refresh: bool = False) -> AdminStatsRead:
         await self.ensure_global_admin(actor)
-        now = datetime.now(timezone.utc)
 
-        users_total = await self.session.scalar(select(func.count(User.id))) or 0
-        users_blocked = await self.session.scalar(
-            select(func.count(User.id)).where(User.is_blocked.is_(True))
-        ) or 0
-        users_global_admins = await self.session.scalar(
-            select(func.count(User.id)).where(User.system_role == SystemRole.GLOBAL_ADMIN)
-        ) or 0
-        groups_total = await self.session.scalar(select(func.count(Group.id))) or 0
-        projects_total = await self.session.scalar(select(func.count(Project.id))) or 0
-        tasks_total = await self.session.scalar(select(func.count(Task.id))) or 0
-        tasks_overdue = await self.session.scalar(
-            select(func.count(Task.id)).where(
-                Task.deadline.is_not(None),
-                Task.deadline < now,
-                Task.status != TaskStatus.DONE,
-                Task.status != TaskStatus.CANCELLED,
-            )
-        ) or 0
-        active_conferences_total = await self.session.scalar(
-            select(func.count(ConferenceRoom.id)).where(ConferenceRoom.is_active.is_(True))
-        ) or 0
-        audit_events_total = await self.session.scalar(select(func.count(AdminAuditLog.id))) or 0
-
-        return AdminStatsRead(
-            users_total=users_total,
-            users_blocked=users_blocked,
-            users_global_admins=users_global_admins,
-            groups_total=groups_total,
-            projects_total=projects_total,
-            tasks_total=tasks_total,
-            tasks_overdue=tasks_overdue,
-            active_conferences_total=active_conferences_total,
-            audit_events_total=audit_events_total,
+        if not refresh:
+            cached = await redis_client.get_json(STATS_CACHE_KEY)
+            if cached:
+                return AdminStatsRead(**cached)
+
+        stats = await self._compute_stats()
+        await redis_client.set_json(
+            STATS_CACHE_KEY,
+            stats.model_dump(mode="json"),
+            settings.admin.stats_cache_seconds,
         )
+        return stats
+
+    @staticmethod
+    def _text_filter(model, q: str):
+        """Полнотекстовый фильтр по search_vector; запрос без слов ищется подстрокой как раньше."""
+        match = search_match(model.search_vector, q)
+        if match is not None:
+            return match
+
+        pattern = f"%{q.strip()}%"
+        return or_(model.title.ilike(pattern), model.description.ilike(pattern))
+
+    async def get_maintenance_jobs(self, actor: User) -> list[AdminMaintenanceJobRead]:
+        await self.ensure_global_admin(actor)
+        return [AdminMaintenanceJobRead(**job) for job in await maintenance_runner.get_metrics()]
+
+    async def _compute_stats(self) -> AdminStatsRead:
+        now = datetime.now(timezone.utc)
+        is_overdue = and_(
+            Task.deadline.is_not(None),
+            Task.deadline < now,
+            Task.status.not_in([TaskStatus.DONE, TaskStatus.CANCELLED]),
+        )
+
+        # По одному запросу на таблицу; запросы идут параллельно в отдельных сессиях
+        queries = {
+            "users": select(
+                func.count().label("users_total"),
+                func.count().filter(User.is_blocked.is_(True)).label("users_blocked"),
+                func.count().filter(User.system_role == SystemRole.GLOBAL_ADMIN).label("users_global_admins"),
+            ).select_from(User),
+            "groups": select(func.count().label("groups_total")).select_from(Group).where(
+                Group.deleting_at.is_(None)
+            ),
+            "projects": select(func.count().label("projects_total")).select_from(Project).where(
+                Project.deleting_at.is_(None)
+            ),
+            "tasks": select(
+                func.count().label("tasks_total"),
+                func.count().filter(is_overdue).label("tasks_overdue"),
+            ).select_from(Task),
+            "conferences": select(func.count().label("active_conferences_total")).select_from(ConferenceRoom).where(
+                ConferenceRoom.is_active.is_(True)
+            ),
+            "audit": select(func.count().label("audit_events_total")).select_from(AdminAuditLog),
+        }
+
+        async def _run(stmt):
+            async with db_session.session_factory() as session:
+                row = (await session.execute(stmt)).mappings().one()
+            return dict(row), datetime.now(timezone.utc)
+
+        results = await asyncio.gather(*(_run(stmt) for stmt in queries.values()))
+
+        values: dict[str, int] = {}
+        computed_at: dict[str, datetime] = {}
+        for row, finished_at in results:
+            for name, value in row.items():
+                values[name] = value or 0
+                computed_at[name] = finished_at
+
+        return AdminStatsRead(**values, computed_at=computed_at)
 
     async def get_users(
         self,
@@ -143,13 +198,41 @@ class AdminService:
         q: Optional[str] = None,
         blocked: Optional[bool] = None,
         global_admin: Optional[bool] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
     ) -> list[AdminUserRead]:
         await self.ensure_global_admin(actor)
+        return await self._fetch_users_page(
+            self.session,
+            q=q,
+            blocked=blocked,
+            global_admin=global_admin,
+            after_id=after_id,
+            limit=limit,
+        )
 
-        stmt = select(User).options(
-            selectinload(User.group_memberships),
-            selectinload(User.assigned_tasks),
-        ).order_by(User.id)
+    async def _fetch_users_page(
+        self,
+        session: AsyncSession,
+        q: Optional[str] = None,
+        blocked: Optional[bool] = None,
+        global_admin: Optional[bool] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[AdminUserRead]:
+        groups_count = (
+            select(func.count(GroupMember.id))
+            .where(GroupMember.user_id == User.id)
+            .scalar_subquery()
+        )
+        assigned_tasks_count = (
+            select(func.count())
+            .select_from(task_user_association)
+            .where(task_user_association.c.user_id == User.id)
+            .scalar_subquery()
+        )
+
+        stmt = select(User, groups_count, assigned_tasks_count).order_by(User.id)
 
         if q:
             pattern = f"%{q.strip()}%"
@@ -170,10 +253,13 @@ class AdminService:
             else:
                 stmt = stmt.where(User.system_role != SystemRole.GLOBAL_ADMIN)
 
-        result = await self.session.execute(stmt)
-        users = result.scalars().all()
+        stmt = self._apply_keyset(stmt, User.id, after_id, limit)
+        result = await session.execute(stmt)
 
-        return [self._build_admin_user(user) for user in users]
+        return [
+            self._build_admin_user(user, groups_count=users_groups, assigned_tasks_count=users_tasks)
+            for user, users_groups, users_tasks in result.all()
+        ]
 
     async def block_user(self, actor: User, user_id: int, reason: Optional[str] = None) -> AdminUserRead:
         await self.ensure_global_admin(actor)
@@ -253,22 +339,61 @@ class AdminService:
 
         return self._build_admin_user(user)
 
-    async def get_groups(self, actor: User, q: Optional[str] = None) -> list[AdminGroupRead]:
+    async def get_groups(
+        self,
+        actor: User,
+        q: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[AdminGroupRead]:
         await self.ensure_global_admin(actor)
+        return await self._fetch_groups_page(self.session, q=q, after_id=after_id, limit=limit)
 
-        stmt = select(Group).options(
-            selectinload(Group.group_members).selectinload(GroupMember.user),
-            selectinload(Group.projects),
-            selectinload(Group.tasks),
-        ).order_by(Group.id)
+    async def _fetch_groups_page(
+        self,
+        session: AsyncSession,
+        q: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[AdminGroupRead]:
+        users_count = (
+            select(func.count(GroupMember.id))
+            .where(GroupMember.group_id == Group.id)
+            .scalar_subquery()
+        )
+        projects_count = (
+            select(func.count())
+            .select_from(project_group_association)
+            .where(project_group_association.c.group_id == Group.id)
+            .scalar_subquery()
+        )
+        tasks_count = (
+            select(func.count(Task.id))
+            .where(Task.group_id == Group.id)
+            .scalar_subquery()
+        )
+
+        # Из участников загружаются только администраторы — они выводятся в списке
+        stmt = select(Group, users_count, projects_count, tasks_count).options(
+            selectinload(Group.group_members.and_(GroupMember.role == UserRole.ADMIN)).selectinload(GroupMember.user),
+        ).where(Group.deleting_at.is_(None)).order_by(Group.id)
 
         if q:
             pattern = f"%{q.strip()}%"
             stmt = stmt.where(or_(Group.name.ilike(pattern), Group.description.ilike(pattern)))
 
-        result = await self.session.execute(stmt)
-        groups = result.scalars().all()
-        return [self._build_admin_group(group) for group in groups]
+        stmt = self._apply_keyset(stmt, Group.id, after_id, limit)
+        result = await session.execute(stmt)
+
+        return [
+            self._build_admin_group(
+                group,
+                users_count=group_users,
+                projects_count=group_projects,
+                tasks_count=group_tasks,
+            )
+            for group, group_users, group_projects, group_tasks in result.all()
+        ]
 
     async def get_group_detail(self, actor: User, group_id: int) -> AdminGroupDetailRead:
         """Read-only просмотр группы через административный контур."""
@@ -281,24 +406,111 @@ class AdminService:
         actor: User,
         q: Optional[str] = None,
         status: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
     ) -> list[AdminProjectRead]:
         await self.ensure_global_admin(actor)
+        return await self._fetch_projects_page(
+            self.session,
+            q=q,
+            status=status,
+            after_id=after_id,
+            limit=limit,
+        )
 
-        stmt = select(Project).options(
+    async def _fetch_projects_page(
+        self,
+        session: AsyncSession,
+        q: Optional[str] = None,
+        status: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[AdminProjectRead]:
+        tasks_count = (
+            select(func.count(Task.id))
+            .where(Task.project_id == Project.id)
+            .scalar_subquery()
+        )
+
+        stmt = select(Project, tasks_count).options(
             selectinload(Project.groups),
-            selectinload(Project.tasks),
-        ).order_by(Project.id)
+        ).where(Project.deleting_at.is_(None)).order_by(Project.id)
 
         if q:
-            pattern = f"%{q.strip()}%"
-            stmt = stmt.where(or_(Project.title.ilike(pattern), Project.description.ilike(pattern)))
+            stmt = stmt.where(self._text_filter(Project, q))
 
         if status:
             stmt = stmt.where(Project.status == status)
 
-        result = await self.session.execute(stmt)
-        projects = result.scalars().all()
-        return [self._build_admin_project(project) for project in projects]
+        stmt = self._apply_keyset(stmt, Project.id, after_id, limit)
+        result = await session.execute(stmt)
+
+        return [
+            self._build_admin_project(project, tasks_count=project_tasks)
+            for project, project_tasks in result.all()
+        ]
+
+    def _apply_keyset(self, stmt, id_column, after_id: Optional[int], limit: Optional[int]):
+        if after_id is not None:
+            stmt = stmt.where(id_column > after_id)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return stmt
+
+    async def stream_export(self, entity: str, export_format: str, **filters) -> AsyncIterator[str]:
+        """Выгрузка списка в CSV или NDJSON пачками по EXPORT_BATCH_SIZE.
+
+        Работает в собственной сессии: ответ стримится уже после выхода из обработчика запроса.
+        """
+        fetch_page = {
+            "users": self._fetch_users_page,
+            "groups": self._fetch_groups_page,
+            "projects": self._fetch_projects_page,
+        }[entity]
+
+        after_id = None
+        header_written = False
+
+        async with db_session.session_factory() as session:
+            while True:
+                items = await fetch_page(session, after_id=after_id, limit=EXPORT_BATCH_SIZE, **filters)
+                if not items:
+                    break
+
+                rows = [self._build_export_row(item) for item in items]
+
+                if export_format == "ndjson":
+                    yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+                else:
+                    buffer = io.StringIO()
+                    writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+                    if not header_written:
+                        writer.writeheader()
+                        header_written = True
+                    writer.writerows(rows)
+                    yield buffer.getvalue()
+
+                after_id = items[-1].id
+                # Прочитанные объекты больше не нужны: не держим их в identity map
+                session.expunge_all()
+
+                if len(items) < EXPORT_BATCH_SIZE:
+                    break
+
+    def _build_export_row(self, item) -> dict[str, Any]:
+        row = item.model_dump(mode="json")
+
+        for key, value in row.items():
+            if isinstance(value, list):
+                # Вложенные списки (администраторы, группы) сворачиваются в одну ячейку
+                row[key] = "; ".join(
+                    str(entry.get("login") or entry.get("name") or entry.get("id"))
+                    for entry in value
+                )
+
+        return row
 
     async def get_project_detail(self, actor: User, project_id: int) -> AdminProjectDetailRead:
         """Read-only просмотр проекта через административный контур."""
@@ -324,8 +536,7 @@ class AdminService:
         ).order_by(Task.id)
 
         if q:
-            pattern = f"%{q.strip()}%"
-            stmt = stmt.where(or_(Task.title.ilike(pattern), Task.description.ilike(pattern)))
+            stmt = stmt.where(self._text_filter(Task, q))
 
         if status:
             stmt = stmt.where(Task.status == status)
@@ -375,7 +586,7 @@ class AdminService:
         entries = result.scalars().all()
         return [self._build_task_history(entry) for entry in entries]
 
-    async def emergency_delete_group(self, actor: User, group_id: int) -> None:
+    async def emergency_delete_group(self, actor: User, group_id: int) -> Optional[DeletionJob]:
         await self.ensure_global_admin(actor)
 
         group = await self._get_group_for_admin(group_id)
@@ -399,9 +610,9 @@ class AdminService:
             raise AdminActionError("ServiceFactory недоступна для аварийного удаления группы")
 
         group_service = self.service_factory.get("group")
-        await group_service.delete_group_auto(group_id)
+        return await group_service.delete_group_auto(group_id, requested_by_id=actor.id)
 
-    async def emergency_delete_project(self, actor: User, project_id: int) -> None:
+    async def emergency_delete_project(self, actor: User, project_id: int) -> Optional[DeletionJob]:
         await self.ensure_global_admin(actor)
 
         project = await self._get_project_for_admin(project_id)
@@ -424,7 +635,7 @@ class AdminService:
             raise AdminActionError("ServiceFactory недоступна для аварийного удаления проекта")
 
         project_service = self.service_factory.get("project")
-        await project_service.delete_project_auto(project_id)
+        return await project_service.delete_project_auto(project_id, requested_by_id=actor.id)
 
     async def emergency_delete_task(self, actor: User, task_id: int) -> None:
         await self.ensure_global_admin(actor)
@@ -447,27 +658,12 @@ class AdminService:
             details=details,
         )
 
-        try:
-            room_stmt = select(ConferenceRoom.id).where(ConferenceRoom.task_id == task_id)
-            room_result = await self.session.execute(room_stmt)
-            room_ids = [row[0] for row in room_result.all()]
-
-            if room_ids:
-                await self.session.execute(delete(ConferenceStats).where(ConferenceStats.room_id.in_(room_ids)))
-                await self.session.execute(
-                    delete(conference_invited_users).where(conference_invited_users.c.room_id.in_(room_ids))
-                )
-                await self.session.execute(
-                    delete(ConferenceParticipant).where(ConferenceParticipant.room_id.in_(room_ids))
-                )
-                await self.session.execute(delete(ConferenceMessage).where(ConferenceMessage.room_id.in_(room_ids)))
-                await self.session.execute(delete(ConferenceRoom).where(ConferenceRoom.id.in_(room_ids)))
+        if not self.service_factory:
+            raise AdminActionError("ServiceFactory недоступна для аварийного удаления задачи")
 
-            await self.session.execute(delete(TaskHistory).where(TaskHistory.task_id == task_id))
-            await self.session.execute(
-                delete(task_user_association).where(task_user_association.c.task_id == task_id)
-            )
-            await self.session.execute(delete(Task).where(Task.id == task_id))
+        try:
+            task_service = self.service_factory.get("task")
+            await task_service.purge_tasks([task_id])
             await self.session.commit()
         except Exception as exc:
             await self.session.rollback()
@@ -546,6 +742,17 @@ class AdminService:
         )
         self.session.add(stats)
 
+        if duration_seconds is not None:
+            analytics_publisher.emit(
+                self.session,
+                event_type="conference_ended",
+                user_id=actor.id,
+                project_id=room.project_id,
+                group_id=room.group_id,
+                task_id=room.task_id,
+                metadata={"room_id": room.id, "duration_seconds": max(duration_seconds, 0)},
+            )
+
         await self.log_action(
             actor=actor,
             action="CONFERENCE_FORCE_ENDED",
@@ -569,8 +776,7 @@ class AdminService:
 
     async def _delete_livekit_room_async(self, room_name: str) -> None:
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, livekit_token.delete_room, room_name)
+            await livekit_client.delete_room(room_name)
         except Exception as exc:
             self.logger.warning(f"LiveKit room delete failed for {room_name}: {exc}")
 
@@ -581,6 +787,8 @@ class AdminService:
         offset: int = 0,
         action: Optional[str] = None,
         target_type: Optional[str] = None,
+        target_id: Optional[int] = None,
+        before_id: Optional[int] = None,
     ) -> list[AdminAuditLogRead]:
         await self.ensure_global_admin(actor)
 
@@ -597,7 +805,23 @@ class AdminService:
         if target_type:
             stmt = stmt.where(AdminAuditLog.target_type == target_type)
 
-        stmt = stmt.limit(safe_limit).offset(safe_offset)
+        if target_id is not None:
+            stmt = stmt.where(AdminAuditLog.target_id == target_id)
+
+        if before_id is not None:
+            # Курсор — последняя полученная запись; сравнение по (created_at, id) совпадает с порядком выдачи
+            cursor_created_at = (
+                select(AdminAuditLog.created_at)
+                .where(AdminAuditLog.id == before_id)
+                .scalar_subquery()
+            )
+            stmt = stmt.where(
+                tuple_(AdminAuditLog.created_at, AdminAuditLog.id) < tuple_(cursor_created_at, before_id)
+            )
+        else:
+            stmt = stmt.offset(safe_offset)
+
+        stmt = stmt.limit(safe_limit)
         result = await self.session.execute(stmt)
         logs = result.scalars().all()
         return [self._build_audit_log(log) for log in logs]
@@ -648,7 +872,7 @@ class AdminService:
             selectinload(Group.group_members).selectinload(GroupMember.user),
             selectinload(Group.projects),
             selectinload(Group.tasks),
-        ).where(Group.id == group_id)
+        ).where(Group.id == group_id, Group.deleting_at.is_(None))
         result = await self.session.execute(stmt)
         group = result.scalar_one_or_none()
         if not group:
@@ -661,7 +885,7 @@ class AdminService:
             selectinload(Project.groups).selectinload(Group.projects),
             selectinload(Project.groups).selectinload(Group.tasks),
             selectinload(Project.tasks),
-        ).where(Project.id == project_id)
+        ).where(Project.id == project_id, Project.deleting_at.is_(None))
         result = await self.session.execute(stmt)
         project = result.scalar_one_or_none()
         if not project:
@@ -690,7 +914,12 @@ class AdminService:
             is_blocked=user.is_blocked,
         )
 
-    def _build_admin_user(self, user: User) -> AdminUserRead:
+    def _build_admin_user(
+        self,
+        user: User,
+        groups_count: Optional[int] = None,
+        assigned_tasks_count: Optional[int] = None,
+    ) -> AdminUserRead:
         return AdminUserRead(
             id=user.id,
             login=user.login,
@@ -701,8 +930,10 @@ class AdminService:
             blocked_reason=user.blocked_reason,
             created_at=user.created_at,
             updated_at=user.updated_at,
-            groups_count=len(user.group_memberships or []),
-            assigned_tasks_count=len(user.assigned_tasks or []),
+            groups_count=groups_count if groups_count is not None else len(user.group_memberships or []),
+            assigned_tasks_count=(
+                assigned_tasks_count if assigned_tasks_count is not None else len(user.assigned_tasks or [])
+            ),
         )
 
     def _build_short_group(self, group: Group) -> AdminShortGroupRead:
@@ -712,7 +943,13 @@ class AdminService:
             description=group.description,
         )
 
-    def _build_admin_group(self, group: Group) -> AdminGroupRead:
+    def _build_admin_group(
+        self,
+        group: Group,
+        users_count: Optional[int] = None,
+        projects_count: Optional[int] = None,
+        tasks_count: Optional[int] = None,
+    ) -> AdminGroupRead:
         admins = [
             self._build_short_user(member.user)
             for member in group.group_members
@@ -724,9 +961,9 @@ class AdminService:
             name=group.name,
             description=group.description,
             created_at=group.created_at,
-            users_count=len(group.group_members or []),
-            projects_count=len(group.projects or []),
-            tasks_count=len(group.tasks or []),
+            users_count=users_count if users_count is not None else len(group.group_members or []),
+            projects_count=projects_count if projects_count is not None else len(group.projects or []),
+            tasks_count=tasks_count if tasks_count is not None else len(group.tasks or []),
             admins=admins,
         )
 
@@ -784,7 +1021,7 @@ class AdminService:
             status=project.status,
         )
 
-    def _build_admin_project(self, project: Project) -> AdminProjectRead:
+    def _build_admin_project(self, project: Project, tasks_count: Optional[int] = None) -> AdminProjectRead:
         return AdminProjectRead(
             id=project.id,
             title=project.title,
@@ -793,7 +1030,7 @@ class AdminService:
             start_date=project.start_date,
             end_date=project.end_date,
             groups=[self._build_short_group(group) for group in project.groups],
-            tasks_count=len(project.tasks or []),
+            tasks_count=tasks_count if tasks_count is not None else len(project.tasks or []),
         )
 
     def _build_admin_project_detail(self, project: Project) -> AdminProjectDetailRead:
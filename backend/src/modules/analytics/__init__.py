@@ -0,0 +1,11 @@
+from .publisher import AnalyticsPublisher, analytics_publisher
+from .consumer import AnalyticsConsumer
+from .writer import AnalyticsRollupWriter, analytics_rollup_writer
+
+__all__ = [
+    'AnalyticsPublisher',
+    'analytics_publisher',
+    'AnalyticsConsumer',
+    'AnalyticsRollupWriter',
+    'analytics_rollup_writer',
+]
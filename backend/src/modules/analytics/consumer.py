@@ -0,0 +1,26 @@
+from typing import Any, Dict
+
+import aio_pika
+
+from shared.messaging import AnalyticsMessage, BaseConsumer, MessageType
+from shared.messaging.module import MessagingModule
+from modules.notifications.redis_client import redis_client
+from .writer import analytics_rollup_writer
+
+
+class AnalyticsConsumer(BaseConsumer):
+    def __init__(self, messaging_module: MessagingModule, prefetch_count: int):
+        # Широкое окно prefetch позволяет схлопнуть в одну запись много событий одного дня
+        super().__init__(messaging_module, redis_client, prefetch_count=prefetch_count)
+
+    async def handle_message(self, body: Dict[str, Any], message: aio_pika.IncomingMessage) -> bool:
+        if body.get("type") != MessageType.ANALYTICS:
+            self.logger.warning(f"Unknown message type in analytics queue: {body.get('type')}")
+            return True
+
+        try:
+            await analytics_rollup_writer.write(AnalyticsMessage(**body))
+            return True
+        except Exception as e:
+            self.logger.error(f"Error aggregating analytics message {message.message_id}: {e}", exc_info=True)
+            return False
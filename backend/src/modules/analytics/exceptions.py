@@ -0,0 +1,18 @@
+from fastapi import HTTPException, status
+from typing import Optional
+
+class AnalyticsException(HTTPException):
+    def __init__(self, status_code: int, detail: str, headers: Optional[dict] = None):
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
+
+class AnalyticsAccessDeniedError(AnalyticsException):
+    def __init__(self, detail: str = "Нет доступа к аналитике"):
+        super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+class AnalyticsPeriodError(AnalyticsException):
+    def __init__(self, detail: str = "Некорректный период"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+class AnalyticsNotFoundError(AnalyticsException):
+    def __init__(self, detail: str = "Данные аналитики не найдены"):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
@@ -0,0 +1,291 @@
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import Float, case, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from core.config import settings
+from core.database.models import AnalyticsCheckpoint, Task, TaskFlowMetrics, TaskHistory, TaskStatus
+from core.database.session import db_session
+from core.logger import logger
+
+FLOW_CHECKPOINT = "task_flow"
+FLOW_ACTIONS = ("task_created", "status_changed")
+STATUS_SECONDS_COLUMNS = {status.value: f"{status.value}_seconds" for status in TaskStatus}
+# Задача считается начатой, как только покинула очередь (BACKLOG/TODO)
+STARTED_STATUSES = {TaskStatus.IN_PROGRESS.value, TaskStatus.REVIEW.value, TaskStatus.DONE.value}
+FLOW_PERCENTILES = (50, 85, 95)
+
+METRICS_COLUMNS = (
+    "task_id",
+    "project_id",
+    "created_at",
+    "first_started_at",
+    "completed_at",
+    "reopened_count",
+    "current_status",
+    "status_since",
+    *STATUS_SECONDS_COLUMNS.values(),
+)
+
+
+def apply_history_entry(
+    metrics: Dict[str, Any],
+    action: str,
+    old_value: Optional[str],
+    new_value: Optional[str],
+    at: datetime,
+) -> None:
+    """Применяет запись task_history к сводке задачи; записи должны приходить в порядке id."""
+    if action == "task_created":
+        metrics["created_at"] = at
+        return
+
+    since = metrics["status_since"] or metrics["created_at"]
+    column = STATUS_SECONDS_COLUMNS.get(old_value)
+    if column and since:
+        metrics[column] += max((at - since).total_seconds(), 0)
+
+    if metrics["first_started_at"] is None:
+        if old_value in STARTED_STATUSES:
+            # Задача была создана уже в работе
+            metrics["first_started_at"] = since
+        elif new_value in STARTED_STATUSES:
+            metrics["first_started_at"] = at
+
+    if new_value == TaskStatus.DONE.value:
+        metrics["completed_at"] = at
+    elif old_value == TaskStatus.DONE.value:
+        metrics["completed_at"] = None
+        metrics["reopened_count"] += 1
+
+    metrics["current_status"] = new_value
+    metrics["status_since"] = at
+
+
+def _percentiles(values: np.ndarray) -> Dict[str, Any]:
+    if values.size == 0:
+        return {"count": 0, "mean": None, **{f"p{p}": None for p in FLOW_PERCENTILES}}
+
+    points = np.percentile(values, FLOW_PERCENTILES)
+    return {
+        "count": int(values.size),
+        "mean": round(float(values.mean()), 2),
+        **{f"p{p}": round(float(point), 2) for p, point in zip(FLOW_PERCENTILES, points)},
+    }
+
+
+STATUS_CODES = {status: code for code, status in enumerate(STATUS_SECONDS_COLUMNS)}
+# Терминальные статусы не копят время: иначе среднее «время в DONE» росло бы бесконечно
+TERMINAL_STATUSES = {TaskStatus.DONE.value, TaskStatus.CANCELLED.value}
+OPEN_STATUS_CODES = [code for status, code in STATUS_CODES.items() if status not in TERMINAL_STATUSES]
+
+
+def _epoch(column):
+    return func.coalesce(cast(func.extract("epoch", column), Float), literal_column("'NaN'::float8"))
+
+
+def project_flow_columns_stmt(project_id: int):
+    """Сводки задач проекта сразу числовой матрицей: время — секунды эпохи (NaN вместо NULL), статус — код."""
+    return select(
+        _epoch(TaskFlowMetrics.created_at),
+        _epoch(TaskFlowMetrics.first_started_at),
+        _epoch(TaskFlowMetrics.completed_at),
+        _epoch(TaskFlowMetrics.status_since),
+        case(STATUS_CODES, value=TaskFlowMetrics.current_status, else_=-1),
+        *[getattr(TaskFlowMetrics, column) for column in STATUS_SECONDS_COLUMNS.values()],
+    ).where(TaskFlowMetrics.project_id == project_id)
+
+
+def summarize_project_flow(
+    rows: Sequence[Sequence[float]],
+    date_from: date,
+    date_to: date,
+    now: datetime,
+) -> Dict[str, Any]:
+    """Перцентили lead/cycle time, среднее время в статусах и ряд burnup/burndown по дням.
+
+    rows — результат project_flow_columns_stmt.
+    """
+    matrix = np.array(rows, dtype=np.float64).reshape(len(rows), 5 + len(STATUS_SECONDS_COLUMNS))
+    created, started, completed, since, current = matrix[:, :5].T
+    status_seconds = matrix[:, 5:].T.copy()
+
+    # Текущий статус продолжается до сих пор: добавляем незакрытый отрезок
+    now_ts = now.timestamp()
+    for code in OPEN_STATUS_CODES:
+        mask = (current == code) & ~np.isnan(since)
+        status_seconds[code, mask] += np.maximum(now_ts - since[mask], 0)
+
+    in_scope = current != STATUS_CODES[TaskStatus.CANCELLED.value]
+    is_done = ~np.isnan(completed)
+
+    period_start = datetime.combine(date_from, time.min, tzinfo=timezone.utc).timestamp()
+    period_end = datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=timezone.utc).timestamp()
+    completed_in_period = is_done & (completed >= period_start) & (completed < period_end)
+
+    lead_hours = (completed - created)[completed_in_period] / 3600
+    cycle_mask = completed_in_period & ~np.isnan(started)
+    cycle_hours = (completed - started)[cycle_mask] / 3600
+
+    days = [date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1)]
+    day_ends = np.array(
+        [datetime.combine(day + timedelta(days=1), time.min, tzinfo=timezone.utc).timestamp() for day in days],
+        dtype=np.float64,
+    )
+    scope = np.searchsorted(np.sort(created[in_scope]), day_ends, side="left")
+    done = np.searchsorted(np.sort(completed[in_scope & is_done]), day_ends, side="left")
+
+    time_in_status = {}
+    for status, code in STATUS_CODES.items():
+        visited = status_seconds[code][status_seconds[code] > 0]
+        time_in_status[status] = round(float(visited.mean()) / 3600, 2) if visited.size else 0.0
+
+    return {
+        "tasks_total": int(in_scope.sum()),
+        "tasks_done": int((in_scope & is_done).sum()),
+        "tasks_open": int((in_scope & ~is_done).sum()),
+        "lead_time_hours": _percentiles(lead_hours),
+        "cycle_time_hours": _percentiles(cycle_hours),
+        "time_in_status_hours": time_in_status,
+        "burn": [
+            {"day": day, "scope": int(day_scope), "completed": int(day_done), "remaining": int(day_scope - day_done)}
+            for day, day_scope, day_done in zip(days, scope.tolist(), done.tolist())
+        ],
+    }
+
+
+class TaskFlowEngine:
+    """Инкрементально сворачивает task_history в task_flow_metrics, продвигая чекпоинт по id записи.
+
+    Чекпоинт блокируется FOR UPDATE, поэтому пакет обрабатывает только один воркер. Пакет обрывается
+    перед первой неустоявшейся записью, чтобы чекпоинт не перескочил через неё.
+    """
+
+    def __init__(self, interval_seconds: float, batch_size: int, settle_seconds: int):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        # Свежие записи откладываются: транзакция с меньшим id может закоммититься позже
+        self.settle_after = timedelta(seconds=settle_seconds)
+        self.logger = logger
+        self._task: Optional[asyncio.Task] = None
+
+    async def process_batch(self) -> int:
+        async with db_session.session_factory() as session:
+            await session.execute(
+                pg_insert(AnalyticsCheckpoint)
+                .values(name=FLOW_CHECKPOINT, last_id=0)
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+            checkpoint = (await session.execute(
+                select(AnalyticsCheckpoint)
+                .where(AnalyticsCheckpoint.name == FLOW_CHECKPOINT)
+                .with_for_update()
+            )).scalar_one()
+
+            first_unsettled_id = (await session.execute(
+                select(func.min(TaskHistory.id))
+                .where(
+                    TaskHistory.id > checkpoint.last_id,
+                    TaskHistory.action.in_(FLOW_ACTIONS),
+                    TaskHistory.created_at > func.now() - self.settle_after,
+                )
+            )).scalar()
+            in_range = [TaskHistory.id > checkpoint.last_id]
+            if first_unsettled_id is not None:
+                in_range.append(TaskHistory.id < first_unsettled_id)
+
+            history = (await session.execute(
+                select(
+                    TaskHistory.id,
+                    TaskHistory.task_id,
+                    TaskHistory.action,
+                    TaskHistory.old_value,
+                    TaskHistory.new_value,
+                    TaskHistory.created_at,
+                    Task.project_id,
+                    Task.created_at,
+                )
+                .join(Task, Task.id == TaskHistory.task_id)
+                .where(*in_range, TaskHistory.action.in_(FLOW_ACTIONS))
+                .order_by(TaskHistory.id)
+                .limit(self.batch_size)
+            )).all()
+
+            if not history:
+                await session.commit()
+                return 0
+
+            task_ids = {row.task_id for row in history}
+            existing = (await session.execute(
+                select(*[getattr(TaskFlowMetrics, column) for column in METRICS_COLUMNS])
+                .where(TaskFlowMetrics.task_id.in_(task_ids))
+            )).all()
+            metrics_by_task: Dict[int, Dict[str, Any]] = {row.task_id: dict(row._mapping) for row in existing}
+
+            for history_id, task_id, action, old_value, new_value, at, project_id, task_created_at in history:
+                metrics = metrics_by_task.get(task_id)
+                if metrics is None:
+                    metrics = metrics_by_task[task_id] = {
+                        "task_id": task_id,
+                        "project_id": project_id,
+                        "created_at": task_created_at,
+                        "first_started_at": None,
+                        "completed_at": None,
+                        "reopened_count": 0,
+                        "current_status": None,
+                        "status_since": None,
+                        **{column: 0.0 for column in STATUS_SECONDS_COLUMNS.values()},
+                    }
+                metrics["project_id"] = project_id
+                apply_history_entry(metrics, action, old_value, new_value, at)
+
+            rows = [metrics_by_task[task_id] for task_id in sorted(metrics_by_task)]
+            stmt = pg_insert(TaskFlowMetrics).values(rows)
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["task_id"],
+                    set_={column: stmt.excluded[column] for column in METRICS_COLUMNS if column != "task_id"},
+                )
+            )
+
+            checkpoint.last_id = history[-1].id
+            checkpoint.updated_at = datetime.now(timezone.utc)
+            await session.commit()
+
+        self.logger.debug(f"Task flow processed {len(history)} history rows up to id {history[-1].id}")
+        return len(history)
+
+    async def catch_up(self) -> int:
+        processed = 0
+        while True:
+            batch = await self.process_batch()
+            processed += batch
+            if batch < self.batch_size:
+                return processed
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.catch_up()
+            except Exception as e:
+                self.logger.error(f"Error processing task flow history: {e}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
+
+
+task_flow_engine = TaskFlowEngine(
+    interval_seconds=settings.analytics.flow_interval_seconds,
+    batch_size=settings.analytics.flow_batch_size,
+    settle_seconds=settings.analytics.flow_settle_seconds,
+)
@@ -0,0 +1,39 @@
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.messaging import AnalyticsMessage, OutboxPublisher
+from .writer import analytics_rollup_writer
+
+
+class AnalyticsPublisher(OutboxPublisher[AnalyticsMessage]):
+    """Отправляет события аналитики в очередь после коммита транзакции, в которой они произошли.
+
+    Без RabbitMQ события передаются писателю агрегатов в этом же процессе.
+    """
+
+    def __init__(self):
+        super().__init__("analytics_messages", analytics_rollup_writer.add)
+
+    def emit(
+        self,
+        session: AsyncSession,
+        *,
+        event_type: str,
+        user_id: int,
+        project_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        task_id: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> AnalyticsMessage:
+        return self.stage(session, AnalyticsMessage(
+            event_type=event_type,
+            user_id=user_id,
+            project_id=project_id,
+            group_id=group_id,
+            task_id=task_id,
+            metadata=metadata or {},
+        ))
+
+
+analytics_publisher = AnalyticsPublisher()
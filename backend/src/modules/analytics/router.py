@@ -0,0 +1,88 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from core.database.models import User
+from core.services import ServiceFactory
+from core.logger import logger
+from modules.auth.dependencies import get_current_user
+from shared.dependencies import get_service_factory
+from .exceptions import AnalyticsException
+from .schemas import AnalyticsRollupRead, ProjectFlowRead, TaskFlowRead
+
+router = APIRouter(dependencies=[Depends(get_current_user)])
+
+
+# Дневные показатели проекта из агрегатов аналитики
+@router.get("/projects/{project_id}/daily", response_model=AnalyticsRollupRead)
+async def get_project_daily_analytics(
+    project_id: int,
+    date_from: Optional[date] = Query(None, description="Начало периода, по умолчанию — 30 дней назад"),
+    date_to: Optional[date] = Query(None, description="Конец периода, по умолчанию — сегодня (UTC)"),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+):
+    logger.info(f"GET /analytics/projects/{project_id}/daily by user {current_user.id}")
+    analytics_service = service_factory.get('analytics')
+
+    try:
+        return await analytics_service.get_project_rollups(project_id, current_user, date_from, date_to)
+    except AnalyticsException as e:
+        logger.error(f"Error getting analytics for project {project_id}: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+# Дневные показатели группы из агрегатов аналитики
+@router.get("/groups/{group_id}/daily", response_model=AnalyticsRollupRead)
+async def get_group_daily_analytics(
+    group_id: int,
+    date_from: Optional[date] = Query(None, description="Начало периода, по умолчанию — 30 дней назад"),
+    date_to: Optional[date] = Query(None, description="Конец периода, по умолчанию — сегодня (UTC)"),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+):
+    logger.info(f"GET /analytics/groups/{group_id}/daily by user {current_user.id}")
+    analytics_service = service_factory.get('analytics')
+
+    try:
+        return await analytics_service.get_group_rollups(group_id, current_user, date_from, date_to)
+    except AnalyticsException as e:
+        logger.error(f"Error getting analytics for group {group_id}: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+# Lead/cycle time, время в статусах и burnup/burndown проекта по сводкам task_history
+@router.get("/projects/{project_id}/flow", response_model=ProjectFlowRead)
+async def get_project_flow_analytics(
+    project_id: int,
+    date_from: Optional[date] = Query(None, description="Начало периода, по умолчанию — 30 дней назад"),
+    date_to: Optional[date] = Query(None, description="Конец периода, по умолчанию — сегодня (UTC)"),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+):
+    logger.info(f"GET /analytics/projects/{project_id}/flow by user {current_user.id}")
+    analytics_service = service_factory.get('analytics')
+
+    try:
+        return await analytics_service.get_project_flow(project_id, current_user, date_from, date_to)
+    except AnalyticsException as e:
+        logger.error(f"Error getting flow analytics for project {project_id}: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+# Lead/cycle time и время в статусах одной задачи
+@router.get("/tasks/{task_id}/flow", response_model=TaskFlowRead)
+async def get_task_flow_analytics(
+    task_id: int,
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+):
+    logger.info(f"GET /analytics/tasks/{task_id}/flow by user {current_user.id}")
+    analytics_service = service_factory.get('analytics')
+
+    try:
+        return await analytics_service.get_task_flow(task_id, current_user)
+    except AnalyticsException as e:
+        logger.error(f"Error getting flow analytics for task {task_id}: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
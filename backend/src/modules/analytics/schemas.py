@@ -0,0 +1,68 @@
+from pydantic import BaseModel
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+
+class AnalyticsCountersRead(BaseModel):
+    tasks_created: int = 0
+    tasks_completed: int = 0
+    tasks_reopened: int = 0
+    average_cycle_time_hours: Optional[float] = None
+    comments_created: int = 0
+    meetings_count: int = 0
+    meeting_minutes: float = 0
+
+
+class AnalyticsDayRead(AnalyticsCountersRead):
+    day: date
+
+
+class AnalyticsRollupRead(BaseModel):
+    scope_type: str
+    scope_id: int
+    date_from: date
+    date_to: date
+    totals: AnalyticsCountersRead
+    days: List[AnalyticsDayRead]
+
+
+class FlowPercentilesRead(BaseModel):
+    count: int = 0
+    mean: Optional[float] = None
+    p50: Optional[float] = None
+    p85: Optional[float] = None
+    p95: Optional[float] = None
+
+
+class BurnPointRead(BaseModel):
+    day: date
+    scope: int
+    completed: int
+    remaining: int
+
+
+class ProjectFlowRead(BaseModel):
+    project_id: int
+    date_from: date
+    date_to: date
+    tasks_total: int
+    tasks_open: int
+    tasks_done: int
+    lead_time_hours: FlowPercentilesRead
+    cycle_time_hours: FlowPercentilesRead
+    time_in_status_hours: Dict[str, float]
+    burn: List[BurnPointRead]
+    processed_history_id: int
+
+
+class TaskFlowRead(BaseModel):
+    task_id: int
+    project_id: int
+    created_at: datetime
+    first_started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    reopened_count: int = 0
+    current_status: Optional[str] = None
+    lead_time_hours: Optional[float] = None
+    cycle_time_hours: Optional[float] = None
+    time_in_status_hours: Dict[str, float]
@@ -0,0 +1,194 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional, TYPE_CHECKING
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.database.models import AnalyticsCheckpoint, AnalyticsDailyRollup, TaskFlowMetrics, User
+from core.logger import logger
+from shared.dependencies import check_user_in_group, check_user_in_project, is_global_admin_user
+from .exceptions import AnalyticsAccessDeniedError, AnalyticsNotFoundError, AnalyticsPeriodError
+from .flow import (
+    FLOW_CHECKPOINT,
+    STATUS_SECONDS_COLUMNS,
+    TERMINAL_STATUSES,
+    project_flow_columns_stmt,
+    summarize_project_flow,
+)
+from .schemas import (
+    AnalyticsCountersRead,
+    AnalyticsDayRead,
+    AnalyticsRollupRead,
+    ProjectFlowRead,
+    TaskFlowRead,
+)
+
+if TYPE_CHECKING:
+    from core.services import ServiceFactory
+
+
+class AnalyticsService:
+    """Отчёты по дневным агрегатам; таблицы задач, комментариев и созвонов не читаются."""
+
+    def __init__(self, session: AsyncSession, service_factory: Optional['ServiceFactory'] = None):
+        self.session = session
+        self.logger = logger
+        self.service_factory = service_factory
+
+    async def _ensure_project_access(self, project_id: int, current_user: User) -> None:
+        if not is_global_admin_user(current_user) and not await check_user_in_project(
+            self.session, current_user.id, project_id
+        ):
+            raise AnalyticsAccessDeniedError("Нет доступа к аналитике проекта")
+
+    async def get_project_rollups(
+        self,
+        project_id: int,
+        current_user: User,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> AnalyticsRollupRead:
+        await self._ensure_project_access(project_id, current_user)
+        return await self._get_rollups("project", project_id, date_from, date_to)
+
+    async def get_group_rollups(
+        self,
+        group_id: int,
+        current_user: User,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> AnalyticsRollupRead:
+        if not is_global_admin_user(current_user) and not await check_user_in_group(
+            self.session, current_user.id, group_id
+        ):
+            raise AnalyticsAccessDeniedError("Нет доступа к аналитике группы")
+
+        return await self._get_rollups("group", group_id, date_from, date_to)
+
+    async def get_project_flow(
+        self,
+        project_id: int,
+        current_user: User,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> ProjectFlowRead:
+        await self._ensure_project_access(project_id, current_user)
+        date_from, date_to = self._resolve_period(date_from, date_to)
+
+        # Одна строка на задачу проекта вместо истории её переходов
+        rows = (await self.session.execute(project_flow_columns_stmt(project_id))).all()
+
+        checkpoint_stmt = select(AnalyticsCheckpoint.last_id).where(AnalyticsCheckpoint.name == FLOW_CHECKPOINT)
+        processed_history_id = (await self.session.execute(checkpoint_stmt)).scalar_one_or_none() or 0
+
+        return ProjectFlowRead(
+            project_id=project_id,
+            date_from=date_from,
+            date_to=date_to,
+            processed_history_id=processed_history_id,
+            **summarize_project_flow(rows, date_from, date_to, datetime.now(timezone.utc)),
+        )
+
+    async def get_task_flow(self, task_id: int, current_user: User) -> TaskFlowRead:
+        metrics = await self.session.get(TaskFlowMetrics, task_id)
+        if not metrics:
+            raise AnalyticsNotFoundError("История задачи ещё не обработана")
+
+        await self._ensure_project_access(metrics.project_id, current_user)
+
+        now = datetime.now(timezone.utc)
+        time_in_status = {}
+        for status, column in STATUS_SECONDS_COLUMNS.items():
+            seconds = getattr(metrics, column)
+            if metrics.current_status == status and metrics.status_since and status not in TERMINAL_STATUSES:
+                seconds += max((now - metrics.status_since).total_seconds(), 0)
+            time_in_status[status] = round(seconds / 3600, 2)
+
+        lead_time_hours = None
+        cycle_time_hours = None
+        if metrics.completed_at:
+            lead_time_hours = round((metrics.completed_at - metrics.created_at).total_seconds() / 3600, 2)
+            if metrics.first_started_at:
+                cycle_time_hours = round(
+                    (metrics.completed_at - metrics.first_started_at).total_seconds() / 3600, 2
+                )
+
+        return TaskFlowRead(
+            task_id=metrics.task_id,
+            project_id=metrics.project_id,
+            created_at=metrics.created_at,
+            first_started_at=metrics.first_started_at,
+            completed_at=metrics.completed_at,
+            reopened_count=metrics.reopened_count,
+            current_status=metrics.current_status,
+            lead_time_hours=lead_time_hours,
+            cycle_time_hours=cycle_time_hours,
+            time_in_status_hours=time_in_status,
+        )
+
+    def _resolve_period(self, date_from: Optional[date], date_to: Optional[date]) -> tuple[date, date]:
+        date_to = date_to or datetime.now(timezone.utc).date()
+        date_from = date_from or date_to - timedelta(days=settings.analytics.default_period_days - 1)
+
+        if date_from > date_to:
+            raise AnalyticsPeriodError("Начало периода позже его конца")
+
+        if (date_to - date_from).days + 1 > settings.analytics.max_period_days:
+            raise AnalyticsPeriodError(
+                f"Период не может быть длиннее {settings.analytics.max_period_days} дней"
+            )
+
+        return date_from, date_to
+
+    async def _get_rollups(
+        self,
+        scope_type: str,
+        scope_id: int,
+        date_from: Optional[date],
+        date_to: Optional[date],
+    ) -> AnalyticsRollupRead:
+        date_from, date_to = self._resolve_period(date_from, date_to)
+
+        stmt = select(AnalyticsDailyRollup).where(
+            AnalyticsDailyRollup.scope_type == scope_type,
+            AnalyticsDailyRollup.scope_id == scope_id,
+            AnalyticsDailyRollup.day >= date_from,
+            AnalyticsDailyRollup.day <= date_to,
+        )
+        result = await self.session.execute(stmt)
+        rollups: Dict[date, AnalyticsDailyRollup] = {rollup.day: rollup for rollup in result.scalars().all()}
+
+        # Дни без событий заполняются нулями, чтобы ряд можно было сразу рисовать
+        days = []
+        day = date_from
+        while day <= date_to:
+            rollup = rollups.get(day)
+            days.append(AnalyticsDayRead(day=day, **self._counters([rollup] if rollup else [])))
+            day += timedelta(days=1)
+
+        return AnalyticsRollupRead(
+            scope_type=scope_type,
+            scope_id=scope_id,
+            date_from=date_from,
+            date_to=date_to,
+            totals=AnalyticsCountersRead(**self._counters(rollups.values())),
+            days=days,
+        )
+
+    def _counters(self, rollups: Iterable[AnalyticsDailyRollup]) -> dict:
+        rollups = list(rollups)
+        cycle_time_seconds_total = sum(rollup.cycle_time_seconds_total for rollup in rollups)
+        cycle_time_samples = sum(rollup.cycle_time_samples for rollup in rollups)
+
+        return {
+            "tasks_created": sum(rollup.tasks_created for rollup in rollups),
+            "tasks_completed": sum(rollup.tasks_completed for rollup in rollups),
+            "tasks_reopened": sum(rollup.tasks_reopened for rollup in rollups),
+            "average_cycle_time_hours": (
+                round(cycle_time_seconds_total / cycle_time_samples / 3600, 2) if cycle_time_samples else None
+            ),
+            "comments_created": sum(rollup.comments_created for rollup in rollups),
+            "meetings_count": sum(rollup.meetings_count for rollup in rollups),
+            "meeting_minutes": round(sum(rollup.meeting_minutes for rollup in rollups), 1),
+        }
@@ -0,0 +1,170 @@
+import asyncio
+from datetime import date, timezone
+from typing import Dict, List, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from core.config import settings
+from core.database.models import AnalyticsDailyRollup
+from core.database.session import db_session
+from shared.messaging import AnalyticsMessage, BaseBatchWriter
+
+RollupKey = Tuple[str, int, date]
+
+ROLLUP_COUNTERS = (
+    "tasks_created",
+    "tasks_completed",
+    "tasks_reopened",
+    "cycle_time_seconds_total",
+    "cycle_time_samples",
+    "comments_created",
+    "meetings_count",
+    "meeting_minutes",
+)
+
+
+def _event_increments(message: AnalyticsMessage) -> Dict[str, float]:
+    metadata = message.metadata or {}
+
+    if message.event_type == "task_created":
+        return {"tasks_created": 1}
+
+    if message.event_type == "task_completed":
+        increments = {"tasks_completed": 1}
+        cycle_time_seconds = metadata.get("cycle_time_seconds")
+        if cycle_time_seconds is not None:
+            increments["cycle_time_seconds_total"] = float(cycle_time_seconds)
+            increments["cycle_time_samples"] = 1
+        return increments
+
+    if message.event_type == "task_reopened":
+        return {"tasks_reopened": 1}
+
+    if message.event_type == "comment_created":
+        return {"comments_created": 1}
+
+    if message.event_type == "conference_ended":
+        return {
+            "meetings_count": 1,
+            "meeting_minutes": float(metadata.get("duration_seconds") or 0) / 60,
+        }
+
+    return {}
+
+
+def _merge_counters(target: Dict[str, float], increments: Dict[str, float]) -> None:
+    for column, value in increments.items():
+        target[column] = target.get(column, 0) + value
+
+
+def _event_keys(message: AnalyticsMessage) -> List[RollupKey]:
+    created_at = message.created_at
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc)
+    day = created_at.date()
+
+    keys = []
+    if message.project_id is not None:
+        keys.append(("project", message.project_id, day))
+    if message.group_id is not None:
+        keys.append(("group", message.group_id, day))
+    return keys
+
+
+class AnalyticsRollupWriter(BaseBatchWriter):
+    """Складывает события аналитики в дневные счётчики в памяти и пополняет analytics_daily_rollups upsert'ом."""
+
+    description = "analytics rollups"
+
+    def __init__(self, batch_size: int, flush_interval_seconds: float):
+        super().__init__(batch_size, flush_interval_seconds)
+        # События из очереди и события, переданные в обход RabbitMQ, копятся раздельно:
+        # при ошибке записи первые остаются в DLQ очереди, а вторые нужно вернуть в буфер
+        self._queued_rollups: Dict[RollupKey, Dict[str, float]] = {}
+        self._local_rollups: Dict[RollupKey, Dict[str, float]] = {}
+        # Консьюмер подтверждает сообщение только после записи пачки, в которую оно попало
+        self._waiters: List[asyncio.Future] = []
+        self._pending_events = 0
+
+    @property
+    def pending_count(self) -> int:
+        return self._pending_events
+
+    def add(self, message: AnalyticsMessage) -> None:
+        self._accumulate(self._local_rollups, message)
+
+    async def write(self, message: AnalyticsMessage) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._accumulate(self._queued_rollups, message)
+        self._waiters.append(future)
+        await future
+
+    def _accumulate(self, target: Dict[RollupKey, Dict[str, float]], message: AnalyticsMessage) -> None:
+        increments = _event_increments(message)
+        for key in _event_keys(message) if increments else []:
+            _merge_counters(target.setdefault(key, {}), increments)
+
+        self._pending_events += 1
+        self._mark_pending()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            queued, self._queued_rollups = self._queued_rollups, {}
+            local, self._local_rollups = self._local_rollups, {}
+            waiters, self._waiters = self._waiters, []
+            self._pending_events = 0
+
+            rollups: Dict[RollupKey, Dict[str, float]] = {}
+            for source in (queued, local):
+                for key, counters in source.items():
+                    _merge_counters(rollups.setdefault(key, {}), counters)
+
+            try:
+                if rollups:
+                    await self._upsert(rollups)
+            except Exception as e:
+                for key, counters in local.items():
+                    _merge_counters(self._local_rollups.setdefault(key, {}), counters)
+                for future in waiters:
+                    if not future.done():
+                        future.set_exception(e)
+                raise
+
+            for future in waiters:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _upsert(self, rollups: Dict[RollupKey, Dict[str, float]]) -> None:
+        rows = [
+            {
+                "scope_type": scope_type,
+                "scope_id": scope_id,
+                "day": day,
+                **{column: counters.get(column, 0) for column in ROLLUP_COUNTERS},
+            }
+            # Постоянный порядок строк исключает взаимные блокировки между воркерами
+            for (scope_type, scope_id, day), counters in sorted(rollups.items())
+        ]
+
+        table = AnalyticsDailyRollup.__table__
+        stmt = pg_insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_analytics_daily_rollup",
+            set_={
+                **{column: table.c[column] + stmt.excluded[column] for column in ROLLUP_COUNTERS},
+                "updated_at": func.now(),
+            },
+        )
+
+        async with db_session.session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+        self.logger.debug(f"Upserted {len(rows)} analytics rollup rows")
+
+
+analytics_rollup_writer = AnalyticsRollupWriter(
+    batch_size=settings.analytics.batch_size,
+    flush_interval_seconds=settings.analytics.flush_interval_seconds,
+)
@@ -0,0 +1,11 @@
+from .publisher import AuditPublisher, audit_publisher
+from .consumer import AuditConsumer
+from .writer import AuditLogWriter, audit_log_writer
+
+__all__ = [
+    'AuditPublisher',
+    'audit_publisher',
+    'AuditConsumer',
+    'AuditLogWriter',
+    'audit_log_writer',
+]
@@ -0,0 +1,26 @@
+from typing import Any, Dict
+
+import aio_pika
+
+from shared.messaging import AuditMessage, BaseConsumer, MessageType
+from shared.messaging.module import MessagingModule
+from modules.notifications.redis_client import redis_client
+from .writer import audit_log_writer
+
+
+class AuditConsumer(BaseConsumer):
+    def __init__(self, messaging_module: MessagingModule, prefetch_count: int):
+        # Широкое окно prefetch даёт писателю набрать полную пачку для COPY
+        super().__init__(messaging_module, redis_client, prefetch_count=prefetch_count)
+
+    async def handle_message(self, body: Dict[str, Any], message: aio_pika.IncomingMessage) -> bool:
+        if body.get("type") != MessageType.AUDIT:
+            self.logger.warning(f"Unknown message type in audit queue: {body.get('type')}")
+            return True
+
+        try:
+            await audit_log_writer.write(AuditMessage(**body))
+            return True
+        except Exception as e:
+            self.logger.error(f"Error writing audit message {message.message_id}: {e}", exc_info=True)
+            return False
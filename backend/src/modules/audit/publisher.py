@@ -0,0 +1,39 @@
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.messaging import AuditMessage, OutboxPublisher
+from .writer import audit_log_writer
+
+
+class AuditPublisher(OutboxPublisher[AuditMessage]):
+    """Отправляет события аудита в очередь после коммита транзакции, в которой они произошли.
+
+    Без RabbitMQ события передаются писателю в этом же процессе.
+    """
+
+    def __init__(self):
+        super().__init__("audit_messages", audit_log_writer.add)
+
+    def emit(
+        self,
+        session: AsyncSession,
+        *,
+        actor_id: int,
+        action: str,
+        resource_type: str,
+        resource_id: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+        old_value: Optional[Any] = None,
+    ) -> AuditMessage:
+        return self.stage(session, AuditMessage(
+            user_id=actor_id,
+            action=action,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            new_value=details or {},
+            old_value=old_value,
+        ))
+
+
+audit_publisher = AuditPublisher()
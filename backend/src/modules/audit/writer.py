@@ -0,0 +1,100 @@
+import asyncio
+import json
+from datetime import timezone
+from typing import Any, List, Optional, Tuple
+
+from core.config import settings
+from core.database.models import AdminAuditLog
+from core.database.session import db_session
+from shared.messaging import AuditMessage, BaseBatchWriter
+
+AUDIT_COLUMNS = ("actor_id", "action", "target_type", "target_id", "details", "created_at")
+
+
+def _to_record(message: AuditMessage) -> Tuple[Any, ...]:
+    details = dict(message.new_value) if isinstance(message.new_value, dict) else {}
+    if message.old_value is not None:
+        details["old_value"] = message.old_value
+    if message.ip_address:
+        details["ip_address"] = message.ip_address
+    if message.user_agent:
+        details["user_agent"] = message.user_agent
+
+    created_at = message.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+
+    return (
+        message.user_id,
+        message.action,
+        message.resource_type,
+        message.resource_id,
+        json.dumps(details, ensure_ascii=False, default=str),
+        created_at,
+    )
+
+
+class AuditLogWriter(BaseBatchWriter):
+    """Копит события аудита и записывает их в admin_audit_logs пачками через COPY."""
+
+    description = "audit log"
+
+    def __init__(self, batch_size: int, flush_interval_seconds: float):
+        super().__init__(batch_size, flush_interval_seconds)
+        # Future есть у событий из очереди: консьюмер подтверждает сообщение только после записи
+        self._pending: List[Tuple[AuditMessage, Optional[asyncio.Future]]] = []
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def add(self, message: AuditMessage) -> None:
+        self._enqueue(message, None)
+
+    async def write(self, message: AuditMessage) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(message, future)
+        await future
+
+    def _enqueue(self, message: AuditMessage, future: Optional[asyncio.Future]) -> None:
+        self._pending.append((message, future))
+        self._mark_pending()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+            if not batch:
+                return
+
+            try:
+                await self._copy([_to_record(message) for message, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if future and not future.done():
+                        future.set_exception(e)
+                # События без очереди за спиной больше негде сохранить — возвращаем их в буфер
+                self._pending[:0] = [(message, None) for message, future in batch if future is None]
+                raise
+
+            for _, future in batch:
+                if future and not future.done():
+                    future.set_result(None)
+
+            self._mark_pending()
+
+    async def _copy(self, records: List[Tuple[Any, ...]]) -> None:
+        async with db_session.engine.connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                AdminAuditLog.__tablename__,
+                records=records,
+                columns=AUDIT_COLUMNS,
+            )
+
+        self.logger.debug(f"Wrote {len(records)} audit log records")
+
+
+audit_log_writer = AuditLogWriter(
+    batch_size=settings.audit.batch_size,
+    flush_interval_seconds=settings.audit.flush_interval_seconds,
+)
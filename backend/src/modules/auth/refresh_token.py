@@ -61,9 +61,21 @@ async def revoke_all_user_tokens(session: AsyncSession, user_id: int):
     await session.execute(stmt)
     await session.commit()
 
-async def cleanup_expired_tokens(session: AsyncSession):
-    stmt = delete(RefreshToken).where(
-        RefreshToken.expires_at < datetime.now(timezone.utc)
-    )
-    await session.execute(stmt)
-    await session.commit()
\ No newline at end of file
+async def cleanup_expired_tokens(session: AsyncSession, batch_size: int = 1000) -> int:
+    """Удаление истёкших токенов пачками по batch_size строк, каждая в своей транзакции."""
+    now = datetime.now(timezone.utc)
+    deleted = 0
+
+    while True:
+        expired = (
+            select(RefreshToken.token_hash)
+            .where(RefreshToken.expires_at < now)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = await session.execute(delete(RefreshToken).where(RefreshToken.token_hash.in_(expired)))
+        await session.commit()
+
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
@@ -0,0 +1,329 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from core.config import settings
+from core.database.models import ConferenceMessage, ConferenceRoom
+from core.database.session import db_session
+from core.logger import logger
+from modules.notifications.redis_client import redis_client
+from .schemas import ConferenceMessageResponse
+
+PENDING_ROOMS_KEY = "conference:chat:pending_rooms"
+STREAM_TTL_SECONDS = 24 * 60 * 60
+
+# Удаляет буфер комнаты, только если в потоке нет сообщений после курсора записи.
+# KEYS: поток, курсор, ростер, очередь комнат; ARGV: ID комнаты
+DISCARD_FLUSHED_SCRIPT = """
+local cursor = redis.call('GET', KEYS[2])
+local start = '-'
+if cursor then
+    start = '(' .. cursor
+end
+if #redis.call('XRANGE', KEYS[1], start, '+', 'COUNT', 1) > 0 then
+    return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[3])
+redis.call('SREM', KEYS[4], ARGV[1])
+return 1
+"""
+
+
+class ConferenceChatBuffer:
+    """Буфер чата созвонов: Redis stream на комнату и пакетная запись в conference_messages."""
+
+    def __init__(
+        self,
+        flush_interval_seconds: float,
+        flush_batch_size: int,
+        roster_ttl_seconds: int,
+        id_block_size: int,
+    ):
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_batch_size = flush_batch_size
+        self.roster_ttl_seconds = roster_ttl_seconds
+        self.id_block_size = id_block_size
+        self.logger = logger
+        self._id_pool: List[int] = []
+        self._id_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._discard_flushed_script = None
+
+    @property
+    def is_available(self) -> bool:
+        return redis_client.is_connected
+
+    @staticmethod
+    def _stream_key(room_id: int) -> str:
+        return f"conference:chat:{room_id}:stream"
+
+    @staticmethod
+    def _cursor_key(room_id: int) -> str:
+        return f"conference:chat:{room_id}:flushed"
+
+    @staticmethod
+    def _roster_key(room_id: int) -> str:
+        return f"conference:chat:{room_id}:roster"
+
+    async def is_in_roster(self, room_id: int, user_id: int) -> bool:
+        try:
+            return bool(await redis_client.client.sismember(self._roster_key(room_id), user_id))
+        except Exception as e:
+            self.logger.error(f"Redis roster check error for room {room_id}: {e}")
+            return False
+
+    async def add_to_roster(self, room_id: int, user_id: int) -> None:
+        try:
+            pipe = redis_client.client.pipeline(transaction=False)
+            pipe.sadd(self._roster_key(room_id), user_id)
+            pipe.expire(self._roster_key(room_id), self.roster_ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            self.logger.error(f"Redis roster update error for room {room_id}: {e}")
+
+    async def remove_from_roster(self, room_id: int, user_id: int) -> None:
+        if not self.is_available:
+            return
+
+        try:
+            await redis_client.client.srem(self._roster_key(room_id), user_id)
+        except Exception as e:
+            self.logger.error(f"Redis roster update error for room {room_id}: {e}")
+
+    async def discard_roster(self, room_id: int) -> None:
+        if not self.is_available:
+            return
+
+        try:
+            await redis_client.client.delete(self._roster_key(room_id))
+        except Exception as e:
+            self.logger.error(f"Redis roster cleanup error for room {room_id}: {e}")
+
+    async def _allocate_id(self) -> int:
+        # ID берутся блоками из последовательности таблицы, чтобы не расходиться с прямыми INSERT.
+        # У разных воркеров блоки чередуются, поэтому хронологию задаёт (created_at, id), а не id
+        async with self._id_lock:
+            if not self._id_pool:
+                async with db_session.session_factory() as session:
+                    result = await session.execute(
+                        text(
+                            "SELECT nextval(pg_get_serial_sequence('conference_messages', 'id')) "
+                            "FROM generate_series(1, :count)"
+                        ),
+                        {"count": self.id_block_size},
+                    )
+                    self._id_pool = sorted(row[0] for row in result.all())
+
+            return self._id_pool.pop(0)
+
+    async def append(
+        self,
+        room_id: int,
+        user_id: int,
+        user_name: str,
+        message: str,
+    ) -> ConferenceMessageResponse:
+        message_id = await self._allocate_id()
+        created_at = datetime.now(timezone.utc)
+
+        pipe = redis_client.client.pipeline(transaction=False)
+        pipe.xadd(
+            self._stream_key(room_id),
+            {
+                "id": message_id,
+                "user_id": user_id,
+                "user_name": user_name,
+                "message": message,
+                "created_at": created_at.isoformat(),
+            },
+        )
+        pipe.expire(self._stream_key(room_id), STREAM_TTL_SECONDS)
+        pipe.sadd(PENDING_ROOMS_KEY, room_id)
+        await pipe.execute()
+
+        return ConferenceMessageResponse(
+            id=message_id,
+            user_id=user_id,
+            user_name=user_name,
+            message=message,
+            created_at=created_at,
+        )
+
+    async def _read_unflushed(
+        self,
+        room_id: int,
+        count: Optional[int] = None,
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        cursor = await redis_client.client.get(self._cursor_key(room_id))
+        start = f"({cursor}" if cursor else "-"
+        return await redis_client.client.xrange(self._stream_key(room_id), min=start, max="+", count=count)
+
+    async def get_unflushed_messages(self, room_id: int) -> List[ConferenceMessageResponse]:
+        """Сообщения, ещё не записанные в БД: нужны, чтобы чтение видело только что отправленное."""
+        try:
+            entries = await self._read_unflushed(room_id)
+        except Exception as e:
+            self.logger.error(f"Redis chat read error for room {room_id}: {e}")
+            return []
+
+        return [
+            ConferenceMessageResponse(
+                id=int(fields["id"]),
+                user_id=int(fields["user_id"]),
+                user_name=fields["user_name"],
+                message=fields["message"],
+                created_at=datetime.fromisoformat(fields["created_at"]),
+            )
+            for _, fields in entries
+        ]
+
+    async def flush_room(self, room_id: int) -> int:
+        if not self.is_available:
+            return 0
+
+        flushed = 0
+
+        while True:
+            entries = await self._read_unflushed(room_id, count=self.flush_batch_size)
+            if not entries:
+                break
+
+            async with db_session.session_factory() as session:
+                room_exists = await session.scalar(
+                    select(ConferenceRoom.id).where(ConferenceRoom.id == room_id)
+                )
+                if not room_exists:
+                    await self.discard_room(room_id)
+                    self.logger.warning(f"Dropped buffered chat of deleted room {room_id}")
+                    return flushed
+
+                rows = [
+                    {
+                        "id": int(fields["id"]),
+                        "room_id": room_id,
+                        "user_id": int(fields["user_id"]),
+                        "message": fields["message"],
+                        "created_at": datetime.fromisoformat(fields["created_at"]),
+                    }
+                    for _, fields in entries
+                ]
+                await session.execute(
+                    pg_insert(ConferenceMessage).values(rows).on_conflict_do_nothing(index_elements=["id"])
+                )
+                await session.commit()
+
+            # Поток обрезается только до курсора: незаписанные сообщения не теряются, даже если
+            # база недоступна и их накопилось много
+            pipe = redis_client.client.pipeline(transaction=False)
+            pipe.set(self._cursor_key(room_id), entries[-1][0])
+            pipe.expire(self._cursor_key(room_id), STREAM_TTL_SECONDS)
+            pipe.xtrim(self._stream_key(room_id), minid=entries[-1][0])
+            await pipe.execute()
+
+            flushed += len(entries)
+            if len(entries) < self.flush_batch_size:
+                break
+
+        if flushed:
+            self.logger.debug(f"Flushed {flushed} chat messages of room {room_id}")
+
+        return flushed
+
+    async def try_flush_room(self, room_id: int) -> bool:
+        """Финальная запись чата комнаты; при ошибке комната остаётся в очереди фоновой записи."""
+        try:
+            await self.flush_room(room_id)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error flushing chat of room {room_id}: {e}", exc_info=True)
+            try:
+                await redis_client.client.sadd(PENDING_ROOMS_KEY, room_id)
+            except Exception:
+                pass
+            return False
+
+    async def discard_room(self, room_id: int) -> None:
+        """Удаление буфера и ростера комнаты вместе с незаписанными сообщениями, например у удалённой комнаты."""
+        try:
+            await redis_client.client.delete(
+                self._stream_key(room_id),
+                self._cursor_key(room_id),
+                self._roster_key(room_id),
+            )
+            await redis_client.client.srem(PENDING_ROOMS_KEY, room_id)
+        except Exception as e:
+            self.logger.error(f"Redis chat cleanup error for room {room_id}: {e}")
+
+    async def discard_flushed_room(self, room_id: int) -> bool:
+        """Удаление буфера закрытой комнаты после финальной записи.
+
+        Сообщение, добавленное уже после записи, оставляет буфер на месте: его допишет фоновая запись.
+        """
+        try:
+            if self._discard_flushed_script is None:
+                self._discard_flushed_script = redis_client.client.register_script(DISCARD_FLUSHED_SCRIPT)
+            discarded = await self._discard_flushed_script(
+                keys=[
+                    self._stream_key(room_id),
+                    self._cursor_key(room_id),
+                    self._roster_key(room_id),
+                    PENDING_ROOMS_KEY,
+                ],
+                args=[room_id],
+                client=redis_client.client,
+            )
+        except Exception as e:
+            self.logger.error(f"Redis chat cleanup error for room {room_id}: {e}")
+            return False
+
+        if not discarded:
+            self.logger.info(f"Chat of room {room_id} got messages after the final flush, keeping buffer")
+        return bool(discarded)
+
+    async def flush_pending(self) -> None:
+        if not self.is_available:
+            return
+
+        room_ids = await redis_client.client.smembers(PENDING_ROOMS_KEY)
+
+        for room_id in room_ids:
+            # Снимаем отметку до чтения: новое сообщение во время записи вернёт её обратно
+            await redis_client.client.srem(PENDING_ROOMS_KEY, room_id)
+            try:
+                await self.flush_room(int(room_id))
+            except Exception as e:
+                await redis_client.client.sadd(PENDING_ROOMS_KEY, room_id)
+                self.logger.error(f"Error flushing chat of room {room_id}: {e}", exc_info=True)
+
+    async def start(self) -> None:
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        if self._flusher:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+
+        try:
+            await self.flush_pending()
+        except Exception as e:
+            self.logger.error(f"Error flushing chat buffers on shutdown: {e}", exc_info=True)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                await self.flush_pending()
+            except Exception as e:
+                self.logger.error(f"Error flushing chat buffers: {e}", exc_info=True)
+
+
+conference_chat_buffer = ConferenceChatBuffer(
+    flush_interval_seconds=settings.conference_chat.flush_interval_seconds,
+    flush_batch_size=settings.conference_chat.flush_batch_size,
+    roster_ttl_seconds=settings.conference_chat.roster_ttl_seconds,
+    id_block_size=settings.conference_chat.id_block_size,
+)
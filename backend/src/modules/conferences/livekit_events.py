@@ -0,0 +1,323 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import jwt
+from sqlalchemy import bindparam, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from core.config import settings
+from core.database.models import ConferenceParticipant, ConferenceRoom
+from core.database.session import db_session
+from core.logger import logger
+from .presence import conference_presence
+
+# Источник трека LiveKit -> флаг участника; демонстрация экрана на флаги не влияет
+TRACK_SOURCE_FLAGS = {
+    "CAMERA": "is_video_on",
+    "MICROPHONE": "is_audio_on",
+}
+
+
+def verify_webhook(body: bytes, authorization: Optional[str]) -> bool:
+    """Проверка подписи вебхука LiveKit: JWT от api_secret с sha256 тела запроса."""
+    if not authorization:
+        return False
+
+    token = authorization[len("Bearer "):] if authorization.startswith("Bearer ") else authorization
+
+    try:
+        claims = jwt.decode(token, settings.livekit.api_secret, algorithms=["HS256"])
+    except jwt.PyJWTError:
+        return False
+
+    if claims.get("iss") != settings.livekit.api_key:
+        return False
+
+    body_hash = base64.b64encode(hashlib.sha256(body).digest()).decode()
+    return hmac.compare_digest(claims.get("sha256", ""), body_hash)
+
+
+def _event_time(event: Dict[str, Any]) -> datetime:
+    created_at = event.get("createdAt")
+    try:
+        return datetime.fromtimestamp(int(created_at), tz=timezone.utc)
+    except (TypeError, ValueError):
+        return datetime.now(timezone.utc)
+
+
+class LiveKitEventBuffer:
+    """Схлопывает события вебхука LiveKit в памяти и применяет их пакетными upsert'ами."""
+
+    def __init__(self, flush_interval_seconds: float, max_apply_attempts: int):
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_apply_attempts = max_apply_attempts
+        self.logger = logger
+        # (room_name, user_id) -> последнее известное состояние участника
+        self._participants: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._finished_rooms: Dict[str, datetime] = {}
+        # Число неудачных попыток записать участника или завершение комнаты
+        self._participant_attempts: Dict[Tuple[str, int], int] = {}
+        self._room_attempts: Dict[str, int] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    def add(self, event: Dict[str, Any]) -> None:
+        event_type = event.get("event")
+        room_name = (event.get("room") or {}).get("name")
+        if not room_name:
+            return
+
+        if event_type == "room_finished":
+            self._finished_rooms[room_name] = _event_time(event)
+            return
+
+        participant = event.get("participant") or {}
+        try:
+            user_id = int(participant.get("identity"))
+        except (TypeError, ValueError):
+            return
+
+        patch = self._participants.setdefault((room_name, user_id), {})
+
+        if event_type == "participant_joined":
+            patch.update(
+                participant_sid=participant.get("sid"),
+                left_at=None,
+                is_video_on=False,
+                is_audio_on=False,
+            )
+            for track in participant.get("tracks") or []:
+                flag = TRACK_SOURCE_FLAGS.get(track.get("source"))
+                if flag:
+                    patch[flag] = not track.get("muted", False)
+
+        elif event_type == "participant_left":
+            patch.update(
+                participant_sid=None,
+                left_at=_event_time(event),
+                is_speaking=False,
+            )
+
+        elif event_type in ("track_published", "track_unpublished"):
+            track = event.get("track") or {}
+            flag = TRACK_SOURCE_FLAGS.get(track.get("source"))
+            if flag:
+                patch[flag] = event_type == "track_published" and not track.get("muted", False)
+
+        if not patch:
+            del self._participants[(room_name, user_id)]
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            participants, self._participants = self._participants, {}
+            finished_rooms, self._finished_rooms = self._finished_rooms, {}
+
+            if not participants and not finished_rooms:
+                return
+
+            try:
+                await self._apply(participants, finished_rooms)
+            except Exception as e:
+                # Одна сбойная строка не должна держать весь пакет: повторяем по одной
+                self.logger.warning(f"Failed to apply LiveKit events batch, retrying one by one: {e}")
+                await self._apply_one_by_one(participants, finished_rooms)
+                return
+
+            for key in participants:
+                self._participant_attempts.pop(key, None)
+            for room_name in finished_rooms:
+                self._room_attempts.pop(room_name, None)
+
+    async def _apply_one_by_one(
+        self,
+        participants: Dict[Tuple[str, int], Dict[str, Any]],
+        finished_rooms: Dict[str, datetime],
+    ) -> None:
+        for key, patch in participants.items():
+            try:
+                await self._apply({key: patch}, {})
+            except Exception as e:
+                attempts = self._participant_attempts.get(key, 0) + 1
+                if attempts >= self.max_apply_attempts:
+                    self._participant_attempts.pop(key, None)
+                    self.logger.error(
+                        f"Dropping LiveKit update for user {key[1]} in room {key[0]} "
+                        f"after {attempts} attempts: {e}"
+                    )
+                    continue
+                # Возвращаем в буфер, не затирая события, пришедшие во время записи
+                self._participant_attempts[key] = attempts
+                self._participants[key] = {**patch, **self._participants.get(key, {})}
+            else:
+                self._participant_attempts.pop(key, None)
+
+        for room_name, ended_at in finished_rooms.items():
+            try:
+                await self._apply({}, {room_name: ended_at})
+            except Exception as e:
+                attempts = self._room_attempts.get(room_name, 0) + 1
+                if attempts >= self.max_apply_attempts:
+                    self._room_attempts.pop(room_name, None)
+                    self.logger.error(
+                        f"Dropping LiveKit room_finished for room {room_name} after {attempts} attempts: {e}"
+                    )
+                    continue
+                self._room_attempts[room_name] = attempts
+                self._finished_rooms.setdefault(room_name, ended_at)
+            else:
+                self._room_attempts.pop(room_name, None)
+
+    async def _apply(
+        self,
+        participants: Dict[Tuple[str, int], Dict[str, Any]],
+        finished_rooms: Dict[str, datetime],
+    ) -> None:
+        from .service import ConferenceService
+
+        room_names = {room_name for room_name, _ in participants} | set(finished_rooms)
+
+        async with db_session.session_factory() as session:
+            active_participants_count = (
+                select(func.count(ConferenceParticipant.id))
+                .where(
+                    ConferenceParticipant.room_id == ConferenceRoom.id,
+                    ConferenceParticipant.left_at.is_(None),
+                )
+                .scalar_subquery()
+            )
+            rooms_result = await session.execute(
+                select(
+                    ConferenceRoom.room_name,
+                    ConferenceRoom.id,
+                    ConferenceRoom.is_active,
+                    ConferenceRoom.max_participants - active_participants_count,
+                )
+                .where(ConferenceRoom.room_name.in_(room_names))
+            )
+            rooms = {}
+            free_slots: Dict[int, int] = {}
+            for room_name, room_id, is_active, room_free_slots in rooms_result.all():
+                rooms[room_name] = (room_id, is_active)
+                free_slots[room_id] = room_free_slots
+
+            join_keys = [
+                (rooms[room_name][0], user_id)
+                for (room_name, user_id), patch in participants.items()
+                if room_name in rooms and patch.get("left_at", True) is None
+            ]
+            already_active: Set[Tuple[int, int]] = set()
+            if join_keys:
+                active_result = await session.execute(
+                    select(ConferenceParticipant.room_id, ConferenceParticipant.user_id).where(
+                        tuple_(ConferenceParticipant.room_id, ConferenceParticipant.user_id).in_(join_keys),
+                        ConferenceParticipant.left_at.is_(None),
+                    )
+                )
+                already_active = set(active_result.tuples().all())
+
+            # Строки с одинаковым набором полей записываются одним запросом; входы — отдельно от выходов
+            batches: Dict[Tuple[bool, Tuple[str, ...]], List[Dict[str, Any]]] = {}
+            for (room_name, user_id), patch in participants.items():
+                room_id, is_active = rooms.get(room_name, (None, False))
+                if room_id is None:
+                    continue
+                is_join = patch.get("left_at", True) is None
+                if is_join and not is_active:
+                    # Подключение к уже завершённому созвону не возвращает участника в комнату
+                    continue
+                if is_join and (room_id, user_id) not in already_active:
+                    if free_slots[room_id] <= 0:
+                        self.logger.warning(f"Ignoring LiveKit join of user {user_id} to full room {room_id}")
+                        continue
+                    free_slots[room_id] -= 1
+                batches.setdefault((is_join, tuple(sorted(patch))), []).append(
+                    {"room_id": room_id, "user_id": user_id, **patch}
+                )
+
+            participants_table = ConferenceParticipant.__table__
+            joined: List[Tuple[int, int]] = []
+            left: List[Tuple[int, int]] = []
+            for (is_join, columns), rows in batches.items():
+                if "left_at" in columns:
+                    # Вход или выход: строки участника может ещё не быть
+                    stmt = pg_insert(participants_table).values(rows)
+                    upsert = stmt.on_conflict_do_update(
+                        constraint="uq_conference_participant",
+                        set_={column: stmt.excluded[column] for column in columns},
+                        # Временно исключённый участник не возвращается в комнату через вебхук
+                        where=or_(
+                            participants_table.c.kicked_until.is_(None),
+                            participants_table.c.kicked_until <= func.now(),
+                        ) if is_join else None,
+                    ).returning(participants_table.c.room_id, participants_table.c.user_id)
+                    applied = (await session.execute(upsert)).tuples().all()
+                    (joined if is_join else left).extend(applied)
+                    continue
+
+                # Изменения треков обновляют только существующих участников
+                await session.execute(
+                    update(participants_table)
+                    .where(
+                        participants_table.c.room_id == bindparam("p_room_id"),
+                        participants_table.c.user_id == bindparam("p_user_id"),
+                    )
+                    .values({column: bindparam(f"p_{column}") for column in columns}),
+                    [{f"p_{key}": value for key, value in row.items()} for row in rows],
+                )
+
+            await session.commit()
+
+            for room_id, user_id in joined:
+                await conference_presence.joined(room_id, user_id)
+            for room_id, user_id in left:
+                await conference_presence.left(room_id, user_id)
+
+            conference_service = ConferenceService(session)
+            finished_ids: Set[int] = set()
+
+            for room_name, ended_at in finished_rooms.items():
+                room_id, is_active = rooms.get(room_name, (None, False))
+                if room_id is None or not is_active:
+                    continue
+
+                room = await conference_service._get_room_with_active_participants(room_id)
+                if room and room.is_active:
+                    # Комнату уже закрыл сам LiveKit, удалять её через API не нужно
+                    await conference_service._finish_room(room, ended_at, delete_livekit_room=False)
+                    finished_ids.add(room_id)
+
+        self.logger.debug(
+            f"Applied {len(participants)} LiveKit participant updates, finished rooms {sorted(finished_ids)}"
+        )
+
+    async def start(self) -> None:
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        if self._flusher:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+
+        try:
+            await self.flush()
+        except Exception as e:
+            self.logger.error(f"Error applying LiveKit events on shutdown: {e}", exc_info=True)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                self.logger.error(f"Error applying LiveKit events: {e}", exc_info=True)
+
+
+livekit_event_buffer = LiveKitEventBuffer(
+    flush_interval_seconds=settings.livekit.webhook_flush_interval_seconds,
+    max_apply_attempts=settings.livekit.webhook_max_apply_attempts,
+)
@@ -0,0 +1,243 @@
+import math
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from core.config import settings
+from core.logger import logger
+from modules.notifications.redis_client import redis_client
+
+Sample = Tuple[float, int]
+
+
+class TrimmedWindow(NamedTuple):
+    """Свёртка точек, вытесненных из ряда: последняя из них, площадь под рядом до неё и максимум."""
+    at: float
+    count: int
+    area: float
+    peak: int
+
+
+# Добавляет точку в ряд и сворачивает вытесненные из начала точки в хэш TrimmedWindow.
+# KEYS: ряд, свёртка; ARGV: точка "timestamp:count", предел длины ряда, TTL
+APPEND_SAMPLE_SCRIPT = """
+local length = redis.call('RPUSH', KEYS[1], ARGV[1])
+local excess = length - tonumber(ARGV[2])
+if excess > 0 then
+    local dropped = redis.call('LRANGE', KEYS[1], 0, excess - 1)
+    redis.call('LTRIM', KEYS[1], excess, -1)
+    local base = redis.call('HMGET', KEYS[2], 'at', 'count', 'area', 'peak')
+    local at = tonumber(base[1])
+    local count = tonumber(base[2]) or 0
+    local area = tonumber(base[3]) or 0
+    local peak = tonumber(base[4]) or 0
+    for _, raw in ipairs(dropped) do
+        local separator = string.find(raw, ':', 1, true)
+        local timestamp = tonumber(string.sub(raw, 1, separator - 1))
+        if at then
+            area = area + count * (timestamp - at)
+        end
+        at = timestamp
+        count = tonumber(string.sub(raw, separator + 1))
+        if count > peak then
+            peak = count
+        end
+    end
+    redis.call('HSET', KEYS[2], 'at', tostring(at), 'count', tostring(count), 'area', tostring(area), 'peak', tostring(peak))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return length
+"""
+
+
+def summarize_timeline(
+    samples: List[Sample],
+    started_at: datetime,
+    ended_at: datetime,
+    points: int,
+    trimmed: Optional[TrimmedWindow] = None,
+) -> Tuple[float, List[Dict]]:
+    """Средневзвешенное по времени число участников и прореженный ряд из points интервалов (максимум за интервал).
+
+    samples — точки изменения (timestamp, число участников); до первой точки в комнате никого нет.
+    trimmed — свёртка точек, вытесненных из начала ряда: до trimmed.at интервалы получают её максимум,
+    а дальше действует trimmed.count.
+    """
+    start = started_at.timestamp()
+    end = max(ended_at.timestamp(), start)
+    span = end - start
+    if span <= 0 or points <= 0:
+        return 0.0, []
+
+    samples = sorted(sample for sample in samples if sample[0] <= end)
+    bucket_width = span / points
+    buckets = [0] * points
+
+    weighted_sum = 0.0
+    current = 0
+    cursor = start
+
+    if trimmed:
+        cursor = min(max(trimmed.at, start), end)
+        current = trimmed.count
+        weighted_sum = trimmed.area
+        last = min(math.ceil((cursor - start) / bucket_width), points) if cursor > start else 0
+        for index in range(last):
+            buckets[index] = trimmed.peak
+
+    for timestamp, count in samples + [(end, None)]:
+        timestamp = max(timestamp, start)
+        weighted_sum += current * (timestamp - cursor)
+
+        # Значение current действовало на отрезке [cursor, timestamp]
+        first = min(int((cursor - start) / bucket_width), points - 1)
+        last = max(first, min(math.ceil((timestamp - start) / bucket_width) - 1, points - 1))
+        for index in range(first, last + 1):
+            buckets[index] = max(buckets[index], current)
+
+        if count is None:
+            break
+        cursor = timestamp
+        current = count
+        bucket = min(int((timestamp - start) / bucket_width), points - 1)
+        buckets[bucket] = max(buckets[bucket], current)
+
+    timeline = [
+        {
+            "at": datetime.fromtimestamp(start + index * bucket_width, tz=timezone.utc).isoformat(),
+            "participants": value,
+        }
+        for index, value in enumerate(buckets)
+    ]
+    return round(weighted_sum / span, 2), timeline
+
+
+class ConferencePresenceTracker:
+    """Живые счётчики участников созвона в Redis: текущий состав, пик и ряд точек изменения."""
+
+    def __init__(self, max_samples: int, timeline_points: int, ttl_seconds: int):
+        self.max_samples = max_samples
+        self.timeline_points = timeline_points
+        self.ttl_seconds = ttl_seconds
+        self.logger = logger
+        self._append_sample_script = None
+
+    @property
+    def is_available(self) -> bool:
+        return redis_client.is_connected
+
+    @staticmethod
+    def _members_key(room_id: int) -> str:
+        return f"conference:presence:{room_id}:members"
+
+    @staticmethod
+    def _peak_key(room_id: int) -> str:
+        return f"conference:presence:{room_id}:peak"
+
+    @staticmethod
+    def _samples_key(room_id: int) -> str:
+        return f"conference:presence:{room_id}:samples"
+
+    @staticmethod
+    def _trimmed_key(room_id: int) -> str:
+        return f"conference:presence:{room_id}:trimmed"
+
+    async def joined(self, room_id: int, user_id: int) -> None:
+        await self._update(room_id, user_id, joined=True)
+
+    async def left(self, room_id: int, user_id: int) -> None:
+        await self._update(room_id, user_id, joined=False)
+
+    async def _update(self, room_id: int, user_id: int, joined: bool) -> None:
+        if not self.is_available:
+            return
+
+        try:
+            # Множество вместо INCR/DECR: повторный вход или выход (API и вебхук LiveKit) не сдвигает счётчик
+            pipe = redis_client.client.pipeline(transaction=True)
+            if joined:
+                pipe.sadd(self._members_key(room_id), user_id)
+            else:
+                pipe.srem(self._members_key(room_id), user_id)
+            pipe.scard(self._members_key(room_id))
+            pipe.expire(self._members_key(room_id), self.ttl_seconds)
+            changed, count, _ = await pipe.execute()
+
+            if not changed:
+                return
+
+            pipe = redis_client.client.pipeline(transaction=False)
+            pipe.zadd(self._peak_key(room_id), {"peak": count}, gt=True)
+            pipe.expire(self._peak_key(room_id), self.ttl_seconds)
+            await pipe.execute()
+
+            # Точки сверх max_samples не выбрасываются, а сворачиваются, иначе среднее считало бы начало созвона пустым
+            if self._append_sample_script is None:
+                self._append_sample_script = redis_client.client.register_script(APPEND_SAMPLE_SCRIPT)
+            await self._append_sample_script(
+                keys=[self._samples_key(room_id), self._trimmed_key(room_id)],
+                args=[f"{time.time():.3f}:{count}", self.max_samples, self.ttl_seconds],
+                client=redis_client.client,
+            )
+        except Exception as e:
+            self.logger.error(f"Redis presence update error for room {room_id}: {e}")
+
+    async def get_room_presence(
+        self,
+        room_id: int,
+    ) -> Optional[Tuple[int, int, List[Sample], Optional[TrimmedWindow]]]:
+        """Текущее число участников, пик, точки изменения и свёртка вытесненных точек; None — данных в Redis нет."""
+        if not self.is_available:
+            return None
+
+        try:
+            pipe = redis_client.client.pipeline(transaction=False)
+            pipe.scard(self._members_key(room_id))
+            pipe.zscore(self._peak_key(room_id), "peak")
+            pipe.lrange(self._samples_key(room_id), 0, -1)
+            pipe.hgetall(self._trimmed_key(room_id))
+            current, peak, raw_samples, raw_trimmed = await pipe.execute()
+        except Exception as e:
+            self.logger.error(f"Redis presence read error for room {room_id}: {e}")
+            return None
+
+        if peak is None and not raw_samples:
+            return None
+
+        samples = []
+        for raw in raw_samples:
+            timestamp, count = raw.split(":")
+            samples.append((float(timestamp), int(count)))
+
+        trimmed = None
+        if raw_trimmed:
+            trimmed = TrimmedWindow(
+                at=float(raw_trimmed["at"]),
+                count=int(raw_trimmed["count"]),
+                area=float(raw_trimmed["area"]),
+                peak=int(raw_trimmed["peak"]),
+            )
+
+        return int(current), int(peak or 0), samples, trimmed
+
+    async def discard_room(self, room_id: int) -> None:
+        if not self.is_available:
+            return
+
+        try:
+            await redis_client.client.delete(
+                self._members_key(room_id),
+                self._peak_key(room_id),
+                self._samples_key(room_id),
+                self._trimmed_key(room_id),
+            )
+        except Exception as e:
+            self.logger.error(f"Redis presence cleanup error for room {room_id}: {e}")
+
+
+conference_presence = ConferencePresenceTracker(
+    max_samples=settings.conference_presence.max_samples,
+    timeline_points=settings.conference_presence.timeline_points,
+    ttl_seconds=settings.conference_presence.ttl_seconds,
+)
@@ -0,0 +1,148 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, or_, select
+
+from core.config import settings
+from core.database.models import ConferenceParticipant, ConferenceRoom
+from core.database.session import db_session
+from core.logger import logger
+from core.utils.livekit_client import livekit_client
+from modules.notifications.redis_client import redis_client
+
+LEASE_KEY = "conference:reaper:lease"
+
+
+class StaleConferenceReaper:
+    """Периодически завершает созвоны, в которых давно нет живых участников.
+
+    Прогон запускает только воркер, взявший аренду в Redis; аренда живёт interval_seconds
+    и не освобождается, поэтому в кластере выполняется не больше одного прогона за интервал.
+    """
+
+    def __init__(self, interval_seconds: int, idle_minutes: int, batch_size: int):
+        self.interval_seconds = interval_seconds
+        self.idle_after = timedelta(minutes=idle_minutes)
+        self.batch_size = batch_size
+        self.logger = logger
+        self._worker_id = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+
+    async def _acquire_lease(self) -> bool:
+        if not redis_client.is_connected:
+            return False
+
+        try:
+            return bool(await redis_client.client.set(
+                LEASE_KEY,
+                self._worker_id,
+                nx=True,
+                ex=self.interval_seconds,
+            ))
+        except Exception as e:
+            self.logger.error(f"Redis reaper lease error: {e}")
+            return False
+
+    async def _find_candidates(self, after_id: int, cutoff: datetime) -> List[Tuple[int, str, bool]]:
+        """Активные комнаты без входов и выходов с cutoff: (id, имя комнаты, есть ли незакрытые участия)."""
+        recent_activity = (
+            select(ConferenceParticipant.id)
+            .where(
+                ConferenceParticipant.room_id == ConferenceRoom.id,
+                or_(ConferenceParticipant.joined_at >= cutoff, ConferenceParticipant.left_at >= cutoff),
+            )
+            .exists()
+        )
+        has_open_participants = (
+            select(ConferenceParticipant.id)
+            .where(
+                ConferenceParticipant.room_id == ConferenceRoom.id,
+                ConferenceParticipant.left_at.is_(None),
+            )
+            .exists()
+        )
+
+        stmt = (
+            select(ConferenceRoom.id, ConferenceRoom.room_name, has_open_participants)
+            .where(
+                ConferenceRoom.is_active == True,
+                ConferenceRoom.id > after_id,
+                func.coalesce(ConferenceRoom.started_at, ConferenceRoom.created_at) < cutoff,
+                ~recent_activity,
+            )
+            .order_by(ConferenceRoom.id)
+            .limit(self.batch_size)
+        )
+
+        async with db_session.session_factory() as session:
+            return [tuple(row) for row in (await session.execute(stmt)).all()]
+
+    async def reap(self) -> int:
+        from .service import ConferenceService
+
+        now = datetime.now(timezone.utc)
+        cutoff = now - self.idle_after
+        after_id = 0
+        reaped = 0
+
+        while True:
+            candidates = await self._find_candidates(after_id, cutoff)
+            if not candidates:
+                break
+            after_id = candidates[-1][0]
+
+            # Незакрытые участия могли остаться от упавших браузеров: верим LiveKit,
+            # есть ли ещё такая комната; без ответа LiveKit такие комнаты не трогаем
+            names_with_open = [name for _, name, has_open in candidates if has_open]
+            live_names = await livekit_client.list_room_names(names_with_open) if names_with_open else set()
+
+            stale_ids = [
+                room_id
+                for room_id, name, has_open in candidates
+                if not has_open or (live_names is not None and name not in live_names)
+            ]
+
+            async with db_session.session_factory() as session:
+                conference_service = ConferenceService(session)
+                for room_id in stale_ids:
+                    room = await conference_service._get_room_with_active_participants(room_id)
+                    if not room or not room.is_active:
+                        continue
+                    await conference_service._finish_room(room, now)
+                    reaped += 1
+
+            if len(candidates) < self.batch_size:
+                break
+
+        if reaped:
+            self.logger.info(f"Reaped {reaped} stale conference rooms")
+
+        return reaped
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            if not await self._acquire_lease():
+                continue
+            try:
+                await self.reap()
+            except Exception as e:
+                self.logger.error(f"Error reaping stale conferences: {e}", exc_info=True)
+
+
+conference_reaper = StaleConferenceReaper(
+    interval_seconds=settings.conference_reaper.interval_seconds,
+    idle_minutes=settings.conference_reaper.idle_minutes,
+    batch_size=settings.conference_reaper.batch_size,
+)
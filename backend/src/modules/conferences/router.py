@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, status, Query, Body
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query, Body
 from typing import List, Optional
 
 from core.database.models import User
@@ -8,6 +10,7 @@ from shared.dependencies import get_service_factory
 from core.config import settings
 from core.logger import logger
 from modules.conferences.service import ConferenceJoinDeniedError
+from modules.conferences.livekit_events import livekit_event_buffer, verify_webhook
 
 from .schemas import (
     ConferenceMessageResponse,
@@ -16,6 +19,7 @@ from .schemas import (
     ConferenceRoomWithDetails,
     JoinConferenceResponse,
     ConferenceStatsResponse,
+    ConferenceTimelineResponse,
     CreatorInfo,
     LeaveConferenceRequest,
     LeaveConferenceImpactResponse,
@@ -125,8 +129,7 @@ async def get_available_rooms(
     logger.info(f"Getting {status_filter} rooms for user {current_user.id}")
 
     conference_service = service_factory.get('conference')
-    rooms = await conference_service.get_available_rooms_for_user(current_user.id, status=status_filter)
-    return [await build_room_details(conference_service, current_user, room) for room in rooms]
+    return await conference_service.get_available_room_summaries(current_user.id, status=status_filter)
 
 
 @router.get("/rooms/project/{project_id}", response_model=List[ConferenceRoomResponse])
@@ -175,7 +178,7 @@ async def get_room_details(
     logger.info(f"Getting room {room_id} details for user {current_user.id}")
 
     conference_service = service_factory.get('conference')
-    room = await conference_service.get_room_by_id(room_id)
+    room = await conference_service.get_room_by_id(room_id, current_user.id)
 
     if not room:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Комната не найдена")
@@ -361,6 +364,7 @@ async def send_room_message(
         room_id=room_id,
         user_id=current_user.id,
         message_text=message_data.get("message", ""),
+        user_name=current_user.name or current_user.login,
     )
 
     if not message:
@@ -372,7 +376,7 @@ async def send_room_message(
     return {
         "id": message.id,
         "user_id": message.user_id,
-        "user_name": current_user.name or current_user.login,
+        "user_name": message.user_name,
         "message": message.message,
         "created_at": message.created_at.isoformat(),
     }
@@ -389,18 +393,7 @@ async def get_room_messages(
     logger.info(f"Getting messages for room {room_id}, user {current_user.id}")
 
     conference_service = service_factory.get('conference')
-    messages = await conference_service.get_room_messages(room_id, current_user.id, limit, before_id)
-
-    return [
-        ConferenceMessageResponse(
-            id=msg.id,
-            user_id=msg.user_id,
-            user_name=msg.user.name if msg.user else "Неизвестный",
-            message=msg.message,
-            created_at=msg.created_at,
-        )
-        for msg in messages
-    ]
+    return await conference_service.get_room_messages(room_id, current_user.id, limit, before_id)
 
 
 @router.get("/stats/{room_id}", response_model=ConferenceStatsResponse)
@@ -420,4 +413,48 @@ async def get_conference_stats(
             detail="Статистика не найдена или недостаточно прав",
         )
 
-    return stats
\ No newline at end of file
+    return stats
+
+
+@router.get("/stats/{room_id}/timeline", response_model=ConferenceTimelineResponse)
+async def get_conference_timeline(
+    room_id: int,
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+):
+    conference_service = service_factory.get('conference')
+    timeline = await conference_service.get_room_timeline(room_id, current_user.id)
+
+    if not timeline:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Статистика не найдена или недостаточно прав",
+        )
+
+    return timeline
+
+
+@router.post("/livekit/webhook", include_in_schema=False)
+async def livekit_webhook(request: Request):
+    """Приём событий LiveKit; применяются пакетно фоновой записью."""
+    body = await request.body()
+
+    if not verify_webhook(body, request.headers.get("Authorization")):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Неверная подпись вебхука",
+        )
+
+    try:
+        event = json.loads(body)
+    except ValueError:
+        event = None
+
+    if not isinstance(event, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Некорректное тело вебхука",
+        )
+
+    livekit_event_buffer.add(event)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -111,11 +111,26 @@ class ConferenceStatsResponse(BaseModel):
     peak_participants: Optional[int] = None
     duration_seconds: Optional[int] = None
     messages_count: Optional[int] = None
+    average_participants: Optional[float] = None
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class ConferenceTimelinePoint(BaseModel):
+    at: datetime
+    participants: int
+
+
+class ConferenceTimelineResponse(BaseModel):
+    room_id: int
+    is_active: bool
+    current_participants: int = 0
+    peak_participants: int = 0
+    average_participants: float = 0.0
+    timeline: List[ConferenceTimelinePoint] = Field(default_factory=list)
+
+
 class ConferenceMessageResponse(BaseModel):
     id: int
     user_id: int
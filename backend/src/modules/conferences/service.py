@@ -2,9 +2,9 @@ import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Set, TYPE_CHECKING
 
-from sqlalchemy import select, delete, func, or_, and_, insert
+from sqlalchemy import select, delete, func, or_, and_, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, contains_eager, selectinload
 
 from core.database.models import (
     NotificationPriority,
@@ -20,12 +20,25 @@ from core.database.models import (
     ConferenceMessage,
     ConferenceStats,
     conference_invited_users,
+    task_user_association,
     UserRole,
     project_group_association,
 )
 from shared.dependencies import ensure_user_is_admin, check_user_in_group, check_user_in_project
 from core.logger import logger
 from core.utils.livekit import livekit_token, generate_room_name
+from core.utils.livekit_client import livekit_client
+from modules.analytics import analytics_publisher
+from modules.notifications.websocket_manager import manager
+from modules.users.autocomplete import UserAutocompleteService
+from modules.users.schemas import UserAutocompleteItem
+from .chat_buffer import conference_chat_buffer
+from .presence import conference_presence, summarize_timeline
+from .schemas import (
+    ConferenceMessageResponse,
+    ConferenceRoomWithDetails,
+    ConferenceTimelineResponse,
+)
 
 if TYPE_CHECKING:
     from core.services import ServiceFactory
@@ -335,21 +348,57 @@ class ConferenceService:
             self.logger.error(f"Error creating conference room: {e}", exc_info=True)
             raise
 
-    async def get_room_by_id(self, room_id: int) -> Optional[ConferenceRoom]:
+    def _active_participants_loader(self, user_id: Optional[int] = None):
+        # Активные участники и запись текущего пользователя (нужна для проверки блокировки)
+        criteria = ConferenceParticipant.left_at.is_(None)
+        if user_id is not None:
+            criteria = or_(criteria, ConferenceParticipant.user_id == user_id)
+        return selectinload(ConferenceRoom.participants.and_(criteria))
+
+    async def _get_room_for_access(self, room_id: int) -> Optional[ConferenceRoom]:
+        """Комната с приглашёнными пользователями — достаточно для проверки доступа."""
         stmt = select(ConferenceRoom).options(
-            selectinload(ConferenceRoom.creator),
-            selectinload(ConferenceRoom.group),
-            selectinload(ConferenceRoom.project),
-            selectinload(ConferenceRoom.task),
             selectinload(ConferenceRoom.invited_users),
-            selectinload(ConferenceRoom.participants).selectinload(ConferenceParticipant.user),
-            selectinload(ConferenceRoom.messages).selectinload(ConferenceMessage.user),
-            selectinload(ConferenceRoom.stats),
         ).where(ConferenceRoom.id == room_id)
 
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def _get_room_with_active_participants(
+        self,
+        room_id: int,
+        user_id: Optional[int] = None,
+    ) -> Optional[ConferenceRoom]:
+        """Комната с активными участниками для проверок доступа, вместимости и блокировок."""
+        stmt = (
+            select(ConferenceRoom)
+            .options(
+                selectinload(ConferenceRoom.invited_users),
+                self._active_participants_loader(user_id),
+            )
+            .where(ConferenceRoom.id == room_id)
+            .execution_options(populate_existing=True)
+        )
+
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_room_by_id(self, room_id: int, user_id: Optional[int] = None) -> Optional[ConferenceRoom]:
+        """Карточка комнаты: создатель и активные участники; история чата не загружается."""
+        stmt = (
+            select(ConferenceRoom)
+            .options(
+                selectinload(ConferenceRoom.creator),
+                selectinload(ConferenceRoom.invited_users),
+                self._active_participants_loader(user_id),
+            )
+            .where(ConferenceRoom.id == room_id)
+            .execution_options(populate_existing=True)
+        )
+
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_room_by_name(self, room_name: str) -> Optional[ConferenceRoom]:
         stmt = select(ConferenceRoom).options(
             selectinload(ConferenceRoom.creator),
@@ -375,31 +424,107 @@ class ConferenceService:
         result = await self.session.execute(stmt)
         return list({row[0] for row in result.all()})
 
-    async def get_available_rooms_for_user(self, user_id: int, status: str = "active") -> List[ConferenceRoom]:
-        user_group_ids = await self._get_user_group_ids(user_id)
-        user_project_ids = await self._get_user_project_ids(user_group_ids)
-
-        conditions = [
-            ConferenceRoom.created_by == user_id,
-            ConferenceRoom.invited_users.any(User.id == user_id),
-            ConferenceRoom.participants.any(ConferenceParticipant.user_id == user_id),
-        ]
+    async def get_available_room_summaries(
+        self,
+        user_id: int,
+        status: str = "active",
+    ) -> List[ConferenceRoomWithDetails]:
+        """Список доступных созвонов одним запросом: доступ, права модератора и блокировка считаются в SQL."""
+        # Группы в процессе удаления не дают доступа к своим созвонам
+        my_group_ids = (
+            select(GroupMember.group_id)
+            .join(Group, Group.id == GroupMember.group_id)
+            .where(GroupMember.user_id == user_id, Group.deleting_at.is_(None))
+        )
+        my_admin_group_ids = my_group_ids.where(GroupMember.role == UserRole.ADMIN)
+        my_project_ids = select(project_group_association.c.project_id).where(
+            project_group_association.c.group_id.in_(my_group_ids)
+        )
+        my_admin_project_ids = select(project_group_association.c.project_id).where(
+            project_group_association.c.group_id.in_(my_admin_group_ids)
+        )
 
-        if user_group_ids:
-            conditions.append(ConferenceRoom.group_id.in_(user_group_ids))
+        is_invited = (
+            select(conference_invited_users.c.room_id)
+            .where(
+                conference_invited_users.c.room_id == ConferenceRoom.id,
+                conference_invited_users.c.user_id == user_id,
+            )
+            .exists()
+        )
+        is_task_assignee = (
+            select(task_user_association.c.task_id)
+            .where(
+                task_user_association.c.task_id == ConferenceRoom.task_id,
+                task_user_association.c.user_id == user_id,
+            )
+            .exists()
+        )
+        active_participants_count = (
+            select(func.count(ConferenceParticipant.id))
+            .where(
+                ConferenceParticipant.room_id == ConferenceRoom.id,
+                ConferenceParticipant.left_at.is_(None),
+            )
+            .scalar_subquery()
+        )
 
-        if user_project_ids:
-            conditions.append(ConferenceRoom.project_id.in_(user_project_ids))
+        my_participation = aliased(ConferenceParticipant)
+        is_task_room = ConferenceRoom.room_type == ConferenceRoomType.TASK
+
+        is_visible = and_(
+            or_(
+                ConferenceRoom.created_by == user_id,
+                is_invited,
+                my_participation.id.is_not(None),
+                ConferenceRoom.group_id.in_(my_group_ids),
+                ConferenceRoom.project_id.in_(my_project_ids),
+            ),
+            # Созвоны задач видны только исполнителям и участникам группы задачи
+            or_(
+                ~is_task_room,
+                is_task_assignee,
+                Task.group_id.in_(my_group_ids),
+            ),
+        )
+        is_moderator = or_(
+            ConferenceRoom.created_by == user_id,
+            and_(
+                ConferenceRoom.room_type == ConferenceRoomType.GROUP,
+                ConferenceRoom.group_id.in_(my_admin_group_ids),
+            ),
+            and_(
+                ConferenceRoom.room_type == ConferenceRoomType.PROJECT,
+                ConferenceRoom.project_id.in_(my_admin_project_ids),
+            ),
+            and_(
+                is_task_room,
+                or_(is_task_assignee, Task.group_id.in_(my_admin_group_ids)),
+            ),
+        )
 
-        stmt = select(ConferenceRoom).options(
-            selectinload(ConferenceRoom.creator),
-            selectinload(ConferenceRoom.group),
-            selectinload(ConferenceRoom.project),
-            selectinload(ConferenceRoom.task),
-            selectinload(ConferenceRoom.invited_users),
-            selectinload(ConferenceRoom.participants).selectinload(ConferenceParticipant.user),
-            selectinload(ConferenceRoom.stats),
-        ).where(or_(*conditions))
+        stmt = (
+            select(
+                ConferenceRoom,
+                active_participants_count.label("participants_count"),
+                is_moderator.label("is_moderator"),
+                my_participation.kicked_at,
+                my_participation.kicked_until,
+                my_participation.kick_reason,
+            )
+            # Создатель подгружается из того же JOIN: ленивой загрузки под AsyncSession быть не должно
+            .join(ConferenceRoom.creator)
+            .options(contains_eager(ConferenceRoom.creator))
+            .outerjoin(Task, Task.id == ConferenceRoom.task_id)
+            .outerjoin(
+                my_participation,
+                and_(
+                    my_participation.room_id == ConferenceRoom.id,
+                    my_participation.user_id == user_id,
+                ),
+            )
+            .where(is_visible)
+        )
 
         if status == "active":
             stmt = stmt.where(ConferenceRoom.is_active == True)
@@ -409,20 +534,27 @@ class ConferenceService:
         stmt = stmt.order_by(ConferenceRoom.started_at.desc().nullslast(), ConferenceRoom.created_at.desc())
 
         result = await self.session.execute(stmt)
-        rooms = result.scalars().unique().all()
+        now = datetime.now(timezone.utc)
+        summaries = []
 
-        filtered_rooms = []
-        for room in rooms:
-            if room.room_type == ConferenceRoomType.TASK:
-                if room.task_id and await self._can_access_task(user_id, room.task_id):
-                    filtered_rooms.append(room)
-            else:
-                filtered_rooms.append(room)
+        for room, participants_count, room_is_moderator, kicked_at, kicked_until, kick_reason in result.all():
+            kicked_until = _ensure_aware_utc(kicked_until)
+            is_kicked = bool(kicked_until and kicked_until > now)
 
-        return filtered_rooms
+            summary = ConferenceRoomWithDetails.model_validate(room)
+            summary.participants_count = participants_count
+            summary.is_moderator = bool(room_is_moderator)
+            summary.current_user_can_join = not is_kicked
+            summary.is_current_user_kicked = is_kicked
+            summary.current_user_kicked_at = _ensure_aware_utc(kicked_at) if is_kicked else None
+            summary.current_user_kicked_until = kicked_until if is_kicked else None
+            summary.current_user_kick_reason = kick_reason if is_kicked else None
+            summaries.append(summary)
+
+        return summaries
 
     async def join_room(self, room_id: int, user_id: int) -> tuple[Optional[ConferenceRoom], Optional[str]]:
-        room = await self.get_room_by_id(room_id)
+        room = await self._get_room_with_active_participants(room_id, user_id)
         if not room or not room.is_active:
             self.logger.warning(f"Room {room_id} not found or inactive")
             return None, None
@@ -477,9 +609,16 @@ class ConferenceService:
                 self.session.add(participant)
 
             await self.session.commit()
-            room = await self.get_room_by_id(room_id)
+            await conference_presence.joined(room_id, user_id)
 
         user = await self.session.get(User, user_id)
+
+        if not existing_active:
+            await self._broadcast_room_event(room_id, "conference_participant_joined", {
+                "user_id": user_id,
+                "user_name": user.name or user.login,
+            })
+
         is_moderator = await self._is_room_moderator(user_id, room)
         token = livekit_token.generate_token(
             room_name=room.room_name,
@@ -490,26 +629,89 @@ class ConferenceService:
 
         return room, token
 
-    async def save_message(self, room_id: int, user_id: int, message_text: str) -> Optional[ConferenceMessage]:
-        room = await self.get_room_by_id(room_id)
-        if not room or not room.is_active:
-            return None
+    async def _broadcast_room_event(self, room_id: int, event_type: str, data: dict) -> None:
+        """Рассылка события подписанным на созвон WebSocket-соединениям; ошибки не прерывают операцию."""
+        try:
+            await manager.send_to_room(room_id, {
+                "type": event_type,
+                "room_id": room_id,
+                "data": data,
+            })
+        except Exception as e:
+            self.logger.error(f"Error broadcasting {event_type} to room {room_id}: {e}", exc_info=True)
 
-        if not await self.can_join_conference(user_id, room):
-            return None
+    async def can_use_room_chat(self, room_id: int, user_id: int) -> bool:
+        # Быстрый путь: пользователь уже прошёл проверку и лежит в кэшированном ростере комнаты
+        if conference_chat_buffer.is_available and await conference_chat_buffer.is_in_roster(room_id, user_id):
+            return True
+
+        room = await self._get_room_for_access(room_id)
+        if not room or not room.is_active or not await self.can_join_conference(user_id, room):
+            return False
 
+        if conference_chat_buffer.is_available:
+            await conference_chat_buffer.add_to_roster(room_id, user_id)
+
+        return True
+
+    async def can_subscribe_room(self, room_id: int, user_id: int) -> bool:
+        """Живая лента созвона доступна только активному участнику, которого не исключили."""
+        now = datetime.now(timezone.utc)
+        participant_id = await self.session.scalar(
+            select(ConferenceParticipant.id)
+            .join(ConferenceRoom, ConferenceRoom.id == ConferenceParticipant.room_id)
+            .where(
+                ConferenceParticipant.room_id == room_id,
+                ConferenceParticipant.user_id == user_id,
+                ConferenceParticipant.left_at.is_(None),
+                or_(ConferenceParticipant.kicked_until.is_(None), ConferenceParticipant.kicked_until <= now),
+                ConferenceRoom.is_active.is_(True),
+            )
+        )
+        if participant_id is None:
+            return False
+
+        if conference_chat_buffer.is_available:
+            await conference_chat_buffer.add_to_roster(room_id, user_id)
+
+        return True
+
+    async def save_message(
+        self,
+        room_id: int,
+        user_id: int,
+        message_text: str,
+        user_name: Optional[str] = None,
+    ) -> Optional[ConferenceMessageResponse]:
         text = message_text.strip()
         if not text:
             return None
 
-        message = ConferenceMessage(room_id=room_id, user_id=user_id, message=text)
-        self.session.add(message)
-        await self.session.commit()
-        await self.session.refresh(message)
+        if not await self.can_use_room_chat(room_id, user_id):
+            return None
 
-        stmt = select(ConferenceMessage).options(selectinload(ConferenceMessage.user)).where(ConferenceMessage.id == message.id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+        if user_name is None:
+            user = await self.session.get(User, user_id)
+            user_name = (user.name or user.login) if user else "Неизвестный"
+
+        if conference_chat_buffer.is_available:
+            response = await conference_chat_buffer.append(room_id, user_id, user_name, text)
+        else:
+            message = ConferenceMessage(room_id=room_id, user_id=user_id, message=text)
+            self.session.add(message)
+            await self.session.commit()
+            await self.session.refresh(message)
+
+            response = ConferenceMessageResponse(
+                id=message.id,
+                user_id=message.user_id,
+                user_name=user_name,
+                message=message.message,
+                created_at=message.created_at,
+            )
+
+        await self._broadcast_room_event(room_id, "conference_message", response.model_dump(mode="json"))
+        return response
 
     async def get_room_messages(
         self,
@@ -517,26 +719,66 @@ class ConferenceService:
         user_id: int,
         limit: int = 50,
         before_id: Optional[int] = None,
-    ) -> List[ConferenceMessage]:
-        room = await self.get_room_by_id(room_id)
+    ) -> List[ConferenceMessageResponse]:
+        room = await self._get_room_for_access(room_id)
         if not room or not await self.can_join_conference(user_id, room):
             return []
 
-        stmt = select(ConferenceMessage).options(selectinload(ConferenceMessage.user)).where(
-            ConferenceMessage.room_id == room_id
-        )
+        unflushed: List[ConferenceMessageResponse] = []
+        if conference_chat_buffer.is_available:
+            unflushed = await conference_chat_buffer.get_unflushed_messages(room_id)
 
+        # Блоки ID у воркеров чередуются, поэтому порядок и курсор — по (created_at, id)
+        before = None
         if before_id:
-            stmt = stmt.where(ConferenceMessage.id < before_id)
+            before_created_at = await self.session.scalar(
+                select(ConferenceMessage.created_at).where(
+                    ConferenceMessage.id == before_id,
+                    ConferenceMessage.room_id == room_id,
+                )
+            )
+            if before_created_at is None:
+                before_created_at = next(
+                    (message.created_at for message in unflushed if message.id == before_id),
+                    None,
+                )
+            if before_created_at is None:
+                return []
+            before = (before_created_at, before_id)
+
+        stmt = (
+            select(ConferenceMessage, User.name)
+            .outerjoin(User, User.id == ConferenceMessage.user_id)
+            .where(ConferenceMessage.room_id == room_id)
+        )
 
-        stmt = stmt.order_by(ConferenceMessage.created_at.desc()).limit(limit)
+        if before:
+            stmt = stmt.where(tuple_(ConferenceMessage.created_at, ConferenceMessage.id) < before)
+
+        stmt = stmt.order_by(ConferenceMessage.created_at.desc(), ConferenceMessage.id.desc()).limit(limit)
 
         result = await self.session.execute(stmt)
-        messages = result.scalars().all()
-        return list(reversed(messages))
+        messages = {
+            message.id: ConferenceMessageResponse(
+                id=message.id,
+                user_id=message.user_id,
+                user_name=user_name or "Неизвестный",
+                message=message.message,
+                created_at=message.created_at,
+            )
+            for message, user_name in result.all()
+        }
+
+        # Ещё не записанные в БД сообщения из Redis stream дополняют страницу
+        for message in unflushed:
+            if before is None or (message.created_at, message.id) < before:
+                messages[message.id] = message
+
+        page = sorted(messages.values(), key=lambda message: (message.created_at, message.id), reverse=True)[:limit]
+        return list(reversed(page))
 
     async def get_leave_impact(self, room_id: int, user_id: int) -> dict:
-        room = await self.get_room_by_id(room_id)
+        room = await self._get_room_with_active_participants(room_id)
 
         if not room:
             return {
@@ -559,7 +801,7 @@ class ConferenceService:
         }
 
     async def leave_room(self, room_id: int, user_id: int, auto_end_if_last: bool = False) -> bool:
-        room = await self.get_room_by_id(room_id)
+        room = await self._get_room_with_active_participants(room_id)
         if not room:
             return False
 
@@ -569,6 +811,7 @@ class ConferenceService:
         )
 
         if not participant:
+            await conference_chat_buffer.remove_from_roster(room.id, user_id)
             return True
 
         active_count_before_leave = len([item for item in room.participants if item.left_at is None])
@@ -579,12 +822,16 @@ class ConferenceService:
 
         participant.left_at = datetime.now(timezone.utc)
 
+        manager.unsubscribe_room(room.id, user_id)
+        await conference_presence.left(room.id, user_id)
+
         if is_last_participant and room.is_active:
-            room.is_active = False
-            room.ended_at = participant.left_at
-            await self._collect_room_stats(room)
+            await self._finish_room(room, participant.left_at)
+            return True
 
         await self.session.commit()
+        await conference_chat_buffer.remove_from_roster(room.id, user_id)
+        await self._broadcast_room_event(room.id, "conference_participant_left", {"user_id": user_id})
 
         if is_last_participant:
             asyncio.create_task(self._delete_livekit_room_async(room.room_name))
@@ -599,7 +846,7 @@ class ConferenceService:
         duration_minutes: int = DEFAULT_KICK_DURATION_MINUTES,
         reason: Optional[str] = None,
     ) -> Optional[ConferenceParticipant]:
-        room = await self.get_room_by_id(room_id)
+        room = await self._get_room_with_active_participants(room_id)
         if not room or not room.is_active:
             return None
 
@@ -644,13 +891,23 @@ class ConferenceService:
         await self.session.commit()
         await self.session.refresh(participant)
 
+        await conference_chat_buffer.remove_from_roster(room_id, target_user_id)
+        await conference_presence.left(room_id, target_user_id)
+        await self._broadcast_room_event(room_id, "conference_participant_kicked", {
+            "user_id": target_user_id,
+            "kicked_by_id": moderator_id,
+            "kicked_until": _ensure_aware_utc(kicked_until).isoformat(),
+            "reason": participant.kick_reason,
+        })
+        manager.unsubscribe_room(room_id, target_user_id)
+
         self.logger.info(
             f"User {target_user_id} was kicked from room {room_id} by {moderator_id} until {kicked_until}"
         )
         return participant
 
     async def end_conference(self, room_id: int, user_id: int) -> bool:
-        room = await self.get_room_by_id(room_id)
+        room = await self._get_room_with_active_participants(room_id)
         if not room:
             return False
 
@@ -661,23 +918,63 @@ class ConferenceService:
         if not room.is_active:
             return True
 
-        now = datetime.now(timezone.utc)
+        await self._finish_room(room, datetime.now(timezone.utc), ended_by=user_id)
+        return True
+
+    async def _finish_room(
+        self,
+        room: ConferenceRoom,
+        ended_at: datetime,
+        ended_by: Optional[int] = None,
+        delete_livekit_room: bool = True,
+    ) -> None:
+        """Завершение созвона: закрытие участий, финальная запись чата и статистики, оповещение клиентов.
+
+        Комната должна быть загружена с активными участниками.
+        """
         room.is_active = False
-        room.ended_at = now
+        room.ended_at = ended_at
+        # Без ростера проверка доступа к чату идёт через БД и видит, что комната закрыта
+        await conference_chat_buffer.discard_roster(room.id)
 
         for participant in room.participants:
             if participant.left_at is None:
-                participant.left_at = now
+                participant.left_at = ended_at
 
+        chat_flushed = await conference_chat_buffer.try_flush_room(room.id)
         await self._collect_room_stats(room)
+        self._emit_conference_analytics(room, ended_at, ended_by)
         await self.session.commit()
 
-        asyncio.create_task(self._delete_livekit_room_async(room.room_name))
-        return True
+        if chat_flushed:
+            await conference_chat_buffer.discard_flushed_room(room.id)
+        await conference_presence.discard_room(room.id)
+
+        await self._broadcast_room_event(room.id, "conference_ended", {"ended_by": ended_by})
+        manager.close_room(room.id)
+
+        if delete_livekit_room:
+            asyncio.create_task(self._delete_livekit_room_async(room.room_name))
+
+    def _emit_conference_analytics(self, room: ConferenceRoom, ended_at: datetime, ended_by: Optional[int]) -> None:
+        if not room.started_at:
+            return
+
+        analytics_publisher.emit(
+            self.session,
+            event_type="conference_ended",
+            user_id=ended_by or room.created_by,
+            project_id=room.project_id,
+            group_id=room.group_id,
+            task_id=room.task_id,
+            metadata={
+                "room_id": room.id,
+                "duration_seconds": max(int((ended_at - room.started_at).total_seconds()), 0),
+            },
+        )
 
     async def _delete_livekit_room_async(self, room_name: str):
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, livekit_token.delete_room, room_name)
+        await livekit_client.delete_room(room_name)
 
     async def _collect_room_stats(self, room: ConferenceRoom):
         if not room.started_at:
@@ -702,9 +999,32 @@ class ConferenceService:
         messages_result = await self.session.execute(messages_stmt)
         messages_count = messages_result.scalar() or 0
 
+        # Пик и ряд берутся из живых счётчиков; без них (Redis недоступен, старые комнаты)
+        # пиком остаётся число участников за всё время
+        presence = await conference_presence.get_room_presence(room.id)
+        if presence:
+            _, peak_participants, samples, trimmed = presence
+            average_participants, timeline = summarize_timeline(
+                samples,
+                _ensure_aware_utc(room.started_at),
+                _ensure_aware_utc(end_time),
+                conference_presence.timeline_points,
+                trimmed,
+            )
+        elif existing_stats:
+            peak_participants = max(existing_stats.peak_participants or 0, participant_count)
+            average_participants = existing_stats.average_participants
+            timeline = existing_stats.timeline
+        else:
+            peak_participants = participant_count
+            average_participants = None
+            timeline = None
+
         if existing_stats:
             existing_stats.participant_count = participant_count
-            existing_stats.peak_participants = max(existing_stats.peak_participants or 0, participant_count)
+            existing_stats.peak_participants = peak_participants
+            existing_stats.average_participants = average_participants
+            existing_stats.timeline = timeline
             existing_stats.duration_seconds = duration
             existing_stats.messages_count = messages_count
             return
@@ -712,7 +1032,9 @@ class ConferenceService:
         stats = ConferenceStats(
             room_id=room.id,
             participant_count=participant_count,
-            peak_participants=participant_count,
+            peak_participants=peak_participants,
+            average_participants=average_participants,
+            timeline=timeline,
             duration_seconds=duration,
             messages_count=messages_count,
         )
@@ -781,11 +1103,8 @@ class ConferenceService:
         status: str,
         *scope_conditions,
     ) -> List[ConferenceRoom]:
-        stmt = select(ConferenceRoom).options(
-            selectinload(ConferenceRoom.creator),
-            selectinload(ConferenceRoom.participants),
-            selectinload(ConferenceRoom.stats),
-        ).where(*scope_conditions)
+        # Ответ содержит только поля комнаты, связи не загружаем
+        stmt = select(ConferenceRoom).where(*scope_conditions)
 
         if status == "active":
             stmt = stmt.where(ConferenceRoom.is_active == True)
@@ -812,61 +1131,78 @@ class ConferenceService:
         return await self._get_rooms_by_scope(user_id, status, ConferenceRoom.task_id == task_id)
 
     async def get_room_stats(self, room_id: int, user_id: int) -> Optional[ConferenceStats]:
-        room = await self.get_room_by_id(room_id)
+        room = await self._get_room_for_access(room_id)
         if not room:
             return None
 
         if not await self.can_join_conference(user_id, room):
             return None
 
-        if not room.stats and not room.is_active:
-            await self._collect_room_stats(room)
-            await self.session.commit()
-            room = await self.get_room_by_id(room_id)
-
         stmt = select(ConferenceStats).where(
             ConferenceStats.room_id == room_id
         ).order_by(ConferenceStats.created_at.desc()).limit(1)
 
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        stats = (await self.session.execute(stmt)).scalar_one_or_none()
 
-    async def get_invitable_users_for_user(
-        self,
-        user_id: int,
-        query: Optional[str] = None,
-        limit: int = 30,
-    ) -> List[User]:
-        user_group_ids = await self._get_user_group_ids(user_id)
+        if not stats and not room.is_active:
+            await self._collect_room_stats(room)
+            await self.session.commit()
+            stats = (await self.session.execute(stmt)).scalar_one_or_none()
 
-        if not user_group_ids:
-            return []
-        
-        user_ids_subquery = (
-            select(GroupMember.user_id)
-            .where(
-                GroupMember.group_id.in_(user_group_ids),
-                GroupMember.user_id != user_id,
-            )
-            .distinct()
-        )
+        return stats
 
-        stmt = (
-            select(User)
-            .where(User.id.in_(user_ids_subquery))
-            .order_by(User.login.asc())
-            .limit(limit)
-        )
+    async def get_room_timeline(self, room_id: int, user_id: int) -> Optional[ConferenceTimelineResponse]:
+        """Пик, среднее и прореженный ряд участников: для идущего созвона из Redis, для завершённого из ConferenceStats."""
+        room = await self._get_room_for_access(room_id)
+        if not room or not await self.can_join_conference(user_id, room):
+            return None
 
-        if query:
-            pattern = f"%{query.strip()}%"
-            stmt = stmt.where(
-                or_(
-                    User.login.ilike(pattern),
-                    User.email.ilike(pattern),
-                    User.name.ilike(pattern),
+        if room.is_active:
+            current, peak, samples, trimmed = await conference_presence.get_room_presence(room.id) or (0, 0, [], None)
+            average, timeline = (0.0, [])
+            if room.started_at:
+                average, timeline = summarize_timeline(
+                    samples,
+                    _ensure_aware_utc(room.started_at),
+                    datetime.now(timezone.utc),
+                    conference_presence.timeline_points,
+                    trimmed,
                 )
+
+            return ConferenceTimelineResponse(
+                room_id=room.id,
+                is_active=True,
+                current_participants=current,
+                peak_participants=peak,
+                average_participants=average,
+                timeline=timeline,
             )
 
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
\ No newline at end of file
+        stats_stmt = select(
+            ConferenceStats.peak_participants,
+            ConferenceStats.average_participants,
+            ConferenceStats.timeline,
+        ).where(ConferenceStats.room_id == room_id).order_by(ConferenceStats.created_at.desc()).limit(1)
+        stats = (await self.session.execute(stats_stmt)).first()
+
+        if not stats:
+            return ConferenceTimelineResponse(room_id=room.id, is_active=False)
+
+        peak, average, timeline = stats
+        return ConferenceTimelineResponse(
+            room_id=room.id,
+            is_active=False,
+            peak_participants=peak or 0,
+            average_participants=average or 0.0,
+            timeline=timeline or [],
+        )
+
+    async def get_invitable_users_for_user(
+        self,
+        user_id: int,
+        query: Optional[str] = None,
+        limit: int = 30,
+    ) -> List[UserAutocompleteItem]:
+        # Тот же поиск, что и автодополнение: триграммные индексы и кэш кандидатов на пользователя
+        autocomplete_service = UserAutocompleteService(self.session, self.service_factory)
+        return await autocomplete_service.autocomplete(user_id, q=query, limit=limit, exclude_self=True)
\ No newline at end of file
@@ -0,0 +1,18 @@
+from fastapi import HTTPException, status
+from typing import Optional
+
+class DeletionJobException(HTTPException):
+    def __init__(self, status_code: int, detail: str, headers: Optional[dict] = None):
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
+
+class DeletionJobNotFoundError(DeletionJobException):
+    def __init__(self, job_id: Optional[int] = None):
+        if job_id:
+            detail = f"Задача удаления с ID {job_id} не найдена"
+        else:
+            detail = "Задача удаления не найдена"
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+class DeletionJobAccessDeniedError(DeletionJobException):
+    def __init__(self, detail: str = "Нет доступа к задаче удаления"):
+        super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from core.database.models import User
+from core.services import ServiceFactory
+from core.logger import logger
+from modules.auth.dependencies import get_current_user
+from shared.dependencies import get_service_factory
+from .exceptions import DeletionJobNotFoundError, DeletionJobAccessDeniedError
+from .schemas import DeletionJobRead
+
+router = APIRouter(dependencies=[Depends(get_current_user)])
+
+
+# Получить прогресс фонового удаления
+@router.get("/{job_id}", response_model=DeletionJobRead)
+async def get_deletion_job(
+    job_id: int,
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+):
+    logger.info(f"GET /deletion-jobs/{job_id} by user {current_user.id}")
+    deletion_service = service_factory.get('deletion')
+
+    try:
+        return await deletion_service.get_job(job_id, current_user)
+    except (DeletionJobNotFoundError, DeletionJobAccessDeniedError) as e:
+        logger.error(f"Error getting deletion job {job_id}: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
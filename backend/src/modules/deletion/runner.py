@@ -0,0 +1,262 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.database.models import (
+    ConferenceRoom,
+    DeletionJob,
+    DeletionJobStatus,
+    Group,
+    GroupInvitation,
+    GroupMember,
+    Project,
+    Task,
+    project_group_association,
+)
+from core.database.session import db_session
+from core.logger import logger
+
+Stage = Tuple[str, Callable[[AsyncSession], Awaitable[int]], bool]
+
+
+class DeletionJobRunner:
+    """Фоновое удаление групп и проектов пакетами по batch_size строк на транзакцию."""
+
+    def __init__(self, batch_size: int, stale_after_seconds: int):
+        self.batch_size = batch_size
+        self.stale_after = timedelta(seconds=stale_after_seconds)
+        self.logger = logger
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._watcher: Optional[asyncio.Task] = None
+
+    def start(self, job_id: int) -> None:
+        existing = self._tasks.get(job_id)
+        if existing and not existing.done():
+            return
+
+        task = asyncio.create_task(self._run(job_id))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job_id, None))
+
+    async def resume_pending(self) -> None:
+        async with db_session.session_factory() as session:
+            stmt = (
+                select(DeletionJob.id)
+                .where(DeletionJob.status.in_([DeletionJobStatus.PENDING, DeletionJobStatus.RUNNING]))
+                .order_by(DeletionJob.id)
+            )
+            job_ids = [row[0] for row in (await session.execute(stmt)).all()]
+
+        for job_id in job_ids:
+            self.start(job_id)
+
+        if job_ids:
+            self.logger.info(f"Resuming {len(job_ids)} deletion jobs")
+
+    async def start_watcher(self) -> None:
+        await self.resume_pending()
+        self._watcher = asyncio.create_task(self._watch())
+
+    async def stop(self) -> None:
+        tasks = list(self._tasks.values())
+        if self._watcher:
+            tasks.append(self._watcher)
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._watcher = None
+
+    async def _watch(self) -> None:
+        # Подхватывает задачи, брошенные упавшими воркерами, после истечения heartbeat
+        while True:
+            await asyncio.sleep(self.stale_after.total_seconds() / 2)
+            try:
+                await self.resume_pending()
+            except Exception as e:
+                self.logger.error(f"Error resuming deletion jobs: {e}", exc_info=True)
+
+    async def _claim(self, job_id: int) -> Optional[Tuple[str, int, Optional[int]]]:
+        now = datetime.now(timezone.utc)
+
+        async with db_session.session_factory() as session:
+            stmt = (
+                update(DeletionJob)
+                .where(
+                    DeletionJob.id == job_id,
+                    or_(
+                        DeletionJob.status == DeletionJobStatus.PENDING,
+                        and_(
+                            DeletionJob.status == DeletionJobStatus.RUNNING,
+                            or_(
+                                DeletionJob.heartbeat_at.is_(None),
+                                DeletionJob.heartbeat_at < now - self.stale_after,
+                            ),
+                        ),
+                    ),
+                )
+                .values(status=DeletionJobStatus.RUNNING, heartbeat_at=now)
+                .returning(DeletionJob.entity_type, DeletionJob.entity_id, DeletionJob.requested_by_id)
+            )
+            row = (await session.execute(stmt)).first()
+            await session.commit()
+
+        return tuple(row) if row else None
+
+    async def _run(self, job_id: int) -> None:
+        claimed = await self._claim(job_id)
+        if not claimed:
+            return
+
+        entity_type, entity_id, requested_by_id = claimed
+        spawned_job_ids: List[int] = []
+        stages = self._build_stages(entity_type, entity_id, requested_by_id, spawned_job_ids)
+
+        self.logger.info(f"Deletion job {job_id} started for {entity_type} {entity_id}")
+
+        try:
+            for stage_name, stage, batched in stages:
+                while True:
+                    async with db_session.session_factory() as session:
+                        processed = await stage(session)
+                        await session.execute(
+                            update(DeletionJob)
+                            .where(DeletionJob.id == job_id)
+                            .values(
+                                stage=stage_name,
+                                processed_rows=DeletionJob.processed_rows + processed,
+                                heartbeat_at=datetime.now(timezone.utc),
+                            )
+                        )
+                        await session.commit()
+
+                    for spawned_job_id in spawned_job_ids:
+                        self.start(spawned_job_id)
+                    spawned_job_ids.clear()
+
+                    if not batched or processed < self.batch_size:
+                        break
+
+                    await asyncio.sleep(0)
+
+            await self._finish(job_id, DeletionJobStatus.COMPLETED)
+            self.logger.info(f"Deletion job {job_id} completed for {entity_type} {entity_id}")
+
+        except Exception as e:
+            self.logger.error(f"Deletion job {job_id} failed: {e}", exc_info=True)
+            await self._finish(job_id, DeletionJobStatus.FAILED, error=str(e))
+
+    async def _finish(self, job_id: int, status: DeletionJobStatus, error: Optional[str] = None) -> None:
+        async with db_session.session_factory() as session:
+            await session.execute(
+                update(DeletionJob)
+                .where(DeletionJob.id == job_id)
+                .values(status=status, error=error, finished_at=datetime.now(timezone.utc))
+            )
+            await session.commit()
+
+    def _build_stages(
+        self,
+        entity_type: str,
+        entity_id: int,
+        requested_by_id: Optional[int],
+        spawned_job_ids: List[int],
+    ) -> List[Stage]:
+        if entity_type == "group":
+            return [
+                ("tasks", partial(self._purge_tasks_batch, Task.group_id == entity_id), True),
+                ("conferences", partial(self._delete_batch, ConferenceRoom, ConferenceRoom.group_id == entity_id), True),
+                ("invitations", partial(self._delete_batch, GroupInvitation, GroupInvitation.group_id == entity_id), True),
+                ("members", partial(self._delete_batch, GroupMember, GroupMember.group_id == entity_id), True),
+                ("projects", partial(self._detach_group_projects, entity_id, requested_by_id, spawned_job_ids), False),
+                ("group", partial(self._delete_batch, Group, Group.id == entity_id), False),
+            ]
+
+        if entity_type == "project":
+            return [
+                ("tasks", partial(self._purge_tasks_batch, Task.project_id == entity_id), True),
+                ("conferences", partial(self._delete_batch, ConferenceRoom, ConferenceRoom.project_id == entity_id), True),
+                ("groups", partial(self._delete_project_links, entity_id), False),
+                ("project", partial(self._delete_batch, Project, Project.id == entity_id), False),
+            ]
+
+        raise ValueError(f"Unknown deletion entity type: {entity_type}")
+
+    async def _delete_batch(self, model, condition, session: AsyncSession) -> int:
+        batch_ids = select(model.id).where(condition).limit(self.batch_size).scalar_subquery()
+        result = await session.execute(
+            delete(model)
+            .where(model.id.in_(batch_ids))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def _purge_tasks_batch(self, condition, session: AsyncSession) -> int:
+        from modules.tasks.service import TaskService
+
+        ids_stmt = select(Task.id).where(condition).limit(self.batch_size)
+        task_ids = [row[0] for row in (await session.execute(ids_stmt)).all()]
+        return await TaskService(session).purge_tasks(task_ids)
+
+    async def _delete_project_links(self, project_id: int, session: AsyncSession) -> int:
+        result = await session.execute(
+            delete(project_group_association).where(project_group_association.c.project_id == project_id)
+        )
+        return result.rowcount
+
+    async def _detach_group_projects(
+        self,
+        group_id: int,
+        requested_by_id: Optional[int],
+        spawned_job_ids: List[int],
+        session: AsyncSession,
+    ) -> int:
+        other_links = project_group_association.alias()
+        linked_project_ids = select(project_group_association.c.project_id).where(
+            project_group_association.c.group_id == group_id
+        )
+        owned_by_other_groups = (
+            select(other_links.c.project_id)
+            .join(Group, Group.id == other_links.c.group_id)
+            .where(other_links.c.group_id != group_id, Group.deleting_at.is_(None))
+        )
+
+        # Проекты, у которых не остаётся живых групп, удаляются отдельными задачами
+        orphan_stmt = (
+            update(Project)
+            .where(
+                Project.id.in_(linked_project_ids),
+                Project.id.not_in(owned_by_other_groups),
+                Project.deleting_at.is_(None),
+            )
+            .values(deleting_at=datetime.now(timezone.utc))
+            .returning(Project.id)
+            .execution_options(synchronize_session=False)
+        )
+        orphan_project_ids = [row[0] for row in (await session.execute(orphan_stmt)).all()]
+
+        jobs = [
+            DeletionJob(entity_type="project", entity_id=project_id, requested_by_id=requested_by_id)
+            for project_id in orphan_project_ids
+        ]
+        session.add_all(jobs)
+        await session.flush()
+        spawned_job_ids.extend(job.id for job in jobs)
+
+        links_result = await session.execute(
+            delete(project_group_association).where(project_group_association.c.group_id == group_id)
+        )
+        return links_result.rowcount
+
+
+deletion_runner = DeletionJobRunner(
+    batch_size=settings.deletion.batch_size,
+    stale_after_seconds=settings.deletion.stale_after_seconds,
+)
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from typing import Optional
+
+from core.database.models import DeletionJobStatus
+
+
+class DeletionJobRead(BaseModel):
+    id: int
+    entity_type: str
+    entity_id: int
+    status: DeletionJobStatus
+    stage: Optional[str] = None
+    processed_rows: int = 0
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
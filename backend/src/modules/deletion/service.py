@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+from typing import Optional, TYPE_CHECKING
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database.models import DeletionJob, DeletionJobStatus, Group, Project, User
+from core.logger import logger
+from shared.dependencies import is_global_admin_user
+from .exceptions import DeletionJobNotFoundError, DeletionJobAccessDeniedError
+
+if TYPE_CHECKING:
+    from core.services import ServiceFactory
+
+
+class DeletionService:
+    def __init__(self, session: AsyncSession, service_factory: Optional['ServiceFactory'] = None):
+        self.session = session
+        self.logger = logger
+        self.service_factory = service_factory
+
+    async def _get_latest_job(self, entity_type: str, entity_id: int) -> Optional[DeletionJob]:
+        stmt = (
+            select(DeletionJob)
+            .where(DeletionJob.entity_type == entity_type, DeletionJob.entity_id == entity_id)
+            .order_by(DeletionJob.id.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def _schedule(
+        self,
+        model,
+        entity_type: str,
+        entity_id: int,
+        requested_by_id: Optional[int],
+    ) -> Optional[DeletionJob]:
+        mark_stmt = (
+            update(model)
+            .where(model.id == entity_id, model.deleting_at.is_(None))
+            .values(deleting_at=datetime.now(timezone.utc))
+            .returning(model.id)
+            .execution_options(synchronize_session=False)
+        )
+        marked = (await self.session.execute(mark_stmt)).scalar_one_or_none()
+
+        if marked is None:
+            # Сущность уже скрыта: возвращаем существующую задачу, упавшую — перезапускаем
+            job = await self._get_latest_job(entity_type, entity_id)
+            if job and job.status == DeletionJobStatus.FAILED:
+                job.status = DeletionJobStatus.PENDING
+                job.error = None
+                job.finished_at = None
+                self.logger.info(f"Retrying failed deletion job {job.id} for {entity_type} {entity_id}")
+            return job
+
+        job = DeletionJob(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            requested_by_id=requested_by_id,
+        )
+        self.session.add(job)
+        await self.session.flush()
+
+        self.logger.info(f"Scheduled deletion job {job.id} for {entity_type} {entity_id}")
+        return job
+
+    async def schedule_group_deletion(
+        self,
+        group_id: int,
+        requested_by_id: Optional[int] = None,
+    ) -> Optional[DeletionJob]:
+        return await self._schedule(Group, "group", group_id, requested_by_id)
+
+    async def schedule_project_deletion(
+        self,
+        project_id: int,
+        requested_by_id: Optional[int] = None,
+    ) -> Optional[DeletionJob]:
+        return await self._schedule(Project, "project", project_id, requested_by_id)
+
+    async def get_job(self, job_id: int, current_user: User) -> DeletionJob:
+        job = await self.session.get(DeletionJob, job_id)
+
+        if not job:
+            raise DeletionJobNotFoundError(job_id)
+
+        if job.requested_by_id != current_user.id and not is_global_admin_user(current_user):
+            raise DeletionJobAccessDeniedError()
+
+        return job
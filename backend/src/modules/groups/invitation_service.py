@@ -1,7 +1,7 @@
 import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -238,19 +238,33 @@ class GroupInvitationService:
         result = await self.session.execute(stmt)
         return result.scalars().all()
     
-    async def cleanup_expired_invitations(self) -> int:
-        stmt = select(GroupInvitation).where(
-            and_(
-                GroupInvitation.status == "pending",
-                GroupInvitation.expires_at < datetime.now(timezone.utc)
+    async def cleanup_expired_invitations(self, batch_size: int = 1000) -> int:
+        """Перевод просроченных приглашений в expired пачками по batch_size строк."""
+        now = datetime.now(timezone.utc)
+        expired_total = 0
+
+        while True:
+            expired = (
+                select(GroupInvitation.id)
+                .where(
+                    and_(
+                        GroupInvitation.status == "pending",
+                        GroupInvitation.expires_at < now
+                    )
+                )
+                .limit(batch_size)
+                .scalar_subquery()
             )
-        )
-        result = await self.session.execute(stmt)
-        expired = result.scalars().all()
-        
-        for invitation in expired:
-            invitation.status = "expired"
-        
-        await self.session.commit()
-        self.logger.info(f"Cleaned up {len(expired)} expired invitations")
-        return len(expired)
+            result = await self.session.execute(
+                update(GroupInvitation)
+                .where(GroupInvitation.id.in_(expired))
+                .values(status="expired")
+            )
+            await self.session.commit()
+
+            expired_total += result.rowcount
+            if result.rowcount < batch_size:
+                break
+
+        self.logger.info(f"Cleaned up {expired_total} expired invitations")
+        return expired_total
@@ -19,6 +19,7 @@ from .service import GroupService
 from .invitation_service import GroupInvitationService
 from .schemas import (
     GroupCreate, GroupRead, GroupUpdate, GroupReadWithRelations,
+    GroupSummaryRead, GroupMembersPage, GroupTasksPage,
     RemoveUsersFromGroup, InviteUserToGroup, PendingInvitation,
     AcceptInvitationResponse, DeclineInvitationResponse
 )
@@ -61,6 +62,30 @@ async def get_groups(
     return await group_service.get_user_groups(current_user.id)
 
 
+@router.get("/my/summary", response_model=list[GroupSummaryRead])
+async def get_groups_summary(
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user)
+):
+    logger.info(f"GET /groups/my/summary requested by user {current_user.id}")
+    group_service = service_factory.get('group')
+    return await group_service.get_user_group_summaries(current_user.id)
+
+
+async def _ensure_group_access(session: AsyncSession, current_user: User, group_id: int) -> None:
+    if is_global_admin_user(current_user):
+        return
+
+    if not await check_user_in_group(session, current_user.id, group_id):
+        logger.warning(
+            f"User {current_user.id} tried to access group {group_id} without membership"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Пользователь с ID {current_user.id} не состоит в группе {group_id}"
+        )
+
+
 @router.get("/{group_id}", response_model=GroupReadWithRelations)
 async def get_group(
     group_id: int,
@@ -92,6 +117,38 @@ async def get_group(
         )
 
 
+@router.get("/{group_id}/members", response_model=GroupMembersPage)
+async def get_group_members(
+    group_id: int,
+    after_id: Optional[int] = Query(None, ge=1, description="Курсор: ID последнего полученного участника"),
+    limit: int = Query(50, ge=1, le=200),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_session.session_getter)
+):
+    logger.info(f"GET /groups/{group_id}/members requested by user {current_user.id}")
+    await _ensure_group_access(session, current_user, group_id)
+
+    group_service = service_factory.get('group')
+    return await group_service.get_group_members_page(group_id, after_id=after_id, limit=limit)
+
+
+@router.get("/{group_id}/tasks", response_model=GroupTasksPage)
+async def get_group_tasks(
+    group_id: int,
+    before_id: Optional[int] = Query(None, ge=1, description="Курсор: ID последней полученной задачи"),
+    limit: int = Query(50, ge=1, le=200),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_session.session_getter)
+):
+    logger.info(f"GET /groups/{group_id}/tasks requested by user {current_user.id}")
+    await _ensure_group_access(session, current_user, group_id)
+
+    group_service = service_factory.get('group')
+    return await group_service.get_group_tasks_page(group_id, before_id=before_id, limit=limit)
+
+
 @router.get("/{group_id}/my_role", response_model=dict)
 async def get_my_role_in_group(
     group_id: int,
@@ -466,12 +523,12 @@ async def delete_group_by_id(
     group_service = service_factory.get('group')
     
     try:
-        deleted = await group_service.delete_group(group_id, current_user)
-        if not deleted:
+        job = await group_service.delete_group(group_id, current_user)
+        if not job:
             logger.warning(f"Group {group_id} not found for deletion")
             raise GroupNotFoundError(group_id=group_id)
-        logger.info(f"Group {group_id} deleted successfully")
-        return {"detail": "Группа успешно удалена"}
+        logger.info(f"Group {group_id} deletion started, job {job.id}")
+        return {"detail": "Группа удаляется", "job_id": job.id}
     except GroupNotFoundError as e:
         logger.error(f"Error deleting group {group_id}: {e.detail}")
         raise HTTPException(
@@ -3,7 +3,7 @@ from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from datetime import datetime
 from typing import Optional, List
 
-from shared.schemas import BaseUserWithRole, BaseProjectInfo
+from shared.schemas import BaseUserWithRole, BaseProjectInfo, BaseTaskInfo
 from core.database.models import UserRole
 
 class GroupCreate(BaseModel):
@@ -26,6 +26,20 @@ class GroupReadWithRelations(GroupRead):
     users: List[BaseUserWithRole] = []
     projects: List[BaseProjectInfo] = []
 
+class GroupSummaryRead(GroupRead):
+    my_role: UserRole
+    members_count: int = 0
+    projects_count: int = 0
+    tasks_count: int = 0
+
+class GroupMembersPage(BaseModel):
+    items: List[BaseUserWithRole] = []
+    next_cursor: Optional[int] = None
+
+class GroupTasksPage(BaseModel):
+    items: List[BaseTaskInfo] = []
+    next_cursor: Optional[int] = None
+
 class GetUserRoleResponse(BaseModel):
     role: str
     
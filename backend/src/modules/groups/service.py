@@ -1,9 +1,9 @@
 from typing import Optional, List, TYPE_CHECKING, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, and_
+from sqlalchemy import select, delete, and_, func
 from sqlalchemy.orm import selectinload
 
-from core.database.models import Group, User, GroupMember, UserRole, Task, project_group_association, task_user_association
+from core.database.models import DeletionJob, Group, User, GroupMember, UserRole, Task, project_group_association
 from shared.dependencies import (
     ensure_user_is_admin,
     get_user_group_role,
@@ -11,7 +11,18 @@ from shared.dependencies import (
     is_global_admin_user,
 )
 from core.logger import logger
-from .schemas import GetUserRoleResponse, RemoveUsersFromGroup, GroupCreate, GroupReadWithRelations, GroupUpdate
+from modules.deletion.runner import deletion_runner
+from shared.schemas import BaseTaskInfo, BaseUserWithRole
+from .schemas import (
+    GetUserRoleResponse,
+    RemoveUsersFromGroup,
+    GroupCreate,
+    GroupReadWithRelations,
+    GroupUpdate,
+    GroupSummaryRead,
+    GroupMembersPage,
+    GroupTasksPage,
+)
 from .exceptions import (
     GroupNotFoundError,
     GroupAlreadyExistsError,
@@ -26,6 +37,7 @@ from .exceptions import (
 if TYPE_CHECKING:
     from core.services import ServiceFactory
     from modules.projects.service import ProjectService
+    from modules.deletion.service import DeletionService
     from modules.notifications.service import NotificationTriggerService
 
 
@@ -35,6 +47,7 @@ class GroupService:
         self.logger = logger
         self.service_factory = service_factory
         self._project_service = None
+        self._deletion_service = None
         self._notification_trigger = None
     
     @property
@@ -44,6 +57,16 @@ class GroupService:
             self._project_service = self.service_factory.get_or_create('project', ProjectService)
         return self._project_service
     
+    @property
+    def deletion_service(self) -> 'DeletionService':
+        if self._deletion_service is None:
+            from modules.deletion.service import DeletionService
+            if self.service_factory:
+                self._deletion_service = self.service_factory.get_or_create('deletion', DeletionService)
+            else:
+                self._deletion_service = DeletionService(self.session)
+        return self._deletion_service
+    
     @property
     def notification_trigger(self) -> Optional['NotificationTriggerService']:
         if self._notification_trigger is None and self.service_factory:
@@ -53,7 +76,7 @@ class GroupService:
     async def get_all_groups(self, current_user_id: int) -> List[Group]:
         self.logger.info(f"Fetching all groups by global admin {current_user_id}")
         await ensure_global_admin_by_id(self.session, current_user_id)
-        stmt = select(Group).order_by(Group.id)
+        stmt = select(Group).where(Group.deleting_at.is_(None)).order_by(Group.id)
         result = await self.session.scalars(stmt)
         groups = result.all()
         self.logger.debug(f"Found {len(groups)} groups")
@@ -65,7 +88,7 @@ class GroupService:
             selectinload(Group.group_members).selectinload(GroupMember.user),
             selectinload(Group.projects),
             selectinload(Group.tasks)
-        ).where(Group.id == group_id)
+        ).where(Group.id == group_id, Group.deleting_at.is_(None))
 
         result = await self.session.execute(stmt)
         group = result.scalar_one_or_none()
@@ -87,9 +110,11 @@ class GroupService:
         self.logger.debug(f"Fetching groups for user {user_id}")
         stmt = select(Group).options(
             selectinload(Group.group_members).selectinload(GroupMember.user),
-            selectinload(Group.projects),
-            selectinload(Group.tasks)
-        ).join(Group.group_members).where(GroupMember.user_id == user_id).order_by(Group.id)
+            selectinload(Group.projects)
+        ).join(Group.group_members).where(
+            GroupMember.user_id == user_id,
+            Group.deleting_at.is_(None),
+        ).order_by(Group.id)
         
         result = await self.session.execute(stmt)
         groups = result.scalars().all()
@@ -104,6 +129,130 @@ class GroupService:
         self.logger.debug(f"Found {len(groups)} groups for user {user_id}")
         return groups
     
+    async def get_user_group_summaries(self, user_id: int) -> List[GroupSummaryRead]:
+        """Группы пользователя со счётчиками вместо вложенных коллекций."""
+        self.logger.debug(f"Fetching group summaries for user {user_id}")
+
+        my_groups = (
+            select(GroupMember.group_id, GroupMember.role)
+            .join(Group, Group.id == GroupMember.group_id)
+            .where(GroupMember.user_id == user_id, Group.deleting_at.is_(None))
+            .cte("my_groups")
+        )
+        members_counts = (
+            select(GroupMember.group_id, func.count().label("members_count"))
+            .where(GroupMember.group_id.in_(select(my_groups.c.group_id)))
+            .group_by(GroupMember.group_id)
+            .subquery()
+        )
+        projects_counts = (
+            select(
+                project_group_association.c.group_id,
+                func.count().label("projects_count"),
+            )
+            .where(project_group_association.c.group_id.in_(select(my_groups.c.group_id)))
+            .group_by(project_group_association.c.group_id)
+            .subquery()
+        )
+        tasks_counts = (
+            select(Task.group_id, func.count().label("tasks_count"))
+            .where(Task.group_id.in_(select(my_groups.c.group_id)))
+            .group_by(Task.group_id)
+            .subquery()
+        )
+
+        stmt = (
+            select(
+                Group,
+                my_groups.c.role,
+                func.coalesce(members_counts.c.members_count, 0),
+                func.coalesce(projects_counts.c.projects_count, 0),
+                func.coalesce(tasks_counts.c.tasks_count, 0),
+            )
+            .join(my_groups, my_groups.c.group_id == Group.id)
+            .outerjoin(members_counts, members_counts.c.group_id == Group.id)
+            .outerjoin(projects_counts, projects_counts.c.group_id == Group.id)
+            .outerjoin(tasks_counts, tasks_counts.c.group_id == Group.id)
+            .order_by(Group.id)
+        )
+        result = await self.session.execute(stmt)
+
+        summaries = [
+            GroupSummaryRead(
+                id=group.id,
+                name=group.name,
+                description=group.description,
+                created_at=group.created_at,
+                my_role=role,
+                members_count=members_count,
+                projects_count=projects_count,
+                tasks_count=tasks_count,
+            )
+            for group, role, members_count, projects_count, tasks_count in result.all()
+        ]
+
+        self.logger.debug(f"Found {len(summaries)} group summaries for user {user_id}")
+        return summaries
+
+    async def get_group_members_page(
+        self,
+        group_id: int,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> GroupMembersPage:
+        stmt = (
+            select(User, GroupMember.role)
+            .join(GroupMember, GroupMember.user_id == User.id)
+            .where(GroupMember.group_id == group_id)
+            .order_by(User.id)
+            .limit(limit + 1)
+        )
+        if after_id is not None:
+            stmt = stmt.where(User.id > after_id)
+
+        rows = (await self.session.execute(stmt)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        items = [
+            BaseUserWithRole(
+                id=user.id,
+                login=user.login,
+                email=user.email,
+                name=user.name,
+                role=role.value,
+            )
+            for user, role in rows
+        ]
+        return GroupMembersPage(
+            items=items,
+            next_cursor=items[-1].id if has_more else None,
+        )
+
+    async def get_group_tasks_page(
+        self,
+        group_id: int,
+        before_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> GroupTasksPage:
+        stmt = (
+            select(Task)
+            .where(Task.group_id == group_id)
+            .order_by(Task.id.desc())
+            .limit(limit + 1)
+        )
+        if before_id is not None:
+            stmt = stmt.where(Task.id < before_id)
+
+        tasks = (await self.session.scalars(stmt)).all()
+        has_more = len(tasks) > limit
+        tasks = tasks[:limit]
+
+        return GroupTasksPage(
+            items=[BaseTaskInfo.model_validate(task) for task in tasks],
+            next_cursor=tasks[-1].id if has_more else None,
+        )
+
     async def get_role_for_user_in_group(self, user_id: int, group_id: int) -> GetUserRoleResponse:
         self.logger.debug(f"Getting role for user {user_id} in group {group_id}")
 
@@ -317,6 +466,7 @@ class GroupService:
             
             group_deleted = False
             if not remaining_members:
+                recipient_ids = {user.id for user in users_to_remove}
                 await self.delete_group_auto(group_id)
                 self.logger.info(f"Group {group_id} auto-deleted as it became empty")
                 group_deleted = True
@@ -332,10 +482,12 @@ class GroupService:
                         removed_by=current_user
                     )
             
-            if group_deleted:
-                if self.notification_trigger:
-                    for user in users_to_remove:
-                        await self.notification_trigger.on_group_deleted(group, current_user)
+            if group_deleted and self.notification_trigger:
+                await self.notification_trigger.on_group_deleted(
+                    group,
+                    current_user,
+                    recipient_ids=recipient_ids
+                )
             
             return await self.get_group_by_id(group_id)
 
@@ -346,85 +498,37 @@ class GroupService:
             self.logger.error(f"Error removing users from group {group_id}: {e}", exc_info=True)
             raise GroupUpdateError(f"Не удалось удалить пользователей из группы: {str(e)}")
     
-    async def delete_group_auto(self, group_id: int) -> bool:
+    async def delete_group_auto(
+        self,
+        group_id: int,
+        requested_by_id: Optional[int] = None,
+    ) -> Optional[DeletionJob]:
+        """Скрывает группу и ставит её фоновое удаление; зависимые данные удаляются пакетами."""
         self.logger.info(f"Auto-deleting group {group_id}")
         
         try:
-            group_stmt = select(Group).options(
-                selectinload(Group.tasks),
-                selectinload(Group.projects),
-                selectinload(Group.group_members).selectinload(GroupMember.user)
-            ).where(Group.id == group_id)
-            
-            group_result = await self.session.execute(group_stmt)
-            group = group_result.scalar_one_or_none()
-            
-            if not group:
-                self.logger.debug(f"Group {group_id} not found for auto-deletion")
-                return True
-
-            task_ids = [task.id for task in group.tasks]
-            if task_ids:
-                from core.database.models import TaskHistory
-                delete_history_stmt = delete(TaskHistory).where(
-                    TaskHistory.task_id.in_(task_ids)
-                )
-                await self.session.execute(delete_history_stmt)
-
-            if task_ids:
-                delete_user_associations_stmt = delete(task_user_association).where(
-                    task_user_association.c.task_id.in_(task_ids)
-                )
-                await self.session.execute(delete_user_associations_stmt)
-
-            for task in group.tasks:
-                await self.session.delete(task)
-
-            project_ids = [project.id for project in group.projects]
-
-            delete_project_links_stmt = delete(project_group_association).where(
-                project_group_association.c.group_id == group_id
-            )
-            await self.session.execute(delete_project_links_stmt)
-
-            for membership in group.group_members:
-                await self.session.delete(membership)
-
-            from core.database.models import GroupInvitation
-            delete_invitations_stmt = delete(GroupInvitation).where(
-                GroupInvitation.group_id == group_id
-            )
-            await self.session.execute(delete_invitations_stmt)
-
-            await self.session.delete(group)
-
-            if self.project_service:
-                for project_id in project_ids:
-                    remaining_groups_stmt = select(project_group_association).where(
-                        project_group_association.c.project_id == project_id
-                    )
-                    remaining_groups_result = await self.session.execute(remaining_groups_stmt)
-                    remaining_groups = remaining_groups_result.all()
-                    
-                    if not remaining_groups:
-                        await self.project_service.delete_project_auto(project_id)
-
+            job = await self.deletion_service.schedule_group_deletion(group_id, requested_by_id)
             await self.session.commit()
-            self.logger.info(f"Group {group_id} auto-deleted successfully")
-            return True
-
         except Exception as e:
             await self.session.rollback()
             self.logger.error(f"Error auto-deleting group {group_id}: {e}", exc_info=True)
             raise GroupDeleteError(f"Не удалось автоматически удалить группу: {str(e)}")
+
+        if not job:
+            self.logger.debug(f"Group {group_id} not found for auto-deletion")
+            return None
+
+        deletion_runner.start(job.id)
+        self.logger.info(f"Group {group_id} scheduled for deletion, job {job.id}")
+        return job
     
-    async def delete_group(self, group_id: int, current_user: User) -> bool:
+    async def delete_group(self, group_id: int, current_user: User) -> Optional[DeletionJob]:
         self.logger.info(f"Deleting group {group_id} by user {current_user.id}")
         
         try:
             group_stmt = select(Group).options(
-                selectinload(Group.group_members).selectinload(GroupMember.user)
-            ).where(Group.id == group_id)
+                selectinload(Group.group_members)
+            ).where(Group.id == group_id, Group.deleting_at.is_(None))
             group_result = await self.session.execute(group_stmt)
             group = group_result.scalar_one_or_none()
             
@@ -434,17 +538,19 @@ class GroupService:
 
             await ensure_user_is_admin(self.session, current_user.id, group_id)
             
-            members = [gm.user for gm in group.group_members]
-
-            await self.delete_group_auto(group_id)
+            recipient_ids = {gm.user_id for gm in group.group_members}
+            
+            job = await self.delete_group_auto(group_id, requested_by_id=current_user.id)
             
             if self.notification_trigger:
-                for member in members:
-                    if member.id != current_user.id:
-                        await self.notification_trigger.on_group_deleted(group, current_user)
+                await self.notification_trigger.on_group_deleted(
+                    group,
+                    current_user,
+                    recipient_ids=recipient_ids
+                )
             
-            self.logger.info(f"Group {group_id} deleted successfully")
-            return True
+            self.logger.info(f"Group {group_id} deletion started")
+            return job
 
         except (GroupNotFoundError, InsufficientPermissionsError):
             raise
@@ -0,0 +1,9 @@
+from .runner import MaintenanceJob, MaintenanceJobRunner, maintenance_runner
+from . import jobs
+
+__all__ = [
+    'MaintenanceJob',
+    'MaintenanceJobRunner',
+    'maintenance_runner',
+    'jobs',
+]
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+
+from core.config import settings
+from core.database.models import TaskDeadlineNotification
+from core.database.session import db_session
+from modules.auth.refresh_token import cleanup_expired_tokens
+from modules.groups.invitation_service import GroupInvitationService
+from .runner import maintenance_runner
+
+
+async def cleanup_refresh_tokens(batch_size: int) -> int:
+    async with db_session.session_factory() as session:
+        return await cleanup_expired_tokens(session, batch_size)
+
+
+async def expire_group_invitations(batch_size: int) -> int:
+    async with db_session.session_factory() as session:
+        return await GroupInvitationService(session).cleanup_expired_invitations(batch_size)
+
+
+async def prune_deadline_claims(batch_size: int) -> int:
+    """Удаление отметок об уведомлениях по дедлайнам, которые уже не могут сработать повторно."""
+    # Отметка нужна, пока планировщик ещё может догонять просрочку по этому дедлайну
+    retention = max(
+        timedelta(days=settings.maintenance.deadline_claims_retention_days),
+        timedelta(hours=settings.deadlines.catch_up_hours),
+    )
+    cutoff = datetime.now(timezone.utc) - retention
+    deleted = 0
+
+    async with db_session.session_factory() as session:
+        while True:
+            stale = (
+                select(TaskDeadlineNotification.id)
+                .where(TaskDeadlineNotification.deadline < cutoff)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await session.execute(
+                delete(TaskDeadlineNotification).where(TaskDeadlineNotification.id.in_(stale))
+            )
+            await session.commit()
+
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
+
+
+maintenance_runner.register("refresh_tokens", settings.maintenance.refresh_tokens_cron, cleanup_refresh_tokens)
+maintenance_runner.register("group_invitations", settings.maintenance.invitations_cron, expire_group_invitations)
+maintenance_runner.register("deadline_claims", settings.maintenance.deadline_claims_cron, prune_deadline_claims)
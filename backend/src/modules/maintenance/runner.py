@@ -0,0 +1,180 @@
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from core.config import settings
+from core.logger import logger
+from core.utils.cron import CronSchedule
+from modules.notifications.redis_client import redis_client
+
+JobFunc = Callable[[int], Awaitable[int]]
+
+
+class MaintenanceJob:
+    """Обслуживающая задача: func(batch_size) обрабатывает данные пачками и возвращает число строк."""
+
+    def __init__(self, name: str, schedule: str, func: JobFunc):
+        self.name = name
+        self.schedule = CronSchedule(schedule)
+        self.func = func
+
+
+class MaintenanceJobRunner:
+    """Запускает обслуживающие задачи по cron-расписанию внутри процесса приложения.
+
+    Все воркеры ждут очередного срабатывания со случайной задержкой до jitter_seconds, а выполняет
+    его тот, кто первым возьмёт в Redis аренду на этот слот расписания, — один раз на кластер.
+    Без Redis задачи не запускаются. Метрики прогонов копятся в Redis и общие для всех воркеров.
+    """
+
+    def __init__(self, batch_size: int, jitter_seconds: float, lease_seconds: int):
+        self.batch_size = batch_size
+        # Задержка не длиннее минуты, иначе ежеминутное расписание пропускало бы слоты
+        self.jitter_seconds = min(jitter_seconds, 59.0)
+        self.lease_seconds = lease_seconds
+        self.logger = logger
+        self.jobs: Dict[str, MaintenanceJob] = {}
+        self._worker_id = uuid.uuid4().hex
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def register(self, name: str, schedule: str, func: JobFunc) -> None:
+        self.jobs[name] = MaintenanceJob(name, schedule, func)
+
+    @staticmethod
+    def _lease_key(name: str, slot: datetime) -> str:
+        return f"maintenance:lease:{name}:{int(slot.timestamp())}"
+
+    @staticmethod
+    def _metrics_key(name: str) -> str:
+        return f"maintenance:metrics:{name}"
+
+    async def _acquire_lease(self, job: MaintenanceJob, slot: datetime) -> bool:
+        if not redis_client.is_connected:
+            return False
+
+        try:
+            return bool(await redis_client.client.set(
+                self._lease_key(job.name, slot),
+                self._worker_id,
+                nx=True,
+                ex=self.lease_seconds,
+            ))
+        except Exception as e:
+            self.logger.error(f"Redis maintenance lease error for {job.name}: {e}")
+            return False
+
+    async def run_job(self, job: MaintenanceJob) -> int:
+        started_at = datetime.now(timezone.utc)
+        started = time.monotonic()
+
+        try:
+            rows = await job.func(self.batch_size)
+        except Exception as e:
+            await self._record_run(job, started_at, time.monotonic() - started, 0, str(e))
+            raise
+
+        await self._record_run(job, started_at, time.monotonic() - started, rows)
+        return rows
+
+    async def _record_run(
+        self,
+        job: MaintenanceJob,
+        started_at: datetime,
+        duration_seconds: float,
+        rows: int,
+        error: Optional[str] = None,
+    ) -> None:
+        if not redis_client.is_connected:
+            return
+
+        duration_ms = round(duration_seconds * 1000, 1)
+        key = self._metrics_key(job.name)
+        try:
+            pipe = redis_client.client.pipeline(transaction=True)
+            pipe.hset(key, mapping={
+                "last_started_at": started_at.isoformat(),
+                "last_duration_ms": duration_ms,
+                "last_rows": rows,
+                "last_status": "failed" if error else "ok",
+                "last_error": (error or "")[:500],
+                "last_worker": self._worker_id,
+            })
+            pipe.hincrby(key, "runs", 1)
+            pipe.hincrby(key, "failures", 1 if error else 0)
+            pipe.hincrby(key, "total_rows", rows)
+            pipe.hincrbyfloat(key, "total_duration_ms", duration_ms)
+            await pipe.execute()
+        except Exception as e:
+            self.logger.error(f"Redis maintenance metrics error for {job.name}: {e}")
+
+    async def get_metrics(self) -> List[Dict[str, Any]]:
+        """Расписание и накопленные метрики всех зарегистрированных задач."""
+        now = datetime.now(timezone.utc)
+        raw: Dict[str, Dict[str, str]] = {}
+
+        if redis_client.is_connected:
+            try:
+                pipe = redis_client.client.pipeline(transaction=False)
+                for name in self.jobs:
+                    pipe.hgetall(self._metrics_key(name))
+                raw = dict(zip(self.jobs, await pipe.execute()))
+            except Exception as e:
+                self.logger.error(f"Redis maintenance metrics read error: {e}")
+
+        metrics = []
+        for name, job in self.jobs.items():
+            values = raw.get(name) or {}
+            runs = int(values.get("runs", 0))
+            metrics.append({
+                "name": name,
+                "schedule": job.schedule.expression,
+                "next_run_at": job.schedule.next_after(now),
+                "runs": runs,
+                "failures": int(values.get("failures", 0)),
+                "total_rows": int(values.get("total_rows", 0)),
+                "average_duration_ms": (
+                    round(float(values["total_duration_ms"]) / runs, 1) if runs and "total_duration_ms" in values else None
+                ),
+                "last_started_at": values.get("last_started_at"),
+                "last_duration_ms": float(values["last_duration_ms"]) if "last_duration_ms" in values else None,
+                "last_rows": int(values["last_rows"]) if "last_rows" in values else None,
+                "last_status": values.get("last_status"),
+                "last_error": values.get("last_error") or None,
+            })
+        return metrics
+
+    async def start(self) -> None:
+        for name, job in self.jobs.items():
+            self._tasks[name] = asyncio.create_task(self._loop(job))
+
+    async def stop(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _loop(self, job: MaintenanceJob) -> None:
+        while True:
+            now = datetime.now(timezone.utc)
+            slot = job.schedule.next_after(now)
+            await asyncio.sleep((slot - now).total_seconds() + random.uniform(0, self.jitter_seconds))
+
+            if not await self._acquire_lease(job, slot):
+                continue
+
+            try:
+                rows = await self.run_job(job)
+                self.logger.info(f"Maintenance job {job.name} processed {rows} rows")
+            except Exception as e:
+                self.logger.error(f"Maintenance job {job.name} failed: {e}", exc_info=True)
+
+
+maintenance_runner = MaintenanceJobRunner(
+    batch_size=settings.maintenance.batch_size,
+    jitter_seconds=settings.maintenance.jitter_seconds,
+    lease_seconds=settings.maintenance.lease_seconds,
+)
@@ -3,6 +3,7 @@ from .publisher import NotificationPublisher
 from .consumer import NotificationConsumer
 from .websocket_manager import manager
 from .redis_client import redis_client
+from .deadlines import deadline_scheduler
 
 __all__ = [
     'NotificationService',
@@ -11,4 +12,5 @@ __all__ = [
     'NotificationConsumer',
     'manager',
     'redis_client',
+    'deadline_scheduler',
 ]
\ No newline at end of file
@@ -0,0 +1,478 @@
+import asyncio
+import heapq
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.database.models import (
+    OPEN_TASK_CONDITION,
+    GroupMember,
+    Notification,
+    NotificationPriority,
+    NotificationType,
+    Task,
+    TaskDeadlineNotification,
+    TaskStatus,
+    UserRole,
+    task_user_association,
+)
+from core.database.session import db_session
+from core.logger import logger
+from shared.messaging import AfterCommitOutbox
+from .redis_client import redis_client
+from .service import format_russian_count
+from .websocket_manager import manager
+
+if TYPE_CHECKING:
+    from .publisher import NotificationPublisher
+
+
+DEADLINES_CHANNEL = "tasks:deadlines"
+OVERDUE_KIND = "overdue"
+TERMINAL_STATUSES = (TaskStatus.DONE, TaskStatus.CANCELLED)
+
+DAY_FORMS = ('день', 'дня', 'дней')
+HOUR_FORMS = ('час', 'часа', 'часов')
+MINUTE_FORMS = ('минута', 'минуты', 'минут')
+
+# (момент отправки, задача, вид уведомления, дедлайн, для которого оно запланировано)
+HeapEntry = Tuple[float, int, str, datetime]
+
+
+def lead_kind(minutes: int) -> str:
+    return f"lead_{minutes}"
+
+
+def format_remaining(seconds: float) -> str:
+    """Оставшееся до дедлайна время в самой крупной подходящей единице."""
+    if seconds >= 86400:
+        return format_russian_count(int(seconds // 86400), DAY_FORMS)
+    if seconds >= 3600:
+        return format_russian_count(int(seconds // 3600), HOUR_FORMS)
+    return format_russian_count(max(int(seconds // 60), 1), MINUTE_FORMS)
+
+
+def plan_deadline(
+    deadline: datetime,
+    lead_minutes: List[int],
+    now: float,
+    catch_up_seconds: float,
+) -> List[Tuple[float, str]]:
+    """Моменты отправки уведомлений по дедлайну: (timestamp, вид); lead_minutes — по убыванию.
+
+    Из уже прошедших напоминаний остаётся одно, ближайшее к дедлайну, чтобы задача с поздно
+    выставленным сроком не получила их все разом; просрочка старше catch_up_seconds не отправляется.
+    """
+    deadline_ts = deadline.timestamp()
+    if deadline_ts <= now:
+        return [(deadline_ts, OVERDUE_KIND)] if now - deadline_ts <= catch_up_seconds else []
+
+    plan = [(deadline_ts, OVERDUE_KIND)]
+    missed: Optional[Tuple[float, str]] = None
+    for minutes in lead_minutes:
+        fire_at = deadline_ts - minutes * 60
+        if fire_at > now:
+            plan.append((fire_at, lead_kind(minutes)))
+        else:
+            missed = (fire_at, lead_kind(minutes))
+
+    if missed:
+        plan.append(missed)
+    return plan
+
+
+class DeadlineNotificationScheduler:
+    """Напоминания о приближающихся дедлайнах и уведомления о просрочке задач.
+
+    Каждый воркер держит в памяти кучу ближайших срабатываний: окно дедлайнов периодически
+    перечитывается по частичному индексу ix_tasks_open_deadline, а между перечитываниями куча
+    обновляется изменениями задач — своими после коммита и чужими через Redis pub/sub.
+    Однократность между воркерами обеспечивает уникальная отметка в task_deadline_notifications,
+    которая пишется в одной транзакции с самими уведомлениями.
+    """
+
+    def __init__(
+        self,
+        lead_minutes: List[int],
+        horizon_hours: int,
+        reload_interval_seconds: int,
+        catch_up_hours: int,
+        batch_size: int,
+        max_sleep_seconds: float,
+    ):
+        self.lead_minutes = sorted({minutes for minutes in lead_minutes if minutes > 0}, reverse=True)
+        self.horizon_seconds = horizon_hours * 3600
+        self.reload_interval_seconds = reload_interval_seconds
+        self.catch_up_seconds = catch_up_hours * 3600
+        self.batch_size = batch_size
+        self.max_sleep_seconds = max_sleep_seconds
+        self.publisher: Optional['NotificationPublisher'] = None
+        self.logger = logger
+        self._worker_id = uuid.uuid4().hex
+        self._heap: List[HeapEntry] = []
+        # task_id -> дедлайн, под который лежат записи в куче; записи с другим дедлайном устарели
+        self._deadlines: Dict[int, datetime] = {}
+        self._window_end = 0.0
+        self._next_reload = 0.0
+        # Изменения, пришедшие во время перечитывания окна: применяются поверх прочитанного
+        self._reloading: Optional[Dict[int, Optional[datetime]]] = None
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.outbox: AfterCommitOutbox[Dict[int, Optional[datetime]]] = AfterCommitOutbox(
+            "task_deadlines", self._apply_committed, dict
+        )
+
+    def bind(self, publisher: 'NotificationPublisher') -> None:
+        self.publisher = publisher
+
+    @property
+    def _max_lead_seconds(self) -> int:
+        return self.lead_minutes[0] * 60 if self.lead_minutes else 0
+
+    def emit(
+        self,
+        session: AsyncSession,
+        task_id: int,
+        deadline: Optional[datetime],
+        status: Optional[TaskStatus],
+    ) -> None:
+        """Запоминает новый дедлайн задачи; в кучу он попадёт после коммита транзакции."""
+        if deadline is not None and deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=timezone.utc)
+        if status in TERMINAL_STATUSES:
+            deadline = None
+        self.outbox.pending(session)[task_id] = deadline
+
+    def track(self, task_id: int, deadline: Optional[datetime]) -> None:
+        """Перепланирует задачу; deadline=None снимает её с расписания."""
+        if self._reloading is not None:
+            self._reloading[task_id] = deadline
+        self._schedule_task(task_id, deadline, time.time())
+        self._wakeup.set()
+
+    def _schedule_task(
+        self,
+        task_id: int,
+        deadline: Optional[datetime],
+        now: float,
+        claimed: Iterable[str] = (),
+    ) -> None:
+        if deadline is None or deadline.timestamp() > self._window_end:
+            self._deadlines.pop(task_id, None)
+            return
+
+        if self._deadlines.get(task_id) == deadline:
+            return
+
+        self._deadlines[task_id] = deadline
+        for fire_at, kind in plan_deadline(deadline, self.lead_minutes, now, self.catch_up_seconds):
+            if kind not in claimed:
+                heapq.heappush(self._heap, (fire_at, task_id, kind, deadline))
+
+    async def reload(self) -> int:
+        """Перечитывает окно дедлайнов: от catch_up назад до horizon плюс наибольшее упреждение вперёд."""
+        now = time.time()
+        window_start = datetime.fromtimestamp(now - self.catch_up_seconds, tz=timezone.utc)
+        window_end_ts = now + self.horizon_seconds + self._max_lead_seconds
+        window_end = datetime.fromtimestamp(window_end_ts, tz=timezone.utc)
+        # Условие литералом совпадает с предикатом частичного индекса
+        in_window = (Task.deadline >= window_start, Task.deadline <= window_end, text(OPEN_TASK_CONDITION))
+
+        self._reloading = {}
+        try:
+            async with db_session.session_factory() as session:
+                rows = (await session.execute(select(Task.id, Task.deadline).where(*in_window))).all()
+                claimed_rows = (await session.execute(
+                    select(TaskDeadlineNotification.task_id, TaskDeadlineNotification.kind)
+                    .join(Task, and_(
+                        Task.id == TaskDeadlineNotification.task_id,
+                        Task.deadline == TaskDeadlineNotification.deadline,
+                    ))
+                    .where(*in_window)
+                )).all()
+            changed_meanwhile = self._reloading
+        finally:
+            self._reloading = None
+
+        claimed: Dict[int, Set[str]] = {}
+        for task_id, kind in claimed_rows:
+            claimed.setdefault(task_id, set()).add(kind)
+
+        self._heap = []
+        self._deadlines = {}
+        self._window_end = window_end_ts
+        for task_id, deadline in rows:
+            self._schedule_task(task_id, deadline, now, claimed.get(task_id, ()))
+        for task_id, deadline in changed_meanwhile.items():
+            self._schedule_task(task_id, deadline, now)
+
+        self._next_reload = now + self.reload_interval_seconds
+        self.logger.debug(f"Loaded {len(self._deadlines)} task deadlines, {len(self._heap)} scheduled notifications")
+        return len(self._deadlines)
+
+    def _pop_due(self, now: float) -> Dict[Tuple[int, str], datetime]:
+        due: Dict[Tuple[int, str], datetime] = {}
+        while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+            _, task_id, kind, deadline = heapq.heappop(self._heap)
+            if self._deadlines.get(task_id) != deadline:
+                continue
+            due[(task_id, kind)] = deadline
+            if kind == OVERDUE_KIND:
+                # Просрочка — последнее уведомление по этому дедлайну
+                self._deadlines.pop(task_id, None)
+        return due
+
+    def _requeue(self, due: Dict[Tuple[int, str], datetime]) -> None:
+        retry_at = time.time() + self.max_sleep_seconds
+        for (task_id, kind), deadline in due.items():
+            self._deadlines.setdefault(task_id, deadline)
+            heapq.heappush(self._heap, (retry_at, task_id, kind, deadline))
+
+    async def fire_due(self) -> int:
+        sent = 0
+        while True:
+            due = self._pop_due(time.time())
+            if not due:
+                return sent
+            try:
+                sent += await self._fire(due)
+            except Exception:
+                self._requeue(due)
+                raise
+
+    async def _get_recipients(self, session: AsyncSession, tasks: Dict[int, Any]) -> Dict[int, Set[int]]:
+        """Исполнители задачи; у задачи без исполнителей — администраторы её группы."""
+        recipients: Dict[int, Set[int]] = {}
+        result = await session.execute(
+            select(task_user_association.c.task_id, task_user_association.c.user_id)
+            .where(task_user_association.c.task_id.in_(tasks))
+        )
+        for task_id, user_id in result.all():
+            recipients.setdefault(task_id, set()).add(user_id)
+
+        group_ids = {task.group_id for task_id, task in tasks.items() if task_id not in recipients and task.group_id}
+        if group_ids:
+            result = await session.execute(
+                select(GroupMember.group_id, GroupMember.user_id)
+                .where(GroupMember.group_id.in_(group_ids), GroupMember.role == UserRole.ADMIN)
+            )
+            admins: Dict[int, Set[int]] = {}
+            for group_id, user_id in result.all():
+                admins.setdefault(group_id, set()).add(user_id)
+            for task_id, task in tasks.items():
+                if task_id not in recipients and task.group_id in admins:
+                    recipients[task_id] = admins[task.group_id]
+
+        return recipients
+
+    def _build_notification(self, task: Any, kind: str, user_id: int, now: datetime) -> Dict[str, Any]:
+        data = {
+            "task_id": task.id,
+            "task_title": task.title,
+            "project_id": task.project_id,
+            "deadline": task.deadline.isoformat(),
+        }
+
+        if kind == OVERDUE_KIND:
+            notification_type = NotificationType.TASK_OVERDUE
+            priority = NotificationPriority.HIGH
+            title = "Задача просрочена"
+            content = f"Срок выполнения задачи '{task.title}' истёк"
+        else:
+            notification_type = NotificationType.TASK_DEADLINE_APPROACHING
+            priority = NotificationPriority.MEDIUM
+            title = "Приближается дедлайн"
+            remaining = format_remaining((task.deadline - now).total_seconds())
+            content = f"До дедлайна задачи '{task.title}' осталось {remaining}"
+            data["lead_minutes"] = int(kind[len("lead_"):])
+
+        data["notification_type"] = notification_type.value
+        return {
+            "user_id": user_id,
+            "type": notification_type,
+            "priority": priority,
+            "title": title,
+            "content": content,
+            "data": data,
+            "created_at": now,
+        }
+
+    async def _fire(self, due: Dict[Tuple[int, str], datetime]) -> int:
+        now = datetime.now(timezone.utc)
+        task_ids = {task_id for task_id, _ in due}
+
+        async with db_session.session_factory() as session:
+            result = await session.execute(
+                select(Task.id, Task.title, Task.project_id, Task.group_id, Task.deadline)
+                .where(Task.id.in_(task_ids), Task.status.not_in(TERMINAL_STATUSES))
+            )
+            tasks = {row.id: row for row in result.all()}
+
+            # Срок мог смениться или задача закрыться, пока запись ждала в куче
+            claims = [
+                {"task_id": task_id, "kind": kind, "deadline": deadline}
+                for (task_id, kind), deadline in due.items()
+                if task_id in tasks and tasks[task_id].deadline == deadline
+            ]
+            if not claims:
+                return 0
+
+            claimed = (await session.execute(
+                pg_insert(TaskDeadlineNotification)
+                .values(claims)
+                .on_conflict_do_nothing(constraint="uq_task_deadline_notification")
+                .returning(TaskDeadlineNotification.task_id, TaskDeadlineNotification.kind)
+            )).all()
+            if not claimed:
+                return 0
+
+            claimed_tasks = {task_id: tasks[task_id] for task_id, _ in claimed}
+            recipients = await self._get_recipients(session, claimed_tasks)
+            rows = [
+                self._build_notification(tasks[task_id], kind, user_id, now)
+                for task_id, kind in claimed
+                for user_id in sorted(recipients.get(task_id, ()))
+            ]
+
+            notifications: List[Notification] = []
+            if rows:
+                notifications = list((await session.scalars(insert(Notification).returning(Notification), rows)).all())
+            await session.commit()
+
+        await self._deliver(notifications)
+        self.logger.info(f"Sent {len(notifications)} deadline notifications for {len(claimed)} deadlines")
+        return len(notifications)
+
+    async def _deliver(self, notifications: List[Notification]) -> None:
+        for user_id in {notification.user_id for notification in notifications}:
+            await redis_client.invalidate_unread_count(user_id)
+
+        use_publisher = self.publisher is not None and self.publisher.messaging.is_setup
+        for notification in notifications:
+            ws_message = {
+                "id": notification.id,
+                "type": notification.type.value,
+                "priority": notification.priority.value,
+                "title": notification.title,
+                "content": notification.content,
+                "data": notification.data,
+                "created_at": notification.created_at.isoformat(),
+                "is_read": notification.is_read,
+            }
+            try:
+                if use_publisher:
+                    await self.publisher.send_to_user(notification.user_id, ws_message)
+                else:
+                    await manager.send_to_user(notification.user_id, ws_message)
+            except Exception as e:
+                self.logger.warning(f"Failed to deliver deadline notification {notification.id}: {e}")
+
+    def _apply_committed(self, changes: Dict[int, Optional[datetime]]) -> None:
+        for task_id, deadline in changes.items():
+            self.track(task_id, deadline)
+
+        task = asyncio.get_running_loop().create_task(self._broadcast(changes))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _broadcast(self, changes: Dict[int, Optional[datetime]]) -> None:
+        if not redis_client.is_connected:
+            return
+
+        payload = {
+            "worker": self._worker_id,
+            "tasks": {str(task_id): deadline.isoformat() if deadline else None for task_id, deadline in changes.items()},
+        }
+        try:
+            await redis_client.client.publish(DEADLINES_CHANNEL, json.dumps(payload))
+        except Exception as e:
+            self.logger.error(f"Redis deadline broadcast error: {e}")
+
+    def _apply_remote(self, raw: str) -> None:
+        payload = json.loads(raw)
+        if payload.get("worker") == self._worker_id:
+            return
+
+        for task_id, deadline in (payload.get("tasks") or {}).items():
+            self.track(int(task_id), datetime.fromisoformat(deadline) if deadline else None)
+
+    async def _listen(self) -> None:
+        while True:
+            if not redis_client.is_connected:
+                await asyncio.sleep(self.max_sleep_seconds)
+                continue
+
+            pubsub = redis_client.client.pubsub()
+            try:
+                await pubsub.subscribe(DEADLINES_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._apply_remote(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Redis deadline subscription error: {e}")
+                # Изменения, пропущенные без подписки, подберёт внеочередное перечитывание окна
+                self._next_reload = 0.0
+                self._wakeup.set()
+                await asyncio.sleep(self.max_sleep_seconds)
+            finally:
+                await pubsub.aclose()
+
+    def _sleep_seconds(self) -> float:
+        now = time.time()
+        timeout = min(self.max_sleep_seconds, self._next_reload - now)
+        if self._heap:
+            timeout = min(timeout, self._heap[0][0] - now)
+        return max(timeout, 0.0)
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._loop())
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        tasks = [task for task in (self._task, self._listener, *self._tasks) if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._listener = None
+
+    async def _loop(self) -> None:
+        while True:
+            self._wakeup.clear()
+            if time.time() >= self._next_reload:
+                try:
+                    await self.reload()
+                except Exception as e:
+                    self.logger.error(f"Error loading task deadlines: {e}", exc_info=True)
+                    self._next_reload = time.time() + self.max_sleep_seconds
+
+            try:
+                await self.fire_due()
+            except Exception as e:
+                self.logger.error(f"Error sending deadline notifications: {e}", exc_info=True)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._sleep_seconds())
+            except asyncio.TimeoutError:
+                pass
+
+
+deadline_scheduler = DeadlineNotificationScheduler(
+    lead_minutes=settings.deadlines.lead_minutes,
+    horizon_hours=settings.deadlines.horizon_hours,
+    reload_interval_seconds=settings.deadlines.reload_interval_seconds,
+    catch_up_hours=settings.deadlines.catch_up_hours,
+    batch_size=settings.deadlines.batch_size,
+    max_sleep_seconds=settings.deadlines.max_sleep_seconds,
+)
@@ -14,6 +14,17 @@ from .websocket_manager import manager
 router = APIRouter()
 
 
+def _parse_room_id(value) -> Optional[int]:
+    """room_id из сообщения клиента: целое число или строка из цифр."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if value > 0 else None
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip()) or None
+    return None
+
+
 @router.websocket("/ws")
 async def websocket_endpoint(
     websocket: WebSocket,
@@ -80,6 +91,39 @@ async def websocket_endpoint(
             elif action == "ping":
                 await websocket.send_json({"type": "pong"})
             
+            elif action == "conference_subscribe":
+                room_id = _parse_room_id(data.get("room_id"))
+                if room_id is None:
+                    await websocket.send_json({
+                        "type": "error",
+                        "room_id": data.get("room_id"),
+                        "message": "Некорректный room_id"
+                    })
+                    continue
+
+                conference_service = service_factory.get('conference')
+                if await conference_service.can_subscribe_room(room_id, user.id):
+                    manager.subscribe_room(room_id, user.id, connection_id)
+                    await websocket.send_json({
+                        "type": "conference_subscribed",
+                        "room_id": room_id
+                    })
+                else:
+                    await websocket.send_json({
+                        "type": "error",
+                        "room_id": room_id,
+                        "message": "Нет доступа к созвону"
+                    })
+            
+            elif action == "conference_unsubscribe":
+                room_id = _parse_room_id(data.get("room_id"))
+                if room_id is not None:
+                    manager.unsubscribe_room(room_id, user.id, connection_id)
+                await websocket.send_json({
+                    "type": "conference_unsubscribed",
+                    "room_id": room_id
+                })
+            
             elif action == "subscribe_to_updates":
                 await websocket.send_json({
                     "type": "subscribed",
@@ -1,6 +1,6 @@
 import json
 import asyncio
-from typing import List, Optional, Dict, Any, Set, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Set, Tuple, TYPE_CHECKING
 from datetime import datetime
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -249,6 +249,11 @@ class NotificationTriggerService:
         self.service_factory = service_factory
         self.notification_service = NotificationService(session, notification_publisher, service_factory)
         self.logger = logger
+        self._emitted_events: Set[Tuple[str, str]] = set()
+    
+    def _event_key(self, notification_type: NotificationType, data: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        # Ключ идемпотентности (событие, сущность, версия): сущность и её версия заданы payload-ом
+        return notification_type.value, json.dumps(data or {}, sort_keys=True, default=str)
     
     async def _get_group_member_ids(self, group_id: int, exclude_user_id: Optional[int] = None) -> Set[int]:
         stmt = select(GroupMember.user_id).where(GroupMember.group_id == group_id)
@@ -307,10 +312,17 @@ class NotificationTriggerService:
         if not user_ids:
             return
         
+        event_key = self._event_key(notification_type, data)
+        if event_key in self._emitted_events:
+            self.logger.debug(f"Skipping duplicate {notification_type.value} notification")
+            return
+        
         if not self.notification_service.notification_publisher:
             self.logger.warning("Notification publisher not available")
             return
         
+        self._emitted_events.add(event_key)
+        
         from shared.messaging import MessagePriority
         message_priority = MessagePriority(priority.value)
         
@@ -335,8 +347,19 @@ class NotificationTriggerService:
             data={"group_id": group.id, "group_name": group.name, "changes": changes}
         )
     
-    async def on_group_deleted(self, group: Group, deleted_by: User):
-        user_ids = await self._get_group_member_ids(group.id, exclude_user_id=deleted_by.id)
+    async def on_group_deleted(
+        self,
+        group: Group,
+        deleted_by: User,
+        recipient_ids: Optional[Set[int]] = None
+    ):
+        """
+        recipient_ids — снимок участников, сделанный до удаления: после него участников уже не найти
+        """
+        if recipient_ids is None:
+            user_ids = await self._get_group_member_ids(group.id, exclude_user_id=deleted_by.id)
+        else:
+            user_ids = set(recipient_ids) - {deleted_by.id}
         
         await self._broadcast_notification(
             user_ids=user_ids,
@@ -1,5 +1,6 @@
+import asyncio
 import uuid
-from typing import Dict, Optional
+from typing import Dict, Optional, Set, Tuple
 from fastapi import WebSocket
 from core.logger import logger
 
@@ -7,6 +8,9 @@ from core.logger import logger
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[int, Dict[str, WebSocket]] = {}
+        # Подписки на созвоны: room_id -> {(user_id, connection_id)}
+        self.room_subscriptions: Dict[int, Set[Tuple[int, str]]] = {}
+        self.connection_rooms: Dict[str, Set[int]] = {}
     
     async def connect(self, websocket: WebSocket, user_id: int, connection_id: str = None) -> str:
         await websocket.accept()
@@ -30,6 +34,9 @@ class ConnectionManager:
             if not self.active_connections[user_id]:
                 del self.active_connections[user_id]
         
+        for room_id in self.connection_rooms.pop(connection_id, set()):
+            self._discard_room_subscriber(room_id, user_id, connection_id)
+        
         logger.info(f"WebSocket disconnected: user={user_id}, connection={connection_id}")
     
     async def send_to_user(self, user_id: int, message: dict) -> int:
@@ -55,6 +62,68 @@ class ConnectionManager:
         
         return sent_count
     
+    def subscribe_room(self, room_id: int, user_id: int, connection_id: str):
+        self.room_subscriptions.setdefault(room_id, set()).add((user_id, connection_id))
+        self.connection_rooms.setdefault(connection_id, set()).add(room_id)
+        logger.debug(f"Connection {connection_id} of user {user_id} subscribed to room {room_id}")
+    
+    def unsubscribe_room(self, room_id: int, user_id: int, connection_id: Optional[str] = None):
+        """Отписка соединения; без connection_id отписываются все соединения пользователя."""
+        subscribers = self.room_subscriptions.get(room_id, set())
+        targets = [
+            (uid, cid) for uid, cid in subscribers
+            if uid == user_id and (connection_id is None or cid == connection_id)
+        ]
+        
+        for uid, cid in targets:
+            self._discard_room_subscriber(room_id, uid, cid)
+            rooms = self.connection_rooms.get(cid)
+            if rooms:
+                rooms.discard(room_id)
+                if not rooms:
+                    del self.connection_rooms[cid]
+    
+    def close_room(self, room_id: int):
+        for _, connection_id in self.room_subscriptions.pop(room_id, set()):
+            rooms = self.connection_rooms.get(connection_id)
+            if rooms:
+                rooms.discard(room_id)
+                if not rooms:
+                    del self.connection_rooms[connection_id]
+    
+    def _discard_room_subscriber(self, room_id: int, user_id: int, connection_id: str):
+        subscribers = self.room_subscriptions.get(room_id)
+        if subscribers is None:
+            return
+        
+        subscribers.discard((user_id, connection_id))
+        if not subscribers:
+            del self.room_subscriptions[room_id]
+    
+    async def send_to_room(self, room_id: int, message: dict) -> int:
+        subscribers = list(self.room_subscriptions.get(room_id, set()))
+        if not subscribers:
+            return 0
+        
+        async def _send(user_id: int, connection_id: str) -> bool:
+            websocket = self.active_connections.get(user_id, {}).get(connection_id)
+            if websocket is None:
+                self._discard_room_subscriber(room_id, user_id, connection_id)
+                return False
+            try:
+                await websocket.send_json(message)
+                return True
+            except Exception as e:
+                logger.error(f"Failed to send room {room_id} event to {user_id} ({connection_id}): {e}")
+                self.disconnect(user_id, connection_id)
+                return False
+        
+        results = await asyncio.gather(*(_send(uid, cid) for uid, cid in subscribers))
+        sent_count = sum(results)
+        
+        logger.debug(f"Sent room {room_id} event to {sent_count} connections")
+        return sent_count
+    
     def get_connection_count(self, user_id: int) -> int:
         if user_id not in self.active_connections:
             return 0
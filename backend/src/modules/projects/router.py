@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, status, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,7 +15,15 @@ from modules.auth.dependencies import get_current_user
 from core.database.session import db_session
 from core.services import ServiceFactory
 from core.logger import logger
-from .schemas import AddGroupsToProject, ProjectCreate, ProjectRead, ProjectUpdate, ProjectReadWithRelations, RemoveGroupsFromProject
+from .schemas import (
+    AddGroupsToProject,
+    ProjectCreate,
+    ProjectRead,
+    ProjectUpdate,
+    ProjectReadWithRelations,
+    ProjectSummaryRead,
+    RemoveGroupsFromProject,
+)
 from .exceptions import (
     ProjectNotFoundError,
     ProjectCreationError,
@@ -46,10 +56,23 @@ async def get_my_projects(
     project_service = service_factory.get('project')
     return await project_service.get_user_projects(current_user.id)
 
+# Получить карточки проектов текущего пользователя со сводкой по задачам
+@router.get("/my/summary", response_model=list[ProjectSummaryRead])
+async def get_my_projects_summary(
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user)
+):
+    logger.info(f"GET /projects/my/summary requested by user {current_user.id}")
+    project_service = service_factory.get('project')
+    return await project_service.get_user_project_summaries(current_user.id)
+
 # Получить информацию о проекте (только для участников групп проекта)
 @router.get("/{project_id}", response_model=ProjectReadWithRelations)
 async def get_project(
     project_id: int,
+    include: Optional[str] = Query(None, pattern="^tasks$", description="include=tasks — добавить страницу задач"),
+    tasks_before_id: Optional[int] = Query(None, ge=1, description="Курсор: ID последней полученной задачи"),
+    tasks_limit: int = Query(50, ge=1, le=200),
     service_factory: ServiceFactory = Depends(get_service_factory),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(db_session.session_getter)
@@ -68,7 +91,12 @@ async def get_project(
 
     try:
         project_service = service_factory.get('project')
-        project = await project_service.get_project_by_id(project_id)
+        project = await project_service.get_project_by_id(
+            project_id,
+            include_tasks=include == "tasks",
+            tasks_before_id=tasks_before_id,
+            tasks_limit=tasks_limit,
+        )
         return project
     except ProjectNotFoundError as e:
         logger.error(f"Project {project_id} not found")
@@ -243,12 +271,12 @@ async def delete_project_by_id(
     project_service = service_factory.get('project')
     
     try:
-        deleted = await project_service.delete_project(project_id, current_user)
-        if not deleted:
+        job = await project_service.delete_project(project_id, current_user)
+        if not job:
             logger.warning(f"Project {project_id} not found for deletion")
             raise ProjectNotFoundError(project_id)
-        logger.info(f"Project {project_id} deleted successfully")
-        return {"detail": "Проект успешно удалён"}
+        logger.info(f"Project {project_id} deletion started, job {job.id}")
+        return {"detail": "Проект удаляется", "job_id": job.id}
     except ProjectNotFoundError as e:
         logger.error(f"Error deleting project {project_id}: {e.detail}")
         raise HTTPException(
@@ -1,9 +1,10 @@
 from __future__ import annotations
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 from shared.schemas import BaseUserWithRole, BaseTaskInfo
+from core.database.models import TaskStatus
 
 class ProjectCreate(BaseModel):
     title: str
@@ -39,9 +40,19 @@ class SimpleGroupForProject(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-class ProjectReadWithRelations(ProjectRead):
+class ProjectSummaryRead(ProjectRead):
+    tasks_count: int = 0
+    tasks_by_status: Dict[TaskStatus, int] = {}
+    overdue_tasks_count: int = 0
+    next_deadline: Optional[datetime] = None
+    groups_count: int = 0
+    members_count: int = 0
+
+class ProjectReadWithRelations(ProjectSummaryRead):
     groups: List[SimpleGroupForProject] = [] 
-    tasks: List[BaseTaskInfo] = []
+    # Задачи возвращаются только по include=tasks, постранично
+    tasks: Optional[List[BaseTaskInfo]] = None
+    next_tasks_cursor: Optional[int] = None
     
 class AddGroupsToProject(BaseModel):
     group_ids: List[int]
@@ -1,28 +1,28 @@
+from datetime import datetime, timezone
 from typing import Optional, List, TYPE_CHECKING, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, or_
+from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
 
 from shared.dependencies import ensure_user_is_admin, ensure_global_admin_by_id
 from core.database.models import (
+    DeletionJob,
     Project,
     Group,
     User,
     GroupMember,
     Task,
-    ConferenceRoom,
-    ConferenceStats,
-    ConferenceParticipant,
-    ConferenceMessage,
+    TaskStatus,
     project_group_association,
-    task_user_association,
-    conference_invited_users,
 )
 from core.logger import logger
+from modules.deletion.runner import deletion_runner
+from shared.schemas import BaseTaskInfo
 from .schemas import (
     AddGroupsToProject,
     ProjectCreate,
     ProjectReadWithRelations,
+    ProjectSummaryRead,
     ProjectUpdate,
     ProjectRead,
     RemoveGroupsFromProject,
@@ -40,6 +40,7 @@ from .exceptions import (
 if TYPE_CHECKING:
     from core.services import ServiceFactory
     from modules.groups.service import GroupService
+    from modules.deletion.service import DeletionService
     from modules.notifications.service import NotificationTriggerService
 
 
@@ -49,6 +50,7 @@ class ProjectService:
         self.logger = logger
         self.service_factory = service_factory
         self._group_service = None
+        self._deletion_service = None
         self._notification_trigger = None
     
     @property
@@ -58,6 +60,16 @@ class ProjectService:
             self._group_service = self.service_factory.get_or_create('group', GroupService)
         return self._group_service
     
+    @property
+    def deletion_service(self) -> 'DeletionService':
+        if self._deletion_service is None:
+            from modules.deletion.service import DeletionService
+            if self.service_factory:
+                self._deletion_service = self.service_factory.get_or_create('deletion', DeletionService)
+            else:
+                self._deletion_service = DeletionService(self.session)
+        return self._deletion_service
+    
     @property
     def notification_trigger(self) -> Optional['NotificationTriggerService']:
         if self._notification_trigger is None and self.service_factory:
@@ -67,55 +79,79 @@ class ProjectService:
     async def get_all_projects(self, current_user_id: int) -> List[ProjectRead]:
         self.logger.info(f"Fetching all projects by global admin {current_user_id}")
         await ensure_global_admin_by_id(self.session, current_user_id)
-        stmt = select(Project).order_by(Project.id)
+        stmt = select(Project).where(Project.deleting_at.is_(None)).order_by(Project.id)
         result = await self.session.scalars(stmt)
         projects = result.all()
         self.logger.debug(f"Found {len(projects)} projects")
         return projects
     
-    async def get_user_projects(self, user_id: int) -> List[ProjectReadWithRelations]:
-        self.logger.debug(f"Fetching projects for user {user_id}")
-        stmt = (
-            select(Project)
-            .join(Project.groups)
-            .join(Group.group_members)
-            .where(GroupMember.user_id == user_id)
-            .options(
-                selectinload(Project.groups)
-                .selectinload(Group.group_members)
-                .selectinload(GroupMember.user),
-                selectinload(Project.tasks)
+    async def _get_project_summaries(self, project_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Сводка по задачам и участникам проектов: два агрегирующих запроса на весь список."""
+        summaries: Dict[int, Dict[str, Any]] = {
+            project_id: {
+                "tasks_count": 0,
+                "tasks_by_status": {},
+                "overdue_tasks_count": 0,
+                "next_deadline": None,
+                "groups_count": 0,
+                "members_count": 0,
+            }
+            for project_id in project_ids
+        }
+        if not project_ids:
+            return summaries
+
+        now = datetime.now(timezone.utc)
+        is_open = Task.status.not_in([TaskStatus.DONE, TaskStatus.CANCELLED])
+
+        tasks_stmt = (
+            select(
+                Task.project_id,
+                Task.status,
+                func.count(Task.id),
+                func.count(Task.id).filter(is_open, Task.deadline < now),
+                func.min(Task.deadline).filter(is_open, Task.deadline >= now),
             )
-            .order_by(Project.id)
+            .where(Task.project_id.in_(project_ids))
+            .group_by(Task.project_id, Task.status)
         )
+        for project_id, task_status, count, overdue, next_deadline in (await self.session.execute(tasks_stmt)).all():
+            summary = summaries[project_id]
+            summary["tasks_count"] += count
+            summary["tasks_by_status"][task_status] = count
+            summary["overdue_tasks_count"] += overdue
+            if next_deadline and (summary["next_deadline"] is None or next_deadline < summary["next_deadline"]):
+                summary["next_deadline"] = next_deadline
+
+        members_stmt = (
+            select(
+                project_group_association.c.project_id,
+                func.count(project_group_association.c.group_id.distinct()),
+                func.count(GroupMember.user_id.distinct()),
+            )
+            .join(Group, Group.id == project_group_association.c.group_id)
+            .outerjoin(GroupMember, GroupMember.group_id == Group.id)
+            .where(
+                project_group_association.c.project_id.in_(project_ids),
+                Group.deleting_at.is_(None),
+            )
+            .group_by(project_group_association.c.project_id)
+        )
+        for project_id, groups_count, members_count in (await self.session.execute(members_stmt)).all():
+            summaries[project_id]["groups_count"] = groups_count
+            summaries[project_id]["members_count"] = members_count
 
-        result = await self.session.execute(stmt)
-        projects = result.scalars().unique().all()
-
-        projects_with_relations = []
-        for project in projects:
-            project_data = {
-                "id": project.id,
-                "title": project.title,
-                "description": project.description,
-                "start_date": project.start_date,
-                "end_date": project.end_date,
-                "status": project.status,
-                "groups": [],
-                "tasks": [],
-            }
+        return summaries
 
-            for group in project.groups:
-                group_data = {
-                    "id": group.id,
-                    "name": group.name,
-                    "description": group.description,
-                    "created_at": group.created_at,
-                    "users": [],
-                }
-
-                for gm in group.group_members:
-                    user_data = {
+    def _build_project_groups(self, project: Project) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": group.id,
+                "name": group.name,
+                "description": group.description,
+                "created_at": group.created_at,
+                "users": [
+                    {
                         "id": gm.user.id,
                         "login": gm.user.login,
                         "email": gm.user.email,
@@ -123,31 +159,82 @@ class ProjectService:
                         "created_at": gm.user.created_at,
                         "role": gm.role.value,
                     }
-                    group_data["users"].append(user_data)
-
-                project_data["groups"].append(group_data)
-
-            for task in project.tasks:
-                task_data = {
-                    "id": task.id,
-                    "title": task.title,
-                    "description": task.description,
-                    "status": task.status,
-                    "priority": task.priority,
-                    "position": task.position,
-                    "start_date": task.start_date,
-                    "deadline": task.deadline,
-                    "project_id": task.project_id,
-                    "tags": task.tags if task.tags else [],
-                }
-                project_data["tasks"].append(task_data)
-
-            projects_with_relations.append(ProjectReadWithRelations(**project_data))
+                    for gm in group.group_members
+                ],
+            }
+            for group in project.groups
+            if group.deleting_at is None
+        ]
+
+    def _user_projects_stmt(self, user_id: int):
+        return (
+            select(Project)
+            .join(Project.groups)
+            .join(Group.group_members)
+            .where(
+                GroupMember.user_id == user_id,
+                Project.deleting_at.is_(None),
+                Group.deleting_at.is_(None),
+            )
+            .distinct()
+            .order_by(Project.id)
+        )
+
+    async def get_user_projects(self, user_id: int) -> List[ProjectReadWithRelations]:
+        self.logger.debug(f"Fetching projects for user {user_id}")
+        stmt = self._user_projects_stmt(user_id).options(
+            selectinload(Project.groups)
+            .selectinload(Group.group_members)
+            .selectinload(GroupMember.user)
+        )
+
+        result = await self.session.execute(stmt)
+        projects = result.scalars().unique().all()
+        summaries = await self._get_project_summaries([project.id for project in projects])
+
+        projects_with_relations = [
+            ProjectReadWithRelations(
+                id=project.id,
+                title=project.title,
+                description=project.description,
+                start_date=project.start_date,
+                end_date=project.end_date,
+                status=project.status,
+                groups=self._build_project_groups(project),
+                **summaries[project.id],
+            )
+            for project in projects
+        ]
 
         self.logger.debug(f"Found {len(projects_with_relations)} projects for user {user_id}")
         return projects_with_relations
+
+    async def get_user_project_summaries(self, user_id: int) -> List[ProjectSummaryRead]:
+        """Карточки проектов пользователя: прогресс по задачам без самих задач и участников."""
+        self.logger.debug(f"Fetching project summaries for user {user_id}")
+        projects = (await self.session.scalars(self._user_projects_stmt(user_id))).all()
+        summaries = await self._get_project_summaries([project.id for project in projects])
+
+        return [
+            ProjectSummaryRead(
+                id=project.id,
+                title=project.title,
+                description=project.description,
+                start_date=project.start_date,
+                end_date=project.end_date,
+                status=project.status,
+                **summaries[project.id],
+            )
+            for project in projects
+        ]
     
-    async def get_project_by_id(self, project_id: int) -> ProjectReadWithRelations:
+    async def get_project_by_id(
+        self,
+        project_id: int,
+        include_tasks: bool = False,
+        tasks_before_id: Optional[int] = None,
+        tasks_limit: int = 50,
+    ) -> ProjectReadWithRelations:
         self.logger.debug(f"Fetching project by ID: {project_id}")
         stmt = (
             select(Project)
@@ -155,9 +242,8 @@ class ProjectService:
                 selectinload(Project.groups)
                 .selectinload(Group.group_members)
                 .selectinload(GroupMember.user),
-                selectinload(Project.tasks),
             )
-            .where(Project.id == project_id)
+            .where(Project.id == project_id, Project.deleting_at.is_(None))
         )
         result = await self.session.execute(stmt)
         project = result.scalar_one_or_none()
@@ -166,58 +252,38 @@ class ProjectService:
             self.logger.warning(f"Project with ID {project_id} not found")
             raise ProjectNotFoundError(project_id)
 
-        groups_data = []
-        for group in project.groups:
-            users_data = [
-                {
-                    "id": gm.user.id,
-                    "login": gm.user.login,
-                    "email": gm.user.email,
-                    "name": gm.user.name,
-                    "created_at": gm.user.created_at,
-                    "role": gm.role.value,
-                }
-                for gm in group.group_members
-            ]
-
-            groups_data.append(
-                {
-                    "id": group.id,
-                    "name": group.name,
-                    "description": group.description,
-                    "created_at": group.created_at,
-                    "users": users_data,
-                }
-            )
-
-        tasks_data = [
-            {
-                "id": task.id,
-                "title": task.title,
-                "description": task.description,
-                "status": task.status,
-                "priority": task.priority,
-                "position": task.position,
-                "start_date": task.start_date,
-                "deadline": task.deadline,
-                "project_id": task.project_id,
-                "tags": task.tags if task.tags else [],
-            }
-            for task in project.tasks
-        ]
-
-        project_data = {
-            "id": project.id,
-            "title": project.title,
-            "description": project.description,
-            "start_date": project.start_date,
-            "end_date": project.end_date,
-            "status": project.status,
-            "groups": groups_data,
-            "tasks": tasks_data,
-        }
+        summaries = await self._get_project_summaries([project.id])
 
-        return ProjectReadWithRelations(**project_data)
+        tasks = None
+        next_tasks_cursor = None
+        if include_tasks:
+            tasks_stmt = (
+                select(Task)
+                .where(Task.project_id == project_id)
+                .order_by(Task.id.desc())
+                .limit(tasks_limit + 1)
+            )
+            if tasks_before_id is not None:
+                tasks_stmt = tasks_stmt.where(Task.id < tasks_before_id)
+
+            task_rows = (await self.session.scalars(tasks_stmt)).all()
+            if len(task_rows) > tasks_limit:
+                task_rows = task_rows[:tasks_limit]
+                next_tasks_cursor = task_rows[-1].id
+            tasks = [BaseTaskInfo.model_validate(task) for task in task_rows]
+
+        return ProjectReadWithRelations(
+            id=project.id,
+            title=project.title,
+            description=project.description,
+            start_date=project.start_date,
+            end_date=project.end_date,
+            status=project.status,
+            groups=self._build_project_groups(project),
+            tasks=tasks,
+            next_tasks_cursor=next_tasks_cursor,
+            **summaries[project.id],
+        )
     
     async def create_project(self, project_data: ProjectCreate, current_user: User) -> ProjectReadWithRelations:
         self.logger.info(f"Creating new project '{project_data.title}' by user {current_user.id}")
@@ -305,7 +371,9 @@ class ProjectService:
         self.logger.info(f"Adding groups to project {project_id} by user {current_user.id}")
         
         try:
-            stmt = select(Project).options(selectinload(Project.groups)).where(Project.id == project_id)
+            stmt = select(Project).options(selectinload(Project.groups)).where(
+                Project.id == project_id, Project.deleting_at.is_(None)
+            )
             result = await self.session.execute(stmt)
             project = result.scalar_one_or_none()
 
@@ -313,7 +381,8 @@ class ProjectService:
                 self.logger.warning(f"Project {project_id} not found")
                 raise ProjectNotFoundError(project_id)
 
-            groups_stmt = select(Group).where(Group.id.in_(data.group_ids))
+            # Удаляемые группы считаем отсутствующими: связь с ними помешала бы удалению группы
+            groups_stmt = select(Group).where(Group.id.in_(data.group_ids), Group.deleting_at.is_(None))
             result_groups = await self.session.execute(groups_stmt)
             groups = result_groups.scalars().all()
 
@@ -355,8 +424,7 @@ class ProjectService:
         try:
             stmt = select(Project).options(
                 selectinload(Project.groups),
-                selectinload(Project.tasks),
-            ).where(Project.id == project_id)
+            ).where(Project.id == project_id, Project.deleting_at.is_(None))
 
             result = await self.session.execute(stmt)
             project = result.scalar_one_or_none()
@@ -366,6 +434,12 @@ class ProjectService:
                 raise ProjectNotFoundError(project_id)
 
             groups_to_remove = [g for g in project.groups if g.id in data.group_ids]
+            deleting_group_ids = [g.id for g in groups_to_remove if g.deleting_at is not None]
+            if deleting_group_ids:
+                # Связи удаляемой группы снимает её задача удаления
+                self.logger.warning(f"Groups {deleting_group_ids} of project {project_id} are being deleted")
+                raise GroupsNotInProjectError(deleting_group_ids)
+
             if not groups_to_remove:
                 self.logger.warning(f"Groups {data.group_ids} not in project {project_id}")
                 raise GroupsNotInProjectError(data.group_ids)
@@ -395,98 +469,45 @@ class ProjectService:
             self.logger.error(f"Error removing groups from project {project_id}: {e}", exc_info=True)
             raise ProjectUpdateError(f"Не удалось удалить группы из проекта: {str(e)}")
     
-    async def delete_project_auto(self, project_id: int) -> bool:
-        self.logger.info(f"Auto-deleting project {project_id}")
-        
+    async def _schedule_project_deletion(
+        self,
+        project_id: int,
+        requested_by_id: Optional[int],
+    ) -> Optional[DeletionJob]:
+        """Скрывает проект и фиксирует задачу удаления, не запуская её."""
         try:
-            project_stmt = select(Project).where(Project.id == project_id)
-            project_result = await self.session.execute(project_stmt)
-            db_project = project_result.scalar_one_or_none()
-            
-            if not db_project:
-                self.logger.debug(f"Project {project_id} not found for auto-deletion")
-                return True
-
-            tasks_stmt = select(Task.id).where(Task.project_id == project_id)
-            tasks_result = await self.session.execute(tasks_stmt)
-            task_ids = [row[0] for row in tasks_result]
-            room_conditions = [ConferenceRoom.project_id == project_id]
-
-            if task_ids:
-                room_conditions.append(ConferenceRoom.task_id.in_(task_ids))
-
-            rooms_stmt = select(ConferenceRoom.id).where(or_(*room_conditions))
-            rooms_result = await self.session.execute(rooms_stmt)
-            room_ids = [row[0] for row in rooms_result]
-
-            if room_ids:
-                await self.session.execute(
-                    delete(ConferenceStats).where(ConferenceStats.room_id.in_(room_ids))
-                )
-
-                await self.session.execute(
-                    delete(conference_invited_users).where(
-                        conference_invited_users.c.room_id.in_(room_ids)
-                    )
-                )
-
-                await self.session.execute(
-                    delete(ConferenceParticipant).where(
-                        ConferenceParticipant.room_id.in_(room_ids)
-                    )
-                )
-
-                await self.session.execute(
-                    delete(ConferenceMessage).where(
-                        ConferenceMessage.room_id.in_(room_ids)
-                    )
-                )
-
-                await self.session.execute(
-                    delete(ConferenceRoom).where(ConferenceRoom.id.in_(room_ids))
-                )
-
-            if task_ids:
-                from core.database.models import TaskHistory
-                delete_history_stmt = delete(TaskHistory).where(
-                    TaskHistory.task_id.in_(task_ids)
-                )
-                await self.session.execute(delete_history_stmt)
-
-            if task_ids:
-                delete_user_associations_stmt = delete(task_user_association).where(
-                    task_user_association.c.task_id.in_(task_ids)
-                )
-                await self.session.execute(delete_user_associations_stmt)
-
-            delete_tasks_stmt = delete(Task).where(Task.project_id == project_id)
-            await self.session.execute(delete_tasks_stmt)
-
-            delete_project_links_stmt = delete(project_group_association).where(
-                project_group_association.c.project_id == project_id
-            )
-            await self.session.execute(delete_project_links_stmt)
-
-            delete_project_stmt = delete(Project).where(Project.id == project_id)
-            await self.session.execute(delete_project_stmt)
-
+            job = await self.deletion_service.schedule_project_deletion(project_id, requested_by_id)
             await self.session.commit()
-            self.logger.info(f"Project {project_id} auto-deleted successfully")
-            return True
-
         except Exception as e:
             await self.session.rollback()
-            self.logger.error(f"Error auto-deleting project {project_id}: {e}", exc_info=True)
-            raise ProjectDeleteError(f"Не удалось автоматически удалить проект: {str(e)}")
+            self.logger.error(f"Error scheduling deletion of project {project_id}: {e}", exc_info=True)
+            raise ProjectDeleteError(f"Не удалось удалить проект: {str(e)}")
+        return job
+
+    async def delete_project_auto(
+        self,
+        project_id: int,
+        requested_by_id: Optional[int] = None,
+    ) -> Optional[DeletionJob]:
+        """Скрывает проект и ставит его фоновое удаление; задачи и созвоны удаляются пакетами."""
+        self.logger.info(f"Auto-deleting project {project_id}")
+
+        job = await self._schedule_project_deletion(project_id, requested_by_id)
+        if not job:
+            self.logger.debug(f"Project {project_id} not found for auto-deletion")
+            return None
+
+        deletion_runner.start(job.id)
+        self.logger.info(f"Project {project_id} scheduled for deletion, job {job.id}")
+        return job
     
-    async def delete_project(self, project_id: int, current_user: User) -> bool:
+    async def delete_project(self, project_id: int, current_user: User) -> Optional[DeletionJob]:
         self.logger.info(f"Deleting project {project_id} by user {current_user.id}")
         
         try:
             project_stmt = select(Project).options(
-                selectinload(Project.groups),
-                selectinload(Project.tasks)
-            ).where(Project.id == project_id)
+                selectinload(Project.groups)
+            ).where(Project.id == project_id, Project.deleting_at.is_(None))
             project_result = await self.session.execute(project_stmt)
             db_project = project_result.scalar_one_or_none()
             
@@ -499,15 +520,23 @@ class ProjectService:
             for group in project_groups:
                 await ensure_user_is_admin(self.session, current_user.id, group.id)
 
-            await self.delete_project_auto(project_id)
-            
+            job = await self._schedule_project_deletion(project_id, requested_by_id=current_user.id)
+            if not job:
+                raise ProjectNotFoundError(project_id)
+
+            # Уведомляем до запуска задачи: её этап groups отвязывает группы, по которым ищутся участники
             if self.notification_trigger:
-                await self.notification_trigger.on_project_deleted(db_project, current_user)
+                try:
+                    await self.notification_trigger.on_project_deleted(db_project, current_user)
+                except Exception as e:
+                    self.logger.error(f"Error notifying about deletion of project {project_id}: {e}", exc_info=True)
+
+            deletion_runner.start(job.id)
             
-            self.logger.info(f"Project {project_id} deleted successfully")
-            return True
+            self.logger.info(f"Project {project_id} deletion started, job {job.id}")
+            return job
 
-        except (ProjectNotFoundError, InsufficientProjectPermissionsError):
+        except (ProjectNotFoundError, InsufficientProjectPermissionsError, ProjectDeleteError):
             raise
         except Exception as e:
             await self.session.rollback()
@@ -0,0 +1,8 @@
+from .query import prefix_tsquery_text, search_match
+from .service import SearchService
+
+__all__ = [
+    'prefix_tsquery_text',
+    'search_match',
+    'SearchService',
+]
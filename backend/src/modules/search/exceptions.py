@@ -0,0 +1,10 @@
+from fastapi import HTTPException, status
+from typing import Optional
+
+class SearchException(HTTPException):
+    def __init__(self, status_code: int, detail: str, headers: Optional[dict] = None):
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
+
+class SearchQueryError(SearchException):
+    def __init__(self, detail: str = "Некорректный поисковый запрос"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
@@ -0,0 +1,64 @@
+import html
+import re
+from typing import Optional
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.database.models import TEXT_SEARCH_CONFIG
+
+MAX_QUERY_TERMS = 8
+# Маркеры подсветки из области частного использования Unicode: в пользовательском тексте
+# их нет, поэтому после экранирования HTML их можно безопасно заменить на <mark>
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_STOP = "\ue001"
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    "MaxWords=30, MinWords=10, MaxFragments=2, FragmentDelimiter= … "
+)
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def search_config() -> ColumnElement:
+    return literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig")
+
+
+def prefix_tsquery_text(q: Optional[str]) -> Optional[str]:
+    """Строка для to_tsquery: все слова запроса обязательны и ищутся по префиксу; None — слов нет."""
+    terms = _TERM_RE.findall((q or "").lower())
+    if not terms:
+        return None
+
+    # Однобуквенный префикс совпадает с большей частью индекса, такие слова оставляем,
+    # только если других в запросе нет
+    terms = [term for term in terms if len(term) > 1] or terms
+    terms = list(dict.fromkeys(terms))[:MAX_QUERY_TERMS]
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def to_tsquery(query_text: str) -> ColumnElement:
+    return func.to_tsquery(search_config(), query_text)
+
+
+def search_match(vector_column, q: Optional[str]) -> Optional[ColumnElement]:
+    """Условие полнотекстового совпадения по GIN-индексу колонки; None — в запросе нет слов."""
+    query_text = prefix_tsquery_text(q)
+    if query_text is None:
+        return None
+    return vector_column.op("@@")(to_tsquery(query_text))
+
+
+def headline(column, tsquery: ColumnElement) -> ColumnElement:
+    return func.ts_headline(search_config(), func.coalesce(column, ""), tsquery, HEADLINE_OPTIONS)
+
+
+def render_highlight(fragment: Optional[str]) -> Optional[str]:
+    """Экранированный HTML-фрагмент с найденными словами в <mark>."""
+    if fragment is None:
+        return None
+    return (
+        html.escape(fragment)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
@@ -0,0 +1,33 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from core.database.models import User
+from core.services import ServiceFactory
+from core.logger import logger
+from modules.auth.dependencies import get_current_user
+from shared.dependencies import get_service_factory
+from .exceptions import SearchException
+from .schemas import SearchPage
+
+router = APIRouter(dependencies=[Depends(get_current_user)])
+
+
+# Полнотекстовый поиск по задачам, комментариям и проектам групп пользователя
+@router.get("", response_model=SearchPage)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Слова для поиска, ищутся по префиксу"),
+    types: Optional[List[str]] = Query(None, description="task, comment, project; по умолчанию все"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Размер страницы"),
+    cursor: Optional[str] = Query(None, description="next_cursor предыдущей страницы"),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+):
+    logger.info(f"GET /search by user {current_user.id}")
+    search_service = service_factory.get('search')
+
+    try:
+        return await search_service.search(current_user, q, types=types, limit=limit, cursor=cursor)
+    except SearchException as e:
+        logger.error(f"Error searching for user {current_user.id}: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
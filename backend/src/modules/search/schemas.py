@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class SearchHitRead(BaseModel):
+    type: str
+    id: int
+    rank: float
+    title: str
+    # HTML с экранированным текстом, найденные слова обёрнуты в <mark>
+    title_highlight: str
+    snippet: Optional[str] = None
+    project_id: Optional[int] = None
+    task_id: Optional[int] = None
+
+
+class SearchPage(BaseModel):
+    items: List[SearchHitRead]
+    next_cursor: Optional[str] = None
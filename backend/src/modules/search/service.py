@@ -0,0 +1,213 @@
+import base64
+import json
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from sqlalchemy import and_, func, literal, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.database.models import Group, GroupMember, Project, Task, TaskComment, User, project_group_association
+from core.logger import logger
+from .exceptions import SearchQueryError
+from .query import headline, prefix_tsquery_text, render_highlight, to_tsquery
+from .schemas import SearchHitRead, SearchPage
+
+if TYPE_CHECKING:
+    from core.services import ServiceFactory
+
+
+SEARCH_TYPES = ("task", "comment", "project")
+
+# Ключ курсора (ранг, тип, id); порядок выдачи — по убыванию всех трёх
+CursorKey = Tuple[float, str, int]
+
+
+def encode_cursor(key: CursorKey) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    try:
+        rank, item_type, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(rank), str(item_type), int(item_id)
+    except (ValueError, TypeError):
+        raise SearchQueryError("Некорректный курсор")
+
+
+class SearchService:
+    """Полнотекстовый поиск по задачам, комментариям и проектам в группах пользователя."""
+
+    def __init__(self, session: AsyncSession, service_factory: Optional['ServiceFactory'] = None):
+        self.session = session
+        self.logger = logger
+        self.service_factory = service_factory
+
+    async def _get_user_group_ids(self, user_id: int) -> List[int]:
+        stmt = (
+            select(GroupMember.group_id)
+            .join(Group, Group.id == GroupMember.group_id)
+            .where(GroupMember.user_id == user_id, Group.deleting_at.is_(None))
+        )
+        result = await self.session.execute(stmt)
+        return [row[0] for row in result.all()]
+
+    @staticmethod
+    def _after_cursor(item_type: str, rank, model, cursor: Optional[CursorKey]):
+        """Строки ветки item_type, идущие после курсора; тип внутри ветки постоянный."""
+        if cursor is None:
+            return None
+
+        cursor_rank, cursor_type, cursor_id = cursor
+        if item_type == cursor_type:
+            return or_(rank < cursor_rank, and_(rank == cursor_rank, model.id < cursor_id))
+        if item_type < cursor_type:
+            return rank <= cursor_rank
+        return rank < cursor_rank
+
+    def _branch(self, item_type: str, model, stmt, tsquery, cursor: Optional[CursorKey], limit: int):
+        rank = func.ts_rank(model.search_vector, tsquery)
+        stmt = stmt.add_columns(literal(item_type).label("type"), model.id.label("id"), rank.label("rank"))
+        stmt = stmt.where(model.search_vector.op("@@")(tsquery))
+
+        after = self._after_cursor(item_type, rank, model, cursor)
+        if after is not None:
+            stmt = stmt.where(after)
+
+        # Свой предел в каждой ветке: каждая отдаёт не больше страницы лучших совпадений
+        return stmt.order_by(rank.desc(), model.id.desc()).limit(limit)
+
+    async def search(
+        self,
+        current_user: User,
+        q: str,
+        types: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SearchPage:
+        query_text = prefix_tsquery_text(q)
+        if query_text is None:
+            raise SearchQueryError("Поисковый запрос не содержит слов")
+
+        types = list(dict.fromkeys(types or SEARCH_TYPES))
+        unknown = [item_type for item_type in types if item_type not in SEARCH_TYPES]
+        if unknown:
+            raise SearchQueryError(f"Неизвестные типы поиска: {', '.join(unknown)}")
+
+        limit = min(limit or settings.search.default_limit, settings.search.max_limit)
+        cursor_key = decode_cursor(cursor) if cursor else None
+
+        group_ids = await self._get_user_group_ids(current_user.id)
+        if not group_ids:
+            return SearchPage(items=[])
+
+        tsquery = to_tsquery(query_text)
+        branches = []
+
+        if "task" in types:
+            branches.append(self._branch(
+                "task", Task,
+                select().select_from(Task).where(Task.group_id.in_(group_ids)),
+                tsquery, cursor_key, limit + 1,
+            ))
+
+        if "comment" in types:
+            branches.append(self._branch(
+                "comment", TaskComment,
+                select()
+                .select_from(TaskComment)
+                .join(Task, Task.id == TaskComment.task_id)
+                .where(Task.group_id.in_(group_ids), TaskComment.is_deleted.is_(False)),
+                tsquery, cursor_key, limit + 1,
+            ))
+
+        if "project" in types:
+            visible_projects = (
+                select(project_group_association.c.project_id)
+                .where(project_group_association.c.group_id.in_(group_ids))
+            )
+            branches.append(self._branch(
+                "project", Project,
+                select()
+                .select_from(Project)
+                .where(Project.id.in_(visible_projects), Project.deleting_at.is_(None)),
+                tsquery, cursor_key, limit + 1,
+            ))
+
+        ranked = union_all(*[branch.subquery().select() for branch in branches]).subquery()
+        result = await self.session.execute(
+            select(ranked.c.type, ranked.c.id, ranked.c.rank)
+            .order_by(ranked.c.rank.desc(), ranked.c.type.desc(), ranked.c.id.desc())
+            .limit(limit + 1)
+        )
+        rows = result.all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        # Подсветка считается только для строк страницы: ts_headline заново разбирает текст
+        details = await self._load_details(rows, tsquery)
+        items = [details[(item_type, item_id)].model_copy(update={"rank": rank})
+                 for item_type, item_id, rank in rows if (item_type, item_id) in details]
+
+        next_cursor = None
+        if has_more and rows:
+            last_type, last_id, last_rank = rows[-1]
+            next_cursor = encode_cursor((last_rank, last_type, last_id))
+
+        return SearchPage(items=items, next_cursor=next_cursor)
+
+    async def _load_details(self, rows, tsquery) -> Dict[Tuple[str, int], SearchHitRead]:
+        ids: Dict[str, List[int]] = {}
+        for item_type, item_id, _ in rows:
+            ids.setdefault(item_type, []).append(item_id)
+
+        details: Dict[Tuple[str, int], SearchHitRead] = {}
+
+        if ids.get("task"):
+            result = await self.session.execute(
+                select(
+                    Task.id, Task.title, Task.project_id,
+                    headline(Task.title, tsquery), headline(Task.description, tsquery),
+                ).where(Task.id.in_(ids["task"]))
+            )
+            for task_id, title, project_id, title_highlight, snippet in result.all():
+                details[("task", task_id)] = SearchHitRead(
+                    type="task", id=task_id, rank=0, title=title,
+                    title_highlight=render_highlight(title_highlight),
+                    snippet=render_highlight(snippet) or None,
+                    project_id=project_id, task_id=task_id,
+                )
+
+        if ids.get("comment"):
+            result = await self.session.execute(
+                select(
+                    TaskComment.id, TaskComment.task_id, Task.title, Task.project_id,
+                    headline(TaskComment.content, tsquery),
+                )
+                .join(Task, Task.id == TaskComment.task_id)
+                .where(TaskComment.id.in_(ids["comment"]))
+            )
+            for comment_id, task_id, task_title, project_id, snippet in result.all():
+                details[("comment", comment_id)] = SearchHitRead(
+                    type="comment", id=comment_id, rank=0, title=task_title,
+                    title_highlight=render_highlight(task_title),
+                    snippet=render_highlight(snippet),
+                    project_id=project_id, task_id=task_id,
+                )
+
+        if ids.get("project"):
+            result = await self.session.execute(
+                select(
+                    Project.id, Project.title,
+                    headline(Project.title, tsquery), headline(Project.description, tsquery),
+                ).where(Project.id.in_(ids["project"]))
+            )
+            for project_id, title, title_highlight, snippet in result.all():
+                details[("project", project_id)] = SearchHitRead(
+                    type="project", id=project_id, rank=0, title=title,
+                    title_highlight=render_highlight(title_highlight),
+                    snippet=render_highlight(snippet) or None,
+                    project_id=project_id,
+                )
+
+        return details
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,7 +16,7 @@ from .schemas import (
     AddRemoveUsersToTask, TaskCreate, TaskCreateExtended, TaskRead, 
     TaskUpdate, TaskReadWithRelations, TaskBulkUpdate, BoardViewRequest,
     TaskHistoryRead, TaskCommentCreate, TaskCommentUpdate, TaskCommentRead,
-    TaskTimelineItem
+    TaskTimelineItem, TaskCommentThreadPage, TaskCommentRepliesPage, TaskTagFacet
 )
 from .exceptions import (
     TaskNotFoundError,
@@ -35,26 +35,30 @@ from .exceptions import (
 
 router = APIRouter(dependencies=[Depends(get_current_user)])
 
+TAGS_QUERY_DESCRIPTION = "Теги задачи; задача должна содержать все перечисленные"
+
 # Получить все задачи (только для супер-админа)
 @router.get("/", response_model=list[TaskRead])
 async def get_tasks(
+    tags: Optional[List[str]] = Query(None, description=TAGS_QUERY_DESCRIPTION),
     service_factory: ServiceFactory = Depends(get_service_factory),
     current_user: User = Depends(get_current_user)
 ):
     logger.info(f"GET /tasks requested by user {current_user.id}")
     task_service = service_factory.get('task')
-    return await task_service.get_all_tasks(current_user.id)
+    return await task_service.get_all_tasks(current_user.id, tags=tags)
 
 # Получить задачи текущего пользователя
 @router.get("/my", response_model=list[TaskReadWithRelations])
 async def get_my_tasks(
+    tags: Optional[List[str]] = Query(None, description=TAGS_QUERY_DESCRIPTION),
     service_factory: ServiceFactory = Depends(get_service_factory),
     current_user: User = Depends(get_current_user)
 ):
     logger.info(f"GET /tasks/my requested by user {current_user.id}")
     try:
         task_service = service_factory.get('task')
-        return await task_service.get_user_tasks(current_user.id)
+        return await task_service.get_user_tasks(current_user.id, tags=tags)
     except Exception as e:
         logger.error(f"Error getting user tasks: {e}", exc_info=True)
         raise HTTPException(
@@ -65,13 +69,14 @@ async def get_my_tasks(
 # Получить задачи команд (где пользователь состоит в группе)
 @router.get("/team", response_model=list[TaskReadWithRelations])
 async def get_team_tasks(
+    tags: Optional[List[str]] = Query(None, description=TAGS_QUERY_DESCRIPTION),
     service_factory: ServiceFactory = Depends(get_service_factory),
     current_user: User = Depends(get_current_user)
 ):
     logger.info(f"GET /tasks/team requested by user {current_user.id}")
     try:
         task_service = service_factory.get('task')
-        return await task_service.get_team_tasks(current_user.id)
+        return await task_service.get_team_tasks(current_user.id, tags=tags)
     except Exception as e:
         logger.error(f"Error getting team tasks: {e}", exc_info=True)
         raise HTTPException(
@@ -83,6 +88,12 @@ async def get_team_tasks(
 @router.get("/{task_id}/timeline", response_model=List[TaskTimelineItem])
 async def get_task_timeline(
     task_id: int,
+    before: Optional[str] = Query(
+        None,
+        pattern=r"^(comment|activity):\d+$",
+        description="Курсор: тип и id последнего элемента предыдущей страницы, например activity:42",
+    ),
+    limit: int = Query(50, ge=1, le=200),
     service_factory: ServiceFactory = Depends(get_service_factory),
     current_user: User = Depends(get_current_user),
 ):
@@ -90,7 +101,7 @@ async def get_task_timeline(
     task_service = service_factory.get('task')
 
     try:
-        return await task_service.get_task_timeline(task_id, current_user)
+        return await task_service.get_task_timeline(task_id, current_user, before=before, limit=limit)
     except (TaskNotFoundError, TaskAccessDeniedError) as e:
         logger.error(f"Error getting task timeline: {e.detail}")
         raise HTTPException(status_code=e.status_code, detail=e.detail)
@@ -113,6 +124,58 @@ async def get_task_comments(
         raise HTTPException(status_code=e.status_code, detail=e.detail)
 
 
+# Получить ветки комментариев задачи с первыми ответами
+@router.get("/{task_id}/comments/threads", response_model=TaskCommentThreadPage)
+async def get_task_comment_threads(
+    task_id: int,
+    before_id: Optional[int] = Query(None, description="Курсор: id последней ветки предыдущей страницы"),
+    limit: int = Query(20, ge=1, le=100),
+    replies_limit: int = Query(3, ge=0, le=20),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+):
+    logger.info(f"GET /tasks/{task_id}/comments/threads by user {current_user.id}")
+    task_service = service_factory.get('task')
+
+    try:
+        return await task_service.get_task_comment_threads(
+            task_id,
+            current_user,
+            before_id=before_id,
+            limit=limit,
+            replies_limit=replies_limit,
+        )
+    except (TaskNotFoundError, TaskAccessDeniedError) as e:
+        logger.error(f"Error getting task comment threads: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+# Получить следующие ответы на комментарий
+@router.get("/{task_id}/comments/{comment_id}/replies", response_model=TaskCommentRepliesPage)
+async def get_task_comment_replies(
+    task_id: int,
+    comment_id: int,
+    after_id: Optional[int] = Query(None, description="Курсор: id последнего загруженного ответа"),
+    limit: int = Query(20, ge=1, le=100),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user),
+):
+    logger.info(f"GET /tasks/{task_id}/comments/{comment_id}/replies by user {current_user.id}")
+    task_service = service_factory.get('task')
+
+    try:
+        return await task_service.get_task_comment_replies(
+            task_id,
+            comment_id,
+            current_user,
+            after_id=after_id,
+            limit=limit,
+        )
+    except (TaskNotFoundError, TaskCommentNotFoundError, TaskAccessDeniedError) as e:
+        logger.error(f"Error getting task comment replies: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
 # Добавить комментарий или ответ к комментарию
 @router.post("/{task_id}/comments", response_model=TaskCommentRead, status_code=status.HTTP_201_CREATED)
 async def create_task_comment(
@@ -380,6 +443,7 @@ async def get_project_board(
     project_id: int,
     group_id: int = Query(..., description="ID группы"),
     view_mode: str = Query("team", description="Режим просмотра: team или personal"),
+    tags: Optional[List[str]] = Query(None, description=TAGS_QUERY_DESCRIPTION),
     service_factory: ServiceFactory = Depends(get_service_factory),
     current_user: User = Depends(get_current_user)
 ):
@@ -388,7 +452,7 @@ async def get_project_board(
     
     try:
         return await task_service.get_project_board_tasks(
-            project_id, group_id, view_mode, current_user
+            project_id, group_id, view_mode, current_user, tags=tags
         )
     except (ProjectNotFoundError, GroupNotFoundError, GroupNotInProjectError, TaskAccessDeniedError) as e:
         logger.error(f"Error getting board: {e.detail}")
@@ -403,6 +467,27 @@ async def get_project_board(
             detail=f"Не удалось загрузить доску проекта: {str(e)}"
         )
 
+# Получить счётчики задач проекта по тегам
+@router.get("/tags/project/{project_id}", response_model=List[TaskTagFacet])
+async def get_project_tag_facets(
+    project_id: int,
+    group_id: Optional[int] = Query(None, description="ID группы; без него — все группы проекта пользователя"),
+    tags: Optional[List[str]] = Query(None, description="Уже выбранные теги"),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user)
+):
+    logger.info(f"GET /tasks/tags/project/{project_id}?group_id={group_id} by user {current_user.id}")
+    task_service = service_factory.get('task')
+
+    try:
+        return await task_service.get_project_tag_facets(project_id, current_user, group_id=group_id, tags=tags)
+    except (ProjectNotFoundError, GroupNotFoundError, GroupNotInProjectError, TaskAccessDeniedError) as e:
+        logger.error(f"Error getting tag facets: {e.detail}")
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.detail
+        )
+
 # Обновить статус задачи
 @router.put("/{task_id}/status", response_model=TaskRead)
 async def update_task_status(
@@ -44,6 +44,10 @@ class TaskUpdate(BaseModel):
     deadline: Optional[datetime] = None
     tags: Optional[List[str]] = None
     
+class TaskTagFacet(BaseModel):
+    tag: str
+    count: int
+
 class TaskBulkUpdate(BaseModel):
     task_id: int
     status: Optional[TaskStatus] = None
@@ -111,6 +115,26 @@ class TaskCommentRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TaskCommentReplyRead(TaskCommentRead):
+    replies_count: int = 0
+
+
+class TaskCommentThreadRead(TaskCommentRead):
+    replies_count: int = 0
+    replies: List[TaskCommentReplyRead] = []
+    next_replies_cursor: Optional[int] = None
+
+
+class TaskCommentThreadPage(BaseModel):
+    items: List[TaskCommentThreadRead]
+    next_cursor: Optional[int] = None
+
+
+class TaskCommentRepliesPage(BaseModel):
+    items: List[TaskCommentReplyRead]
+    next_cursor: Optional[int] = None
+
+
 class TaskTimelineItem(BaseModel):
     type: str
     id: int
@@ -3,8 +3,8 @@ import json
 import re
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import delete, select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import case, delete, exists, func, select, and_, or_, literal, literal_column, union_all
+from sqlalchemy.orm import aliased, selectinload
 
 from modules.groups.exceptions import InsufficientPermissionsError
 from shared.dependencies import (
@@ -18,7 +18,13 @@ from core.database.models import (
     TaskStatus, TaskPriority, task_comment_reads
 )
 from core.logger import logger
-from .schemas import AddRemoveUsersToTask, TaskCreate, TaskReadWithRelations, TaskUpdate, TaskRead, TaskBulkUpdate, TaskCommentCreate, TaskCommentUpdate
+from modules.analytics import analytics_publisher
+from modules.notifications.deadlines import deadline_scheduler
+from .schemas import (
+    AddRemoveUsersToTask, TaskCreate, TaskReadWithRelations, TaskUpdate, TaskRead, TaskBulkUpdate,
+    TaskCommentCreate, TaskCommentUpdate, TaskCommentRead, TaskCommentReplyRead, TaskCommentThreadRead,
+    TaskCommentThreadPage, TaskCommentRepliesPage, TaskTagFacet,
+)
 from .exceptions import (
     TaskNotFoundError,
     TaskCreationError,
@@ -40,6 +46,10 @@ if TYPE_CHECKING:
     from modules.notifications.service import NotificationTriggerService
 
 
+# Действия с комментариями уже представлены в ленте самими комментариями
+TIMELINE_HIDDEN_ACTIONS = ("comment_added", "comment_replied", "comment_updated", "comment_deleted")
+
+
 class TaskService:
     def __init__(self, session: AsyncSession, service_factory: Optional['ServiceFactory'] = None):
         self.session = session
@@ -91,6 +101,27 @@ class TaskService:
         except InsufficientPermissionsError:
             raise TaskAccessDeniedError("Можно изменять только свои комментарии")
 
+    @staticmethod
+    def _exclude_deleting(stmt):
+        """Задачи групп и проектов, которые сейчас удаляются, скрыты так же, как сами группы и проекты."""
+        deleting_groups = select(Group.id).where(Group.deleting_at.is_not(None))
+        deleting_projects = select(Project.id).where(Project.deleting_at.is_not(None))
+        return stmt.where(
+            or_(Task.group_id.is_(None), Task.group_id.not_in(deleting_groups)),
+            Task.project_id.not_in(deleting_projects),
+        )
+
+    @staticmethod
+    def _normalize_tags(tags: Optional[List[str]]) -> List[str]:
+        return list(dict.fromkeys(tag.strip() for tag in tags or [] if tag and tag.strip()))
+
+    def _apply_tag_filter(self, stmt, tags: Optional[List[str]]):
+        """Задачи, у которых есть все перечисленные теги; tags @> ... идёт по GIN-индексу ix_tasks_tags."""
+        tags = self._normalize_tags(tags)
+        if not tags:
+            return stmt
+        return stmt.where(Task.tags.contains(tags))
+
     def _extract_mention_logins(self, content: str) -> set[str]:
         return {
             item
@@ -203,16 +234,46 @@ class TaskService:
             details=prepared_details,
         ))
 
-    async def get_all_tasks(self, current_user_id: int) -> List[TaskRead]:
+    def _emit_analytics(
+        self,
+        task: Task,
+        event_type: str,
+        user_id: int,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        analytics_publisher.emit(
+            self.session,
+            event_type=event_type,
+            user_id=user_id,
+            project_id=task.project_id,
+            group_id=task.group_id,
+            task_id=task.id,
+            metadata=metadata,
+        )
+
+    def _emit_status_analytics(self, task: Task, old_status: TaskStatus, new_status: TaskStatus, user_id: int) -> None:
+        if new_status == TaskStatus.DONE and old_status != TaskStatus.DONE:
+            # Время цикла в дневных агрегатах — от создания задачи до перевода в DONE
+            cycle_time_seconds = None
+            if task.created_at:
+                cycle_time_seconds = max((datetime.now(timezone.utc) - task.created_at).total_seconds(), 0)
+            self._emit_analytics(task, "task_completed", user_id, {"cycle_time_seconds": cycle_time_seconds})
+        elif old_status == TaskStatus.DONE and new_status != TaskStatus.DONE:
+            self._emit_analytics(task, "task_reopened", user_id)
+
+    def _track_deadline(self, task: Task) -> None:
+        deadline_scheduler.emit(self.session, task.id, task.deadline, task.status)
+
+    async def get_all_tasks(self, current_user_id: int, tags: Optional[List[str]] = None) -> List[TaskRead]:
         self.logger.info(f"Fetching all tasks by global admin {current_user_id}")
         await ensure_global_admin_by_id(self.session, current_user_id)
-        stmt = select(Task).order_by(Task.id)
+        stmt = self._apply_tag_filter(self._exclude_deleting(select(Task)), tags).order_by(Task.id)
         result = await self.session.scalars(stmt)
         tasks = result.all()
         self.logger.debug(f"Found {len(tasks)} tasks")
         return tasks
     
-    async def get_user_tasks(self, user_id: int) -> List[TaskReadWithRelations]:
+    async def get_user_tasks(self, user_id: int, tags: Optional[List[str]] = None) -> List[TaskReadWithRelations]:
         self.logger.debug(f"Fetching tasks for user {user_id}")
         stmt = (
             select(Task)
@@ -225,6 +286,7 @@ class TaskService:
             )
             .order_by(Task.created_at.desc())
         )
+        stmt = self._apply_tag_filter(self._exclude_deleting(stmt), tags)
 
         result = await self.session.execute(stmt)
         tasks = result.scalars().unique().all()
@@ -240,7 +302,7 @@ class TaskService:
         self.logger.debug(f"Found {len(tasks)} tasks for user {user_id}")
         return tasks
     
-    async def get_team_tasks(self, user_id: int) -> List[TaskReadWithRelations]:
+    async def get_team_tasks(self, user_id: int, tags: Optional[List[str]] = None) -> List[TaskReadWithRelations]:
         self.logger.debug(f"Fetching team tasks for user {user_id}")
         
         if not self.group_service:
@@ -265,6 +327,7 @@ class TaskService:
             )
             .order_by(Task.created_at.desc())
         )
+        stmt = self._apply_tag_filter(self._exclude_deleting(stmt), tags)
 
         result = await self.session.execute(stmt)
         tasks = result.scalars().unique().all()
@@ -295,6 +358,10 @@ class TaskService:
             self.logger.warning(f"Task with ID {task_id} not found")
             raise TaskNotFoundError(task_id)
 
+        if (task.project and task.project.deleting_at) or (task.group and task.group.deleting_at):
+            self.logger.warning(f"Task {task_id} belongs to a group or project being deleted")
+            raise TaskNotFoundError(task_id)
+
         if task.group and task.group.group_members:
             task.group.users = []
             for group_member in task.group.group_members:
@@ -309,7 +376,10 @@ class TaskService:
         self._ensure_allowed_create_status(task_data.status)
         
         try:
-            stmt_project = select(Project).options(selectinload(Project.groups)).where(Project.id == task_data.project_id)
+            stmt_project = select(Project).options(selectinload(Project.groups)).where(
+                Project.id == task_data.project_id,
+                Project.deleting_at.is_(None),
+            )
             result_project = await self.session.execute(stmt_project)
             project = result_project.scalar_one_or_none()
 
@@ -356,6 +426,9 @@ class TaskService:
                 new_value=new_task.title,
                 details={"assignee_ids": [current_user.id]},
             )
+            self._emit_analytics(new_task, "task_created", current_user.id)
+            if new_task.deadline:
+                self._track_deadline(new_task)
             await self.session.commit()
             
             self.logger.info(f"Task created successfully with ID: {new_task.id}")
@@ -381,7 +454,10 @@ class TaskService:
         self._ensure_allowed_create_status(task_data.status)
         
         try:
-            stmt_project = select(Project).options(selectinload(Project.groups)).where(Project.id == task_data.project_id)
+            stmt_project = select(Project).options(selectinload(Project.groups)).where(
+                Project.id == task_data.project_id,
+                Project.deleting_at.is_(None),
+            )
             result_project = await self.session.execute(stmt_project)
             project = result_project.scalar_one_or_none()
 
@@ -459,6 +535,9 @@ class TaskService:
                 new_value=new_task.title,
                 details={"assignee_ids": [u.id for u in assigned_users]},
             )
+            self._emit_analytics(new_task, "task_created", current_user.id)
+            if new_task.deadline:
+                self._track_deadline(new_task)
             await self.session.commit()
             
             self.logger.info(f"Task for users created successfully with ID: {new_task.id}")
@@ -558,7 +637,11 @@ class TaskService:
             
             if task_update.description is not None and task_update.description != db_task.description:
                 changes['description'] = {'old': db_task.description, 'new': task_update.description}
-            
+
+            if task_update.status and task_update.status != db_task.status:
+                changes['status'] = {'old': db_task.status.value if db_task.status else None,
+                                     'new': task_update.status.value}
+
             if task_update.priority and task_update.priority != db_task.priority:
                 changes['priority'] = {'old': db_task.priority.value, 'new': task_update.priority.value}
             
@@ -573,9 +656,18 @@ class TaskService:
             if task_update.tags is not None and set(task_update.tags) != set(db_task.tags or []):
                 changes['tags'] = {'old': db_task.tags, 'new': task_update.tags}
 
+            old_status = db_task.status
+            old_deadline = db_task.deadline
+
             for key, value in task_update.model_dump(exclude_unset=True).items():
                 setattr(db_task, key, value)
 
+            if db_task.status is not None and db_task.status != old_status:
+                self._emit_status_analytics(db_task, old_status, db_task.status, current_user.id)
+
+            if db_task.deadline != old_deadline or db_task.status != old_status:
+                self._track_deadline(db_task)
+
             for field_name, change in changes.items():
                 self._add_history(
                     task_id=db_task.id,
@@ -603,6 +695,19 @@ class TaskService:
             self.logger.error(f"Error updating task {db_task.id}: {e}", exc_info=True)
             raise TaskUpdateError(f"Не удалось обновить задачу: {str(e)}")
     
+    async def purge_tasks(self, task_ids: List[int]) -> int:
+        """Удаление задач одним запросом: история, комментарии, исполнители и созвоны снимаются каскадом БД."""
+        if not task_ids:
+            return 0
+
+        result = await self.session.execute(
+            delete(Task)
+            .where(Task.id.in_(task_ids))
+            .execution_options(synchronize_session=False)
+        )
+        self.logger.debug(f"Purged {result.rowcount} tasks")
+        return result.rowcount
+
     async def remove_users_from_task(self, task_id: int, data: AddRemoveUsersToTask, current_user: User) -> dict:
         self.logger.info(f"Removing users from task {task_id} by user {current_user.id}")
         
@@ -620,31 +725,28 @@ class TaskService:
                 self.logger.warning(f"Users {data.user_ids} not in task {task_id}")
                 raise UsersNotInTaskError(data.user_ids)
 
-            for user in users_to_remove:
-                task.assignees.remove(user)
-
-            if users_to_remove:
-                self._add_history(
-                    task_id=task.id,
-                    user_id=current_user.id,
-                    action="assignees_removed",
-                    old_value=", ".join(user.login for user in users_to_remove),
-                    details={"user_ids": [user.id for user in users_to_remove]},
-                )
-
-            if not task.assignees:
-                delete_history_stmt = delete(TaskHistory).where(TaskHistory.task_id == task_id)
-                await self.session.execute(delete_history_stmt)
-                
-                await self.session.delete(task)
+            if len(users_to_remove) == len(task.assignees):
+                await self.purge_tasks([task_id])
+                deadline_scheduler.emit(self.session, task_id, None, None)
                 await self.session.commit()
                 self.logger.info(f"Task {task_id} deleted as it has no assignees")
-                
+
                 if self.notification_trigger:
                     await self.notification_trigger.on_task_deleted(task, current_user)
-                
+
                 return {"detail": "Задача удалена, так как не осталось исполнителей"}
 
+            for user in users_to_remove:
+                task.assignees.remove(user)
+
+            self._add_history(
+                task_id=task.id,
+                user_id=current_user.id,
+                action="assignees_removed",
+                old_value=", ".join(user.login for user in users_to_remove),
+                details={"user_ids": [user.id for user in users_to_remove]},
+            )
+
             await self.session.commit()
             self.logger.info(f"Users removed from task {task_id} successfully")
             
@@ -678,14 +780,8 @@ class TaskService:
             if not is_assignee:
                 await ensure_user_is_admin(self.session, current_user.id, db_task.group_id)
 
-            stmt_history = select(TaskHistory).where(TaskHistory.task_id == task_id)
-            result_history = await self.session.execute(stmt_history)
-            history_entries = result_history.scalars().all()
-            
-            for history_entry in history_entries:
-                await self.session.delete(history_entry)
-
-            await self.session.delete(db_task)
+            await self.purge_tasks([task_id])
+            deadline_scheduler.emit(self.session, task_id, None, None)
             await self.session.commit()
             
             self.logger.info(f"Task {task_id} deleted successfully")
@@ -722,6 +818,9 @@ class TaskService:
                 old_value=old_status.value,
                 new_value=new_status.value,
             )
+            if new_status != old_status:
+                self._emit_status_analytics(task, old_status, new_status, current_user.id)
+                self._track_deadline(task)
 
             await self.session.commit()
             await self.session.refresh(task)
@@ -837,6 +936,8 @@ class TaskService:
                         old_value=old_status.value,
                         new_value=update.status.value,
                     )
+                    self._emit_status_analytics(task, old_status, update.status, current_user.id)
+                    self._track_deadline(task)
                     
                     if self.notification_trigger:
                         await self.notification_trigger.on_task_status_changed(
@@ -886,33 +987,50 @@ class TaskService:
             self.logger.error(f"Error in bulk update: {e}", exc_info=True)
             raise TaskUpdateError(f"Не удалось выполнить массовое обновление: {str(e)}")
     
-    async def get_project_board_tasks(self, project_id: int, group_id: int, view_mode: str, current_user: User) -> List[TaskReadWithRelations]:
+    async def _get_project_with_groups(self, project_id: int) -> Project:
+        stmt_project = select(Project).options(selectinload(Project.groups)).where(
+            Project.id == project_id,
+            Project.deleting_at.is_(None),
+        )
+        result_project = await self.session.execute(stmt_project)
+        project = result_project.scalar_one_or_none()
+
+        if not project:
+            self.logger.warning(f"Project {project_id} not found")
+            raise ProjectNotFoundError(project_id)
+        return project
+
+    async def _ensure_board_access(self, project_id: int, group_id: int, current_user: User) -> None:
+        project = await self._get_project_with_groups(project_id)
+
+        stmt_group = select(Group).where(Group.id == group_id, Group.deleting_at.is_(None))
+        result_group = await self.session.execute(stmt_group)
+        group = result_group.scalar_one_or_none()
+
+        if not group:
+            self.logger.warning(f"Group {group_id} not found")
+            raise GroupNotFoundError(group_id)
+
+        if group not in project.groups:
+            self.logger.warning(f"Group {group_id} not in project {project_id}")
+            raise GroupNotInProjectError(group_id, project_id)
+        if not is_global_admin_user(current_user):
+            if not await check_user_in_group(self.session, current_user.id, group_id):
+                self.logger.warning(f"User {current_user.id} not in group {group_id}")
+                raise TaskAccessDeniedError("Вы не состоите в указанной группе")
+
+    async def get_project_board_tasks(
+        self,
+        project_id: int,
+        group_id: int,
+        view_mode: str,
+        current_user: User,
+        tags: Optional[List[str]] = None,
+    ) -> List[TaskReadWithRelations]:
         self.logger.info(f"Fetching board tasks for project {project_id}, group {group_id}, mode {view_mode}")
         
         try:
-            stmt_project = select(Project).options(selectinload(Project.groups)).where(Project.id == project_id)
-            result_project = await self.session.execute(stmt_project)
-            project = result_project.scalar_one_or_none()
-
-            if not project:
-                self.logger.warning(f"Project {project_id} not found")
-                raise ProjectNotFoundError(project_id)
-
-            stmt_group = select(Group).where(Group.id == group_id)
-            result_group = await self.session.execute(stmt_group)
-            group = result_group.scalar_one_or_none()
-
-            if not group:
-                self.logger.warning(f"Group {group_id} not found")
-                raise GroupNotFoundError(group_id)
-
-            if group not in project.groups:
-                self.logger.warning(f"Group {group_id} not in project {project_id}")
-                raise GroupNotInProjectError(group_id, project_id)
-            if not is_global_admin_user(current_user):
-                if not await check_user_in_group(self.session, current_user.id, group_id):
-                    self.logger.warning(f"User {current_user.id} not in group {group_id}")
-                    raise TaskAccessDeniedError("Вы не состоите в указанной группе")
+            await self._ensure_board_access(project_id, group_id, current_user)
 
             stmt = (
                 select(Task)
@@ -931,6 +1049,7 @@ class TaskService:
 
             if view_mode == "personal":
                 stmt = stmt.join(Task.assignees).where(User.id == current_user.id)
+            stmt = self._apply_tag_filter(stmt, tags)
 
             stmt = stmt.order_by(Task.status, Task.position, Task.created_at)
 
@@ -953,6 +1072,55 @@ class TaskService:
         except Exception as e:
             self.logger.error(f"Error fetching board tasks: {e}", exc_info=True)
             raise TaskUpdateError(f"Не удалось загрузить доску проекта: {str(e)}")
+
+    async def get_project_tag_facets(
+        self,
+        project_id: int,
+        current_user: User,
+        group_id: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+    ) -> List[TaskTagFacet]:
+        """Число задач проекта по каждому тегу одним агрегатом.
+
+        Без group_id считаются задачи всех групп проекта, где состоит пользователь. Выбранные
+        теги сужают выборку, и счётчики показывают, сколько задач останется при добавлении тега.
+        """
+        if group_id is not None:
+            await self._ensure_board_access(project_id, group_id, current_user)
+            group_ids = [group_id]
+        else:
+            project = await self._get_project_with_groups(project_id)
+            group_ids = [group.id for group in project.groups if group.deleting_at is None]
+            if not is_global_admin_user(current_user):
+                result = await self.session.execute(
+                    select(GroupMember.group_id).where(
+                        GroupMember.user_id == current_user.id,
+                        GroupMember.group_id.in_(group_ids),
+                    )
+                )
+                group_ids = [row[0] for row in result.all()]
+                if not group_ids:
+                    raise TaskAccessDeniedError("Вы не состоите в группах проекта")
+
+        # В старых строках встречается JSON null вместо списка, jsonb_array_elements_text на нём падает
+        tag_array = case(
+            (func.jsonb_typeof(Task.tags) == "array", Task.tags),
+            else_=literal_column("'[]'::jsonb"),
+        )
+        tag = func.jsonb_array_elements_text(tag_array).column_valued("tag")
+        task_count = func.count(Task.id.distinct())
+
+        stmt = (
+            select(tag, task_count)
+            .select_from(Task)
+            .where(Task.project_id == project_id, Task.group_id.in_(group_ids))
+            .group_by(tag)
+            .order_by(task_count.desc(), tag)
+        )
+        stmt = self._apply_tag_filter(stmt, tags)
+
+        result = await self.session.execute(stmt)
+        return [TaskTagFacet(tag=tag_name, count=count) for tag_name, count in result.all()]
     
     async def quick_create_task(self, task_data: TaskCreate, current_user: User) -> TaskReadWithRelations:
         self.logger.info(f"Quick creating task '{task_data.title}' by user {current_user.id}")
@@ -985,6 +1153,161 @@ class TaskService:
         comments = result.scalars().unique().all()
         return await self._apply_comment_read_state(comments, current_user)
 
+    def _visible_comment_condition(self):
+        # Удалённый комментарий остаётся в ветке заглушкой, только если на него уже ответили
+        reply = aliased(TaskComment)
+        return or_(
+            TaskComment.is_deleted.is_(False),
+            exists().where(reply.parent_id == TaskComment.id),
+        )
+
+    async def _get_comment_replies_counts(self, comment_ids: List[int]) -> Dict[int, int]:
+        if not comment_ids:
+            return {}
+
+        stmt = (
+            select(TaskComment.parent_id, func.count(TaskComment.id))
+            .where(TaskComment.parent_id.in_(comment_ids), self._visible_comment_condition())
+            .group_by(TaskComment.parent_id)
+        )
+        result = await self.session.execute(stmt)
+        return {parent_id: count for parent_id, count in result.all()}
+
+    def _build_comment_reply(self, comment: TaskComment, replies_counts: Dict[int, int]) -> TaskCommentReplyRead:
+        return TaskCommentReplyRead(
+            **TaskCommentRead.model_validate(comment).model_dump(),
+            replies_count=replies_counts.get(comment.id, 0),
+        )
+
+    async def get_task_comment_threads(
+        self,
+        task_id: int,
+        current_user: User,
+        before_id: Optional[int] = None,
+        limit: int = 20,
+        replies_limit: int = 3,
+    ) -> TaskCommentThreadPage:
+        await self._ensure_task_view_access(task_id, current_user)
+
+        threads_stmt = (
+            select(TaskComment)
+            .options(
+                selectinload(TaskComment.author),
+                selectinload(TaskComment.mentioned_users),
+            )
+            .where(
+                TaskComment.task_id == task_id,
+                TaskComment.parent_id.is_(None),
+                self._visible_comment_condition(),
+            )
+        )
+
+        if before_id:
+            threads_stmt = threads_stmt.where(TaskComment.id < before_id)
+
+        threads_stmt = threads_stmt.order_by(TaskComment.id.desc()).limit(limit + 1)
+        threads = list((await self.session.execute(threads_stmt)).scalars().unique().all())
+
+        has_more = len(threads) > limit
+        threads = threads[:limit]
+        thread_ids = [thread.id for thread in threads]
+
+        replies: List[TaskComment] = []
+        if thread_ids and replies_limit > 0:
+            ranked_replies = (
+                select(
+                    TaskComment.id.label("id"),
+                    func.row_number().over(
+                        partition_by=TaskComment.parent_id,
+                        order_by=TaskComment.id.asc(),
+                    ).label("position"),
+                )
+                .where(TaskComment.parent_id.in_(thread_ids), self._visible_comment_condition())
+                .subquery()
+            )
+            replies_stmt = (
+                select(TaskComment)
+                .options(
+                    selectinload(TaskComment.author),
+                    selectinload(TaskComment.mentioned_users),
+                )
+                .join(ranked_replies, ranked_replies.c.id == TaskComment.id)
+                .where(ranked_replies.c.position <= replies_limit)
+                .order_by(TaskComment.id.asc())
+            )
+            replies = list((await self.session.execute(replies_stmt)).scalars().unique().all())
+
+        await self._apply_comment_read_state(threads + replies, current_user)
+        replies_counts = await self._get_comment_replies_counts(
+            thread_ids + [reply.id for reply in replies]
+        )
+
+        replies_by_thread: Dict[int, List[TaskComment]] = {}
+        for reply in replies:
+            replies_by_thread.setdefault(reply.parent_id, []).append(reply)
+
+        items = []
+        for thread in threads:
+            thread_replies = replies_by_thread.get(thread.id, [])
+            replies_count = replies_counts.get(thread.id, 0)
+
+            items.append(TaskCommentThreadRead(
+                **TaskCommentRead.model_validate(thread).model_dump(),
+                replies_count=replies_count,
+                replies=[self._build_comment_reply(reply, replies_counts) for reply in thread_replies],
+                next_replies_cursor=(
+                    thread_replies[-1].id
+                    if thread_replies and replies_count > len(thread_replies)
+                    else None
+                ),
+            ))
+
+        return TaskCommentThreadPage(
+            items=items,
+            next_cursor=thread_ids[-1] if has_more else None,
+        )
+
+    async def get_task_comment_replies(
+        self,
+        task_id: int,
+        comment_id: int,
+        current_user: User,
+        after_id: Optional[int] = None,
+        limit: int = 20,
+    ) -> TaskCommentRepliesPage:
+        await self._ensure_task_view_access(task_id, current_user)
+        await self._get_task_comment(task_id, comment_id)
+
+        stmt = (
+            select(TaskComment)
+            .options(
+                selectinload(TaskComment.author),
+                selectinload(TaskComment.mentioned_users),
+            )
+            .where(
+                TaskComment.task_id == task_id,
+                TaskComment.parent_id == comment_id,
+                self._visible_comment_condition(),
+            )
+        )
+
+        if after_id:
+            stmt = stmt.where(TaskComment.id > after_id)
+
+        stmt = stmt.order_by(TaskComment.id.asc()).limit(limit + 1)
+        replies = list((await self.session.execute(stmt)).scalars().unique().all())
+
+        has_more = len(replies) > limit
+        replies = replies[:limit]
+
+        await self._apply_comment_read_state(replies, current_user)
+        replies_counts = await self._get_comment_replies_counts([reply.id for reply in replies])
+
+        return TaskCommentRepliesPage(
+            items=[self._build_comment_reply(reply, replies_counts) for reply in replies],
+            next_cursor=replies[-1].id if has_more else None,
+        )
+
     async def create_task_comment(
         self,
         task_id: int,
@@ -1027,6 +1350,7 @@ class TaskService:
                 "mentioned_user_ids": [user.id for user in mentioned_users],
             },
         )
+        self._emit_analytics(task, "comment_created", current_user.id)
 
         await self.session.commit()
 
@@ -1173,42 +1497,135 @@ class TaskService:
             "marked_count": marked_count,
         }
 
-    async def get_task_timeline(self, task_id: int, current_user: User) -> List[Dict[str, Any]]:
-        await self._ensure_task_view_access(task_id, current_user)
+    async def _get_timeline_cursor_key(
+        self,
+        task_id: int,
+        before: str,
+    ) -> Optional[tuple[datetime, str, int]]:
+        item_type, _, raw_id = before.partition(":")
+        item_id = int(raw_id)
 
-        comments_stmt = (
-            select(TaskComment)
-            .options(
-                selectinload(TaskComment.author),
-                selectinload(TaskComment.mentioned_users),
+        model = TaskComment if item_type == "comment" else TaskHistory
+        stmt = select(model.created_at).where(model.id == item_id, model.task_id == task_id)
+        created_at = (await self.session.execute(stmt)).scalar_one_or_none()
+
+        if created_at is None:
+            return None
+
+        return created_at, item_type, item_id
+
+    def _timeline_before_condition(self, item_type: str, model, cursor_key: tuple[datetime, str, int]):
+        """Условие «строго раньше курсора» для ветки ленты при порядке (created_at, type, id) desc."""
+        cursor_created_at, cursor_type, cursor_id = cursor_key
+
+        if item_type == cursor_type:
+            return or_(
+                model.created_at < cursor_created_at,
+                and_(model.created_at == cursor_created_at, model.id < cursor_id),
             )
-            .where(TaskComment.task_id == task_id)
+
+        if item_type < cursor_type:
+            return model.created_at <= cursor_created_at
+
+        return model.created_at < cursor_created_at
+
+    async def get_task_timeline(
+        self,
+        task_id: int,
+        current_user: User,
+        before: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        await self._ensure_task_view_access(task_id, current_user)
+
+        comments_page = select(
+            literal("comment").label("type"),
+            TaskComment.id.label("id"),
+            TaskComment.created_at.label("created_at"),
+        ).where(TaskComment.task_id == task_id)
+        history_page = select(
+            literal("activity").label("type"),
+            TaskHistory.id.label("id"),
+            TaskHistory.created_at.label("created_at"),
+        ).where(
+            TaskHistory.task_id == task_id,
+            TaskHistory.action.not_in(TIMELINE_HIDDEN_ACTIONS),
         )
-        history_stmt = (
-            select(TaskHistory)
-            .options(selectinload(TaskHistory.user))
-            .where(TaskHistory.task_id == task_id)
+
+        if before:
+            cursor_key = await self._get_timeline_cursor_key(task_id, before)
+            if cursor_key is None:
+                return []
+
+            comments_page = comments_page.where(
+                self._timeline_before_condition("comment", TaskComment, cursor_key)
+            )
+            history_page = history_page.where(
+                self._timeline_before_condition("activity", TaskHistory, cursor_key)
+            )
+
+        # Каждая ветка отдаёт не больше limit строк по индексу (task_id, created_at),
+        # итоговая страница собирается из их объединения.
+        comments_page = comments_page.order_by(TaskComment.created_at.desc(), TaskComment.id.desc()).limit(limit)
+        history_page = history_page.order_by(TaskHistory.created_at.desc(), TaskHistory.id.desc()).limit(limit)
+
+        merged = union_all(comments_page.subquery().select(), history_page.subquery().select()).subquery()
+        page_stmt = (
+            select(merged.c.type, merged.c.id, merged.c.created_at)
+            .order_by(merged.c.created_at.desc(), merged.c.type.desc(), merged.c.id.desc())
+            .limit(limit)
         )
 
-        comments_result = await self.session.execute(comments_stmt)
-        history_result = await self.session.execute(history_stmt)
+        page = (await self.session.execute(page_stmt)).all()
 
-        timeline: List[Dict[str, Any]] = []
+        comment_ids = [row.id for row in page if row.type == "comment"]
+        history_ids = [row.id for row in page if row.type == "activity"]
 
-        comments = comments_result.scalars().unique().all()
-        await self._apply_comment_read_state(comments, current_user)
+        comments_by_id: Dict[int, TaskComment] = {}
+        if comment_ids:
+            comments_stmt = (
+                select(TaskComment)
+                .options(
+                    selectinload(TaskComment.author),
+                    selectinload(TaskComment.mentioned_users),
+                )
+                .where(TaskComment.id.in_(comment_ids))
+            )
+            comments = (await self.session.execute(comments_stmt)).scalars().unique().all()
+            await self._apply_comment_read_state(comments, current_user)
+            comments_by_id = {comment.id: comment for comment in comments}
+
+        history_by_id: Dict[int, TaskHistory] = {}
+        if history_ids:
+            history_stmt = (
+                select(TaskHistory)
+                .options(selectinload(TaskHistory.user))
+                .where(TaskHistory.id.in_(history_ids))
+            )
+            history_by_id = {
+                item.id: item
+                for item in (await self.session.execute(history_stmt)).scalars().unique().all()
+            }
 
-        for comment in comments:
-            timeline.append({
-                "type": "comment",
-                "id": comment.id,
-                "created_at": comment.created_at,
-                "actor": comment.author,
-                "comment": comment,
-            })
+        timeline: List[Dict[str, Any]] = []
+
+        for row in page:
+            if row.type == "comment":
+                comment = comments_by_id.get(row.id)
+                if not comment:
+                    continue
+
+                timeline.append({
+                    "type": "comment",
+                    "id": comment.id,
+                    "created_at": comment.created_at,
+                    "actor": comment.author,
+                    "comment": comment,
+                })
+                continue
 
-        for item in history_result.scalars().unique().all():
-            if item.action in {"comment_added", "comment_replied", "comment_updated", "comment_deleted"}:
+            item = history_by_id.get(row.id)
+            if not item:
                 continue
 
             timeline.append({
@@ -1222,7 +1639,6 @@ class TaskService:
                 "details": item.details,
             })
 
-        timeline.sort(key=lambda item: item["created_at"], reverse=True)
         return timeline
 
     async def get_task_history(self, task_id: int) -> List[TaskHistory]:
@@ -0,0 +1,176 @@
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.database.models import Group, GroupMember, User
+from core.logger import logger
+from shared.dependencies import check_user_in_group
+from .exceptions import UserAccessDeniedError
+from .schemas import UserAutocompleteItem
+
+if TYPE_CHECKING:
+    from core.services import ServiceFactory
+
+
+MAX_QUERY_LENGTH = 100
+
+
+class Candidate(NamedTuple):
+    id: int
+    login: str
+    name: str
+    email: str
+
+
+# Ключ кэша: (пользователь, группа или None — все его группы, строка запроса)
+CacheKey = Tuple[int, Optional[int], str]
+
+
+def normalize_query(q: Optional[str]) -> str:
+    """Строка поиска в нижнем регистре, без пробелов по краям и символа @ упоминания."""
+    return (q or "").strip().lstrip("@").lower()[:MAX_QUERY_LENGTH]
+
+
+def candidate_matches(candidate: Candidate, q: str) -> bool:
+    """То же условие, что и ILIKE '%q%' по логину, имени и email в базе."""
+    return q in candidate.login.lower() or q in candidate.name.lower() or q in candidate.email.lower()
+
+
+def rank_candidates(candidates: List[Candidate], q: str, limit: int) -> List[Candidate]:
+    """Сначала совпадения с началом логина, затем с началом имени, внутри — по логину."""
+    def key(candidate: Candidate):
+        login = candidate.login.lower()
+        return not login.startswith(q), not candidate.name.lower().startswith(q), login
+
+    return sorted(candidates, key=key)[:limit]
+
+
+class UserCandidateCache:
+    """Короткоживущий кэш кандидатов автодополнения в памяти процесса.
+
+    Запись хранит пользователей, подходящих под строку запроса. Если выборка не упёрлась
+    в предел кандидатов, она полная, и ответ на любое продолжение строки фильтруется из неё
+    без обращения к базе: всё, что содержит «ale», содержит и «al». Изменения состава групп
+    и профилей видны в автодополнении не позже чем через ttl_seconds.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, List[Candidate], bool]]" = OrderedDict()
+
+    def lookup(self, user_id: int, group_id: Optional[int], q: str) -> Optional[List[Candidate]]:
+        now = time.monotonic()
+
+        for length in range(len(q), -1, -1):
+            key = (user_id, group_id, q[:length])
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+
+            expires_at, candidates, complete = entry
+            if expires_at <= now:
+                del self._entries[key]
+                continue
+
+            if length == len(q):
+                self._entries.move_to_end(key)
+                return candidates
+            if complete:
+                self._entries.move_to_end(key)
+                return [candidate for candidate in candidates if candidate_matches(candidate, q)]
+
+        return None
+
+    def store(self, user_id: int, group_id: Optional[int], q: str, candidates: List[Candidate], complete: bool) -> None:
+        key = (user_id, group_id, q)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, candidates, complete)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+user_candidate_cache = UserCandidateCache(
+    ttl_seconds=settings.autocomplete.cache_ttl_seconds,
+    max_entries=settings.autocomplete.cache_max_entries,
+)
+
+
+class UserAutocompleteService:
+    """Автодополнение пользователей, состоящих в общих группах с текущим пользователем."""
+
+    def __init__(self, session: AsyncSession, service_factory: Optional['ServiceFactory'] = None):
+        self.session = session
+        self.service_factory = service_factory
+        self.logger = logger
+
+    @staticmethod
+    def _scope_user_ids(user_id: int, group_id: Optional[int]):
+        if group_id is not None:
+            return select(GroupMember.user_id).where(GroupMember.group_id == group_id)
+
+        user_group_ids = (
+            select(GroupMember.group_id)
+            .join(Group, Group.id == GroupMember.group_id)
+            .where(GroupMember.user_id == user_id, Group.deleting_at.is_(None))
+        )
+        return select(GroupMember.user_id).where(GroupMember.group_id.in_(user_group_ids))
+
+    async def _fetch_candidates(self, user_id: int, group_id: Optional[int], q: str) -> Tuple[List[Candidate], bool]:
+        candidate_limit = settings.autocomplete.candidate_limit
+        stmt = select(User.id, User.login, User.name, User.email).where(
+            User.id.in_(self._scope_user_ids(user_id, group_id))
+        )
+
+        if q:
+            # ILIKE по подстроке обслуживается триграммными индексами users
+            stmt = stmt.where(
+                or_(
+                    User.login.icontains(q, autoescape=True),
+                    User.name.icontains(q, autoescape=True),
+                    User.email.icontains(q, autoescape=True),
+                )
+            ).order_by(
+                User.login.istartswith(q, autoescape=True).desc(),
+                User.name.istartswith(q, autoescape=True).desc(),
+            )
+
+        result = await self.session.execute(stmt.order_by(User.login).limit(candidate_limit + 1))
+        rows = result.all()
+
+        candidates = [Candidate(*row) for row in rows[:candidate_limit]]
+        return candidates, len(rows) <= candidate_limit
+
+    async def autocomplete(
+        self,
+        user_id: int,
+        q: Optional[str] = None,
+        group_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        exclude_self: bool = False,
+    ) -> List[UserAutocompleteItem]:
+        limit = min(limit or settings.autocomplete.default_limit, settings.autocomplete.max_limit)
+        query = normalize_query(q)
+
+        # Запись в кэше появляется только после проверки доступа к группе
+        candidates = user_candidate_cache.lookup(user_id, group_id, query)
+        if candidates is None:
+            if group_id is not None and not await check_user_in_group(self.session, user_id, group_id):
+                raise UserAccessDeniedError("Нет доступа к участникам этой группы")
+
+            candidates, complete = await self._fetch_candidates(user_id, group_id, query)
+            user_candidate_cache.store(user_id, group_id, query, candidates, complete)
+            self.logger.debug(f"Autocomplete cache miss for user {user_id}: {len(candidates)} candidates")
+
+        if exclude_self:
+            candidates = [candidate for candidate in candidates if candidate.id != user_id]
+
+        return [UserAutocompleteItem(**candidate._asdict()) for candidate in rank_candidates(candidates, query, limit)]
@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
 from core.database.session import db_session
 from core.database.models import User, SystemRole
@@ -8,9 +8,10 @@ from core.services import ServiceFactory
 from modules.auth.dependencies import get_current_user
 from modules.auth.exceptions import TokenValidationError
 from shared.dependencies import get_service_factory, ensure_global_admin_by_id
+from core.config import settings
 from core.logger import logger
 from modules.auth.utils.cookie_management import clear_auth_cookies
-from .schemas import UserCreate, UserPasswordChange, UserRead, UserUpdate, UserWithRelations
+from .schemas import UserAutocompleteItem, UserCreate, UserPasswordChange, UserRead, UserUpdate, UserWithRelations
 from .exceptions import (
     UserNotFoundError,
     UserAlreadyExistsError,
@@ -33,6 +34,18 @@ async def get_users(
     user_service = service_factory.get('user')
     return await user_service.get_all_users()
 
+# Автодополнение пользователей из общих групп (упоминания, приглашения)
+@router.get("/autocomplete", response_model=List[UserAutocompleteItem])
+async def autocomplete_users(
+    q: Optional[str] = Query(None, max_length=100, description="Часть логина, имени или email"),
+    group_id: Optional[int] = Query(None, description="Искать только среди участников группы"),
+    limit: Optional[int] = Query(None, ge=1, le=settings.autocomplete.max_limit),
+    service_factory: ServiceFactory = Depends(get_service_factory),
+    current_user: User = Depends(get_current_user)
+):
+    autocomplete_service = service_factory.get('user_autocomplete')
+    return await autocomplete_service.autocomplete(current_user.id, q=q, group_id=group_id, limit=limit)
+
 # Получить информацию о текущем пользователе
 @router.get("/me", response_model=UserWithRelations)
 async def get_current_user_info(
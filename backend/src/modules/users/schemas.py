@@ -58,4 +58,12 @@ class UserWithRelations(UserRead):
     groups: List[BaseGroupInfo] = []
     assigned_tasks: List[BaseTaskInfo] = []
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class UserAutocompleteItem(BaseModel):
+    id: int
+    login: str
+    name: str
+    email: str
+
+    model_config = ConfigDict(from_attributes=True)
@@ -5,7 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from core.database.session import db_session
-from core.database.models import GroupMember, Project, User, UserRole, SystemRole
+from core.database.models import Group, GroupMember, Project, User, UserRole, SystemRole
 from core.services import ServiceFactory
 from modules.groups.exceptions import InsufficientPermissionsError, UserNotInGroupError
 
@@ -21,18 +21,26 @@ async def get_service_factory(
     from modules.projects.service import ProjectService
     from modules.tasks.service import TaskService
     from modules.users.service import UserService
+    from modules.users.autocomplete import UserAutocompleteService
     from modules.notifications.service import NotificationService, NotificationTriggerService
     from modules.conferences.service import ConferenceService
     from modules.admin.service import AdminService
+    from modules.deletion.service import DeletionService
+    from modules.analytics.service import AnalyticsService
+    from modules.search.service import SearchService
     
     factory.register('group', lambda s, f: GroupService(s, f))
     factory.register('project', lambda s, f: ProjectService(s, f))
     factory.register('task', lambda s, f: TaskService(s, f))
     factory.register('user', lambda s, f: UserService(s, f))
+    factory.register('user_autocomplete', lambda s, f: UserAutocompleteService(s, f))
     factory.register('notification', lambda s, f: NotificationService(s, notification_publisher, f))
     factory.register('notification_trigger', lambda s, f: NotificationTriggerService(s, notification_publisher, f))
     factory.register('conference', lambda s, f: ConferenceService(s, f))
     factory.register('admin', lambda s, f: AdminService(s, f))
+    factory.register('deletion', lambda s, f: DeletionService(s, f))
+    factory.register('analytics', lambda s, f: AnalyticsService(s, f))
+    factory.register('search', lambda s, f: SearchService(s, f))
     
     try:
         yield factory
@@ -67,9 +75,10 @@ async def get_user_group_role(session: AsyncSession, user_id: int, group_id: int
 
 
 async def get_group_member(session: AsyncSession, user_id: int, group_id: int) -> GroupMember | None:
-    stmt = select(GroupMember).where(
+    stmt = select(GroupMember).join(Group, Group.id == GroupMember.group_id).where(
         GroupMember.user_id == user_id,
-        GroupMember.group_id == group_id
+        GroupMember.group_id == group_id,
+        Group.deleting_at.is_(None),
     )
     result = await session.execute(stmt)
     return result.scalar_one_or_none()
@@ -4,6 +4,8 @@ from .client import RabbitMQClient
 from .module import MessagingModule
 from .base.publisher import BasePublisher
 from .base.consumer import BaseConsumer
+from .base.writer import BaseBatchWriter
+from .outbox import AfterCommitOutbox, OutboxPublisher
 from .schemas import (
     BaseMessage,
     NotificationMessage,
@@ -27,6 +29,9 @@ __all__ = [
     'MessagingModule',
     'BasePublisher',
     'BaseConsumer',
+    'BaseBatchWriter',
+    'AfterCommitOutbox',
+    'OutboxPublisher',
     'BaseMessage',
     'NotificationMessage',
     'BroadcastMessage',
@@ -0,0 +1,65 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from core.logger import logger
+
+
+class BaseBatchWriter(ABC):
+    """Фоновая запись накопленных событий пачками: как только набралась пачка или раз в flush_interval_seconds.
+
+    Наследник копит события сам, вызывает _mark_pending при добавлении и реализует flush и pending_count.
+    """
+
+    description = "events"
+
+    def __init__(self, batch_size: int, flush_interval_seconds: float):
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.logger = logger
+        self._batch_ready = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+
+    @property
+    @abstractmethod
+    def pending_count(self) -> int:
+        pass
+
+    @abstractmethod
+    async def flush(self) -> None:
+        pass
+
+    def _mark_pending(self) -> None:
+        if self.pending_count >= self.batch_size:
+            self._batch_ready.set()
+
+    async def start(self) -> None:
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        if self._flusher:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+
+        try:
+            while True:
+                await self.flush()
+                if not self.pending_count:
+                    break
+        except Exception as e:
+            self.logger.error(f"Error writing {self.description} on shutdown: {e}", exc_info=True)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                self.logger.error(f"Error writing {self.description}: {e}", exc_info=True)
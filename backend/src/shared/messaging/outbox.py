@@ -0,0 +1,103 @@
+import asyncio
+from typing import Callable, Dict, Generic, List, Optional, Set, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.logger import logger
+from .module import MessagingModule
+from .schemas import BaseMessage, MessagePriority
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseMessage)
+
+
+class AfterCommitOutbox(Generic[T]):
+    """Копит события канала в session.info и отдаёт их приёмнику после коммита.
+
+    При откате транзакции накопленное отбрасывается. Все каналы обслуживаются одной парой
+    обработчиков after_commit/after_rollback.
+    """
+
+    _channels: Dict[str, "AfterCommitOutbox"] = {}
+
+    def __init__(self, name: str, sink: Callable[[T], None], factory: Callable[[], T] = list):
+        if name in self._channels:
+            raise ValueError(f"Outbox channel '{name}' is already registered")
+        self.name = name
+        self.key = f"pending_{name}"
+        self.sink = sink
+        self.factory = factory
+        self._channels[name] = self
+
+    def pending(self, session: AsyncSession) -> T:
+        """Контейнер событий канала в текущей транзакции сессии."""
+        return session.info.setdefault(self.key, self.factory())
+
+    @classmethod
+    def _deliver_committed(cls, session: Session) -> None:
+        for channel in cls._channels.values():
+            items = session.info.pop(channel.key, None)
+            if not items:
+                continue
+            try:
+                channel.sink(items)
+            except Exception as e:
+                logger.error(f"Error delivering committed {channel.name} events: {e}", exc_info=True)
+
+    @classmethod
+    def _drop_rolled_back(cls, session: Session) -> None:
+        for channel in cls._channels.values():
+            session.info.pop(channel.key, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_committed_outbox(session: Session) -> None:
+    AfterCommitOutbox._deliver_committed(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_outbox(session: Session) -> None:
+    AfterCommitOutbox._drop_rolled_back(session)
+
+
+class OutboxPublisher(Generic[M]):
+    """Отправляет сообщения в очередь после коммита транзакции, в которой они произошли.
+
+    Без RabbitMQ (или если публикация не удалась) сообщения передаются fallback в этом же процессе.
+    """
+
+    def __init__(self, name: str, fallback: Callable[[M], None]):
+        self.messaging: Optional[MessagingModule] = None
+        self.fallback = fallback
+        self.logger = logger
+        self.outbox: AfterCommitOutbox[List[M]] = AfterCommitOutbox(name, self._schedule)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def bind(self, messaging_module: MessagingModule) -> None:
+        self.messaging = messaging_module
+
+    def stage(self, session: AsyncSession, message: M) -> M:
+        self.outbox.pending(session).append(message)
+        return message
+
+    async def publish(self, messages: List[M]) -> None:
+        for message in messages:
+            if self.messaging and self.messaging.is_setup:
+                try:
+                    await self.messaging.publish(
+                        routing_key=self.messaging.queue_name,
+                        message=message,
+                        priority=MessagePriority.LOW.rabbitmq_priority,
+                    )
+                    continue
+                except Exception as e:
+                    self.logger.warning(f"Publishing {self.outbox.name} message failed, handling in-process: {e}")
+
+            self.fallback(message)
+
+    def _schedule(self, messages: List[M]) -> None:
+        task = asyncio.get_running_loop().create_task(self.publish(messages))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+
+@pytest.fixture
+async def db():
+    """Сессия в транзакции, откатываемой после теста, и список SQL-запросов, выполненных через неё."""
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from core.database.migrations import apply_schema_extensions
+    from core.database.models import Base
+
+    engine = create_async_engine(os.environ["TEST_DATABASE_URL"])
+    async with engine.begin() as conn:
+        await apply_schema_extensions(conn)
+        await conn.run_sync(Base.metadata.create_all)
+
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        # Точки сохранения тестовой обёртки запросами приложения не считаются
+        if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+            statements.append(statement)
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        event.listen(engine.sync_engine, "before_cursor_execute", record_statement)
+        try:
+            yield session, statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record_statement)
+            await session.close()
+            await transaction.rollback()
+
+    await engine.dispose()
@@ -0,0 +1,90 @@
+"""Загрузка комнаты конференции не должна читать историю чата.
+
+Нужна PostgreSQL-база из TEST_DATABASE_URL и переменные окружения приложения (как в .env).
+Все изменения делаются в транзакции, которая откатывается после теста.
+"""
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL не задан", allow_module_level=True)
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.base import NO_VALUE
+
+from core.database.models import (
+    ConferenceMessage,
+    ConferenceParticipant,
+    ConferenceRoom,
+    ConferenceRoomType,
+    User,
+)
+from modules.conferences.service import ConferenceService
+
+pytestmark = pytest.mark.anyio
+
+
+async def _create_room_with_chat(session: AsyncSession) -> ConferenceRoom:
+    suffix = datetime.now(timezone.utc).strftime("%H%M%S%f")
+    user = User(
+        login=f"room_owner_{suffix}",
+        email=f"room_owner_{suffix}@example.com",
+        password_hash="x",
+        name="Room Owner",
+    )
+    session.add(user)
+    await session.flush()
+
+    room = ConferenceRoom(
+        room_name=f"room-{suffix}",
+        title="Chat room",
+        room_type=ConferenceRoomType.INSTANT,
+        created_by=user.id,
+        started_at=datetime.now(timezone.utc),
+    )
+    session.add(room)
+    await session.flush()
+
+    session.add(ConferenceParticipant(room_id=room.id, user_id=user.id))
+    session.add_all(
+        ConferenceMessage(room_id=room.id, user_id=user.id, message=f"message {index}")
+        for index in range(20)
+    )
+    await session.flush()
+    session.expunge_all()
+    return room
+
+
+def _chat_queries(statements: list[str]) -> list[str]:
+    return [statement for statement in statements if "conference_messages" in statement]
+
+
+async def test_get_room_by_id_does_not_load_chat_history(db):
+    session, statements = db
+    room = await _create_room_with_chat(session)
+    statements.clear()
+
+    loaded = await ConferenceService(session).get_room_by_id(room.id)
+
+    assert loaded is not None
+    assert len(loaded.participants) == 1
+    assert _chat_queries(statements) == []
+    # Комната, создатель, приглашённые, активные участники
+    assert len(statements) == 4
+    assert inspect(loaded).attrs.messages.loaded_value is NO_VALUE
+
+
+async def test_room_with_active_participants_does_not_load_chat_history(db):
+    session, statements = db
+    room = await _create_room_with_chat(session)
+    statements.clear()
+
+    loaded = await ConferenceService(session)._get_room_with_active_participants(room.id)
+
+    assert loaded is not None
+    assert _chat_queries(statements) == []
+    assert len(statements) == 3
+    assert inspect(loaded).attrs.messages.loaded_value is NO_VALUE
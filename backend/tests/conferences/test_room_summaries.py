@@ -0,0 +1,30 @@
+"""Список доступных созвонов строится одним запросом и не трогает ленивые связи.
+
+Нужна PostgreSQL-база из TEST_DATABASE_URL и переменные окружения приложения (как в .env).
+"""
+import os
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL не задан", allow_module_level=True)
+
+from modules.conferences.service import ConferenceService
+from test_statement_counts import _create_room
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_summaries_include_rooms_created_by_other_users(db):
+    session, statements = db
+    room = await _create_room(session, messages=3)
+    statements.clear()
+
+    summaries = await ConferenceService(session).get_available_room_summaries(room.member_id)
+
+    assert [summary.id for summary in summaries] == [room.room_id]
+    assert summaries[0].creator.id == room.owner_id
+    assert summaries[0].creator.login.startswith("owner_")
+    assert summaries[0].participants_count == 2
+    assert summaries[0].is_moderator is False
+    assert len(statements) == 1
@@ -0,0 +1,176 @@
+"""Число SQL-запросов каждого обработчика созвона постоянно и не растёт с историей чата.
+
+Нужна PostgreSQL-база из TEST_DATABASE_URL и переменные окружения приложения (как в .env).
+Redis в тестах не подключён, поэтому чат и счётчики присутствия работают через БД.
+"""
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL не задан", allow_module_level=True)
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database.models import (
+    ConferenceMessage,
+    ConferenceParticipant,
+    ConferenceRoom,
+    ConferenceRoomType,
+    User,
+    conference_invited_users,
+)
+from modules.conferences.service import ConferenceService
+
+pytestmark = pytest.mark.anyio
+
+# Размеры истории чата: число запросов не должно от неё зависеть
+MESSAGE_COUNTS = [0, 40]
+
+
+@dataclass
+class RoomSetup:
+    room_id: int
+    owner_id: int
+    member_id: int
+    guest_id: int
+    last_message_id: int | None
+
+
+def _create_user(session: AsyncSession, role: str, suffix: str) -> User:
+    user = User(
+        login=f"{role}_{suffix}",
+        email=f"{role}_{suffix}@example.com",
+        password_hash="x",
+        name=role.title(),
+    )
+    session.add(user)
+    return user
+
+
+async def _create_room(session: AsyncSession, messages: int, is_active: bool = True) -> RoomSetup:
+    """Мгновенный созвон владельца: участник в комнате, гость только приглашён, messages сообщений в чате."""
+    suffix = datetime.now(timezone.utc).strftime("%H%M%S%f")
+    owner = _create_user(session, "owner", suffix)
+    member = _create_user(session, "member", suffix)
+    guest = _create_user(session, "guest", suffix)
+    await session.flush()
+
+    now = datetime.now(timezone.utc)
+    room = ConferenceRoom(
+        room_name=f"room-{suffix}",
+        title="Statement count room",
+        room_type=ConferenceRoomType.INSTANT,
+        created_by=owner.id,
+        started_at=now,
+        is_active=is_active,
+        ended_at=None if is_active else now,
+    )
+    session.add(room)
+    await session.flush()
+
+    await session.execute(insert(conference_invited_users).values([
+        {"room_id": room.id, "user_id": member.id},
+        {"room_id": room.id, "user_id": guest.id},
+    ]))
+    session.add_all([
+        ConferenceParticipant(room_id=room.id, user_id=owner.id, left_at=None if is_active else now),
+        ConferenceParticipant(room_id=room.id, user_id=member.id, left_at=None if is_active else now),
+    ])
+    chat = [
+        ConferenceMessage(room_id=room.id, user_id=member.id, message=f"message {index}")
+        for index in range(messages)
+    ]
+    session.add_all(chat)
+    await session.flush()
+
+    setup = RoomSetup(
+        room_id=room.id,
+        owner_id=owner.id,
+        member_id=member.id,
+        guest_id=guest.id,
+        last_message_id=chat[-1].id if chat else None,
+    )
+    session.expunge_all()
+    return setup
+
+
+async def _count(db, call) -> int:
+    session, statements = db
+    statements.clear()
+    await call(ConferenceService(session))
+    return len(statements)
+
+
+@pytest.mark.parametrize("messages", MESSAGE_COUNTS)
+async def test_join_room(db, messages):
+    room = await _create_room(db[0], messages)
+
+    # Комната, приглашённые, участники; вставка участия. Пользователь для токена уже загружен среди приглашённых
+    assert await _count(db, lambda service: service.join_room(room.room_id, room.guest_id)) == 4
+
+
+@pytest.mark.parametrize("messages", MESSAGE_COUNTS)
+async def test_save_message(db, messages):
+    room = await _create_room(db[0], messages)
+
+    # Комната и приглашённые для доступа; автор; вставка сообщения и его перечитывание
+    assert await _count(db, lambda service: service.save_message(room.room_id, room.member_id, "hello")) == 5
+
+
+@pytest.mark.parametrize("messages", MESSAGE_COUNTS)
+async def test_get_room_messages(db, messages):
+    room = await _create_room(db[0], messages)
+
+    # Комната и приглашённые для доступа; страница сообщений с авторами
+    assert await _count(db, lambda service: service.get_room_messages(room.room_id, room.member_id)) == 3
+
+
+@pytest.mark.parametrize("messages", MESSAGE_COUNTS[1:])
+async def test_get_room_messages_before_cursor(db, messages):
+    room = await _create_room(db[0], messages)
+
+    # Плюс чтение created_at курсора
+    assert await _count(
+        db,
+        lambda service: service.get_room_messages(room.room_id, room.member_id, before_id=room.last_message_id),
+    ) == 4
+
+
+@pytest.mark.parametrize("messages", MESSAGE_COUNTS)
+async def test_get_leave_impact(db, messages):
+    room = await _create_room(db[0], messages)
+
+    # Комната, приглашённые, активные участники
+    assert await _count(db, lambda service: service.get_leave_impact(room.room_id, room.member_id)) == 3
+
+
+@pytest.mark.parametrize("messages", MESSAGE_COUNTS)
+async def test_leave_room(db, messages):
+    room = await _create_room(db[0], messages)
+
+    # Комната, приглашённые, активные участники; обновление участия
+    assert await _count(db, lambda service: service.leave_room(room.room_id, room.member_id)) == 4
+
+
+@pytest.mark.parametrize("messages", MESSAGE_COUNTS)
+async def test_kick_participant(db, messages):
+    room = await _create_room(db[0], messages)
+
+    # Комната, приглашённые, активные участники; обновление участия и его перечитывание
+    assert await _count(
+        db,
+        lambda service: service.kick_participant(room.room_id, room.owner_id, room.member_id),
+    ) == 5
+
+
+@pytest.mark.parametrize("messages", MESSAGE_COUNTS)
+async def test_get_room_stats_of_ended_room(db, messages):
+    room = await _create_room(db[0], messages, is_active=False)
+
+    # Комната и приглашённые; поиск статистики; её сбор (существующая запись, участники,
+    # число сообщений), вставка и повторное чтение
+    assert await _count(db, lambda service: service.get_room_stats(room.room_id, room.member_id)) == 8
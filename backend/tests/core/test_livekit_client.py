@@ -0,0 +1,136 @@
+"""Повторы, джиттер и предохранитель клиента LiveKit против внутрипроцессного FakeLiveKitServer.
+
+Нужны переменные окружения приложения (как в .env): модуль клиента читает настройки при импорте.
+"""
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+try:
+    from core.utils.livekit_client import LiveKitRoomClient
+except ValidationError:
+    pytest.skip("Переменные окружения приложения не заданы", allow_module_level=True)
+
+from livekit_fake import FakeLiveKitServer
+
+pytestmark = pytest.mark.anyio
+
+API_KEY = "test-key"
+API_SECRET = "test-secret-for-livekit-fake-server-hs256"
+
+
+def _make_client(server: FakeLiveKitServer, **overrides) -> LiveKitRoomClient:
+    options = {
+        "api_url": "http://livekit.test",
+        "api_key": API_KEY,
+        "api_secret": API_SECRET,
+        "timeout_seconds": 1.0,
+        "max_retries": 2,
+        "retry_backoff_seconds": 0.0,
+        "breaker_failure_threshold": 2,
+        "breaker_reset_seconds": 0.05,
+        "transport": server.transport,
+        **overrides,
+    }
+    return LiveKitRoomClient(**options)
+
+
+@pytest.fixture
+def server():
+    return FakeLiveKitServer(API_KEY, API_SECRET)
+
+
+async def test_retries_transient_errors(server):
+    client = _make_client(server)
+    server.rooms["room-1"] = {"name": "room-1"}
+    server.fail_next = 2
+
+    assert await client.delete_room("room-1") is True
+    assert server.calls == ["DeleteRoom"] * 3
+    assert "room-1" not in server.rooms
+    await client.close()
+
+
+async def test_gives_up_after_max_retries(server):
+    client = _make_client(server, breaker_failure_threshold=10)
+    server.fail_next = 10
+
+    assert await client.list_room_names(["room-1"]) is None
+    assert len(server.calls) == 3
+    await client.close()
+
+
+async def test_backoff_uses_full_jitter(server, monkeypatch):
+    client = _make_client(server, retry_backoff_seconds=0.1, breaker_failure_threshold=10)
+    delays = []
+
+    async def record_sleep(seconds):
+        delays.append(seconds)
+
+    monkeypatch.setattr("core.utils.livekit_client.asyncio.sleep", record_sleep)
+
+    for _ in range(10):
+        server.fail_next = 3
+        await client.list_room_names(["room-1"])
+
+    # Две паузы на вызов: после первой и второй попытки
+    assert len(delays) == 20
+    for attempt, delay in enumerate(delays):
+        assert 0 <= delay <= 0.1 * (2 ** (attempt % 2))
+    assert len(set(delays)) > 1
+    await client.close()
+
+
+async def test_open_breaker_skips_requests(server):
+    client = _make_client(server, max_retries=0)
+    server.fail_next = 2
+
+    assert await client.list_room_names(["room-1"]) is None
+    assert await client.list_room_names(["room-1"]) is None
+    assert client.breaker.is_open
+
+    assert await client.list_room_names(["room-1"]) is None
+    assert len(server.calls) == 2
+    await client.close()
+
+
+async def test_half_open_allows_single_probe(server):
+    client = _make_client(server, max_retries=0)
+    server.fail_next = 2
+    await client.list_room_names(["room-1"])
+    await client.list_room_names(["room-1"])
+
+    await asyncio.sleep(client.breaker.reset_seconds)
+    server.calls.clear()
+    server.latency_seconds = 0.02
+    server.rooms["room-1"] = {"name": "room-1"}
+
+    # Пока проба в полёте, остальные запросы не доходят до сервера
+    probe, concurrent = await asyncio.gather(
+        client.list_room_names(["room-1"]),
+        client.list_room_names(["room-1"]),
+    )
+    assert probe == {"room-1"}
+    assert concurrent is None
+    assert server.calls == ["ListRooms"]
+
+    # Успешная проба замыкает предохранитель
+    assert await client.list_room_names(["room-1"]) == {"room-1"}
+    assert await client.list_room_names(["room-1"]) == {"room-1"}
+    await client.close()
+
+
+async def test_failed_probe_reopens_breaker(server):
+    client = _make_client(server, max_retries=0)
+    server.fail_next = 3
+    await client.list_room_names(["room-1"])
+    await client.list_room_names(["room-1"])
+
+    await asyncio.sleep(client.breaker.reset_seconds)
+    assert await client.list_room_names(["room-1"]) is None
+    assert len(server.calls) == 3
+
+    assert await client.list_room_names(["room-1"]) is None
+    assert len(server.calls) == 3
+    await client.close()
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+import jwt
+
+
+class FakeLiveKitServer:
+    """Внутрипроцессная замена Twirp RoomService LiveKit для тестов и нагрузочных прогонов.
+
+    Подключается к клиенту через transport, сеть не используется:
+        server = FakeLiveKitServer(api_key, api_secret)
+        client = LiveKitRoomClient(..., transport=server.transport)
+    """
+
+    def __init__(self, api_key: str, api_secret: str, latency_seconds: float = 0.0):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.latency_seconds = latency_seconds
+        self.rooms: Dict[str, Dict[str, Any]] = {}
+        self.calls: List[str] = []
+        # Следующие fail_next запросов завершатся ответом fail_status — для проверки повторов и предохранителя
+        self.fail_next = 0
+        self.fail_status = 503
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def _error(self, status_code: int, code: str, message: str) -> httpx.Response:
+        return httpx.Response(status_code, json={"code": code, "msg": message})
+
+    def _authorize(self, request: httpx.Request) -> Optional[httpx.Response]:
+        header = request.headers.get("Authorization", "")
+        if not header.startswith("Bearer "):
+            return self._error(401, "unauthenticated", "missing token")
+
+        try:
+            claims = jwt.decode(header[len("Bearer "):], self.api_secret, algorithms=["HS256"])
+        except jwt.PyJWTError as e:
+            return self._error(401, "unauthenticated", str(e))
+
+        if claims.get("iss") != self.api_key or not claims.get("video", {}).get("roomCreate"):
+            return self._error(403, "permission_denied", "insufficient grants")
+
+        return None
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        self.calls.append(method)
+
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+
+        if self.fail_next > 0:
+            self.fail_next -= 1
+            return self._error(self.fail_status, "unavailable", "injected failure")
+
+        denied = self._authorize(request)
+        if denied is not None:
+            return denied
+
+        payload = json.loads(request.content or b"{}")
+
+        if method == "CreateRoom":
+            name = payload.get("name")
+            room = self.rooms.setdefault(name, {
+                "sid": f"RM_{len(self.rooms) + 1}",
+                "name": name,
+                "emptyTimeout": payload.get("emptyTimeout", 0),
+                "maxParticipants": payload.get("maxParticipants", 0),
+                "creationTime": int(time.time()),
+            })
+            return httpx.Response(200, json=room)
+
+        if method == "DeleteRoom":
+            if self.rooms.pop(payload.get("room"), None) is None:
+                return self._error(404, "not_found", "room not found")
+            return httpx.Response(200, json={})
+
+        if method == "ListRooms":
+            names = payload.get("names") or list(self.rooms)
+            return httpx.Response(200, json={"rooms": [self.rooms[name] for name in names if name in self.rooms]})
+
+        return self._error(404, "bad_route", f"unknown method {method}")
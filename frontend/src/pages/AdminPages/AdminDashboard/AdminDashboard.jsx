@@ -37,13 +37,13 @@ export const AdminDashboard = () => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
 
-  const loadDashboard = async () => {
+  const loadDashboard = async ({ refresh = false } = {}) => {
     setLoading(true);
     setError('');
 
     try {
       const [statsData, auditData] = await Promise.all([
-        adminAPI.getStats(),
+        adminAPI.getStats({ refresh }),
         adminAPI.getAudit({ limit: 6 }),
       ]);
 
@@ -73,7 +73,7 @@ export const AdminDashboard = () => {
     <AdminLayout
       title="Сводка системы"
       actions={
-        <Button variant="secondary" onClick={loadDashboard} disabled={loading}>
+        <Button variant="secondary" onClick={() => loadDashboard({ refresh: true })} disabled={loading}>
           <RefreshCw size={16} strokeWidth={2} aria-hidden="true" />
           Обновить
         </Button>
@@ -90,6 +90,8 @@ export const ProjectDetail = () => {
   const [userRole, setUserRole] = useState('');
   const [showGroupsModal, setShowGroupsModal] = useState(false);
   const [showTasksModal, setShowTasksModal] = useState(false);
+  const [tasksCursor, setTasksCursor] = useState(null);
+  const [loadingAllTasks, setLoadingAllTasks] = useState(false);
 
   const [showDeleteProjectModal, setShowDeleteProjectModal] = useState(false);
   const [isDeletingProject, setIsDeletingProject] = useState(false);
@@ -110,7 +112,7 @@ export const ProjectDetail = () => {
       setLoading(true);
       setError('');
 
-      const projectData = await projectsAPI.getById(projectId);
+      const projectData = await projectsAPI.getById(projectId, { includeTasks: true });
       const projectGroups = Array.isArray(projectData.groups) ? projectData.groups : [];
       const projectTasks = Array.isArray(projectData.tasks) ? projectData.tasks : [];
 
@@ -141,6 +143,7 @@ export const ProjectDetail = () => {
         groups: groupsWithDetails,
         tasks: tasksWithDetails,
       });
+      setTasksCursor(projectData.next_tasks_cursor || null);
 
       setEditForm({
         title: projectData.title || '',
@@ -162,6 +165,39 @@ export const ProjectDetail = () => {
     }
   }, [projectId]);
 
+  // Полный список задач догружается по курсору только при открытии окна «Показать все»
+  const loadRemainingTasks = useCallback(async () => {
+    if (!tasksCursor) return;
+
+    try {
+      setLoadingAllTasks(true);
+
+      const loadedTasks = [];
+      let cursor = tasksCursor;
+      while (cursor) {
+        const page = await projectsAPI.getById(projectId, { includeTasks: true, tasksBeforeId: cursor });
+        loadedTasks.push(...(Array.isArray(page.tasks) ? page.tasks : []));
+        cursor = page.next_tasks_cursor || null;
+      }
+
+      setProject((prev) => ({
+        ...prev,
+        tasks: [...(prev?.tasks || []), ...loadedTasks],
+      }));
+      setTasksCursor(null);
+    } catch (err) {
+      console.error('Error loading project tasks:', err);
+      showError(`Не удалось загрузить все задачи проекта: ${handleApiError(err)}`);
+    } finally {
+      setLoadingAllTasks(false);
+    }
+  }, [projectId, tasksCursor, showError]);
+
+  const handleShowAllTasks = () => {
+    setShowTasksModal(true);
+    loadRemainingTasks();
+  };
+
   const loadAvailableGroups = useCallback(async () => {
     try {
       const groupsData = await groupsAPI.getMyGroups();
@@ -424,6 +460,7 @@ export const ProjectDetail = () => {
       setProject((prev) => ({
         ...prev,
         tasks: prev.tasks.filter((task) => task.id !== taskId),
+        tasks_count: Math.max((prev.tasks_count ?? prev.tasks.length) - 1, 0),
       }));
 
       setShowTasksModal(false);
@@ -459,7 +496,8 @@ export const ProjectDetail = () => {
   );
 
   const hasMoreGroups = project?.groups && project.groups.length > 3;
-  const hasMoreTasks = project?.tasks && project.tasks.length > 4;
+  const tasksCount = project?.tasks_count ?? project?.tasks?.length ?? 0;
+  const hasMoreTasks = tasksCount > 4;
 
   if (loading) {
     return (
@@ -666,9 +704,9 @@ export const ProjectDetail = () => {
         </article>
 
         <article className={styles.statCard}>
-          <span className={styles.statValue}>{project.tasks?.length || 0}</span>
+          <span className={styles.statValue}>{tasksCount}</span>
           <span className={styles.statLabel}>
-            {getRussianPluralForm(project.tasks?.length || 0, RUSSIAN_PLURAL_FORMS.TASK)}
+            {getRussianPluralForm(tasksCount, RUSSIAN_PLURAL_FORMS.TASK)}
           </span>
         </article>
 
@@ -830,13 +868,13 @@ export const ProjectDetail = () => {
                 Создать задачу
               </Button>
 
-              {project.tasks?.length > 0 && (
+              {tasksCount > 0 && (
                 <Button
                   variant="secondary"
                   size="small"
-                  onClick={() => setShowTasksModal(true)}
+                  onClick={handleShowAllTasks}
                 >
-                  Показать все ({project.tasks.length})
+                  Показать все ({tasksCount})
                 </Button>
               )}
             </div>
@@ -862,10 +900,10 @@ export const ProjectDetail = () => {
                 <button
                   type="button"
                   className={styles.moreItems}
-                  onClick={() => setShowTasksModal(true)}
+                  onClick={handleShowAllTasks}
                 >
                   Ещё {formatRussianCount(
-                    project.tasks.length - 4,
+                    tasksCount - 4,
                     RUSSIAN_PLURAL_FORMS.TASK
                   )}
                   <FolderKanban size={16} strokeWidth={2} aria-hidden="true" />
@@ -913,7 +951,9 @@ export const ProjectDetail = () => {
         itemType="tasks"
         isOpen={showTasksModal}
         onClose={() => setShowTasksModal(false)}
-        title={`Задачи проекта "${project.title}"`}
+        title={loadingAllTasks
+          ? `Задачи проекта "${project.title}" (загрузка...)`
+          : `Задачи проекта "${project.title}"`}
         currentUserId={user?.id}
         showDeleteButton={isAdmin}
         onDelete={(taskId, taskTitle) => handleDeleteTask(taskId, taskTitle)}
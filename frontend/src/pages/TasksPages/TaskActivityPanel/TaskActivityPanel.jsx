@@ -21,6 +21,7 @@ import styles from './TaskActivityPanel.module.css';
 
 const COMMENT_LIMIT = 2000;
 const QUOTE_LIMIT = 180;
+const TIMELINE_PAGE_SIZE = 50;
 
 const ACTION_LABELS = {
   task_created: 'Задача создана',
@@ -158,6 +159,12 @@ const renderCommentText = (text) => {
   });
 };
 
+// Курсор следующей страницы ленты — тип и id последнего элемента текущей
+const getTimelineCursor = (page) => {
+  const lastItem = page[page.length - 1];
+  return lastItem ? `${lastItem.type}:${lastItem.id}` : null;
+};
+
 const parseDetails = (details) => {
   if (!details || typeof details !== 'string') return null;
 
@@ -194,6 +201,8 @@ export const TaskActivityPanel = ({
 }) => {
   const [timeline, setTimeline] = useState([]);
   const [loading, setLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [activeFeed, setActiveFeed] = useState('comments');
   const [commentText, setCommentText] = useState('');
   const [replyTo, setReplyTo] = useState(null);
@@ -244,8 +253,10 @@ export const TaskActivityPanel = ({
 
     try {
       setLoading(true);
-      const data = await tasksAPI.getTimeline(taskId);
-      setTimeline(Array.isArray(data) ? data : []);
+      const data = await tasksAPI.getTimeline(taskId, { limit: TIMELINE_PAGE_SIZE });
+      const page = Array.isArray(data) ? data : [];
+      setTimeline(page);
+      setNextCursor(page.length >= TIMELINE_PAGE_SIZE ? getTimelineCursor(page) : null);
     } catch (err) {
       console.error('Error loading task timeline:', err);
       onError?.(`Не удалось загрузить активность: ${handleApiError(err)}`);
@@ -254,6 +265,26 @@ export const TaskActivityPanel = ({
     }
   }, [taskId, onError]);
 
+  const loadMoreTimeline = useCallback(async () => {
+    if (!taskId || !nextCursor || loadingMore) return;
+
+    try {
+      setLoadingMore(true);
+      const data = await tasksAPI.getTimeline(taskId, { before: nextCursor, limit: TIMELINE_PAGE_SIZE });
+      const page = Array.isArray(data) ? data : [];
+      setTimeline((prevTimeline) => {
+        const loadedKeys = new Set(prevTimeline.map((item) => `${item.type}:${item.id}`));
+        return [...prevTimeline, ...page.filter((item) => !loadedKeys.has(`${item.type}:${item.id}`))];
+      });
+      setNextCursor(page.length >= TIMELINE_PAGE_SIZE ? getTimelineCursor(page) : null);
+    } catch (err) {
+      console.error('Error loading older task timeline:', err);
+      onError?.(`Не удалось загрузить более раннюю активность: ${handleApiError(err)}`);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [taskId, nextCursor, loadingMore, onError]);
+
   useEffect(() => {
     loadTimeline();
   }, [loadTimeline]);
@@ -697,7 +728,10 @@ export const TaskActivityPanel = ({
           onClick={() => setActiveFeed('comments')}
         >
           Комментарии
-          <span>{unreadCommentCount > 0 ? `${unreadCommentCount}/${comments.length}` : comments.length}</span>
+          <span>
+            {unreadCommentCount > 0 ? `${unreadCommentCount}/${comments.length}` : comments.length}
+            {nextCursor ? '+' : ''}
+          </span>
         </button>
 
         <button
@@ -706,7 +740,7 @@ export const TaskActivityPanel = ({
           onClick={() => setActiveFeed('history')}
         >
           История изменений
-          <span>{activities.length}</span>
+          <span>{activities.length}{nextCursor ? '+' : ''}</span>
         </button>
       </div>
 
@@ -806,6 +840,22 @@ export const TaskActivityPanel = ({
           </div>
         )
       )}
+
+      {nextCursor && (
+        <div className={styles.loadMoreRow}>
+          <Button
+            type="button"
+            variant="secondary"
+            size="small"
+            loading={loadingMore}
+            disabled={loadingMore}
+            onClick={loadMoreTimeline}
+          >
+            <History size={15} strokeWidth={2.2} aria-hidden="true" />
+            Показать более раннюю активность
+          </Button>
+        </div>
+      )}
     </section>
   );
 };
@@ -14,8 +14,10 @@ const buildQueryParams = (params = {}) => {
 };
 
 export const adminAPI = {
-  getStats: async () => {
-    const response = await apiClient.get(`${API_ENDPOINTS.ADMIN}/stats`);
+  getStats: async ({ refresh = false } = {}) => {
+    const response = await apiClient.get(
+      `${API_ENDPOINTS.ADMIN}/stats${buildQueryParams({ refresh: refresh || undefined })}`
+    );
     return response.data;
   },
 
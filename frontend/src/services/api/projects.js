@@ -14,8 +14,12 @@ export const projectsAPI = {
     return response.data;
   },
 
-  getById: async (projectId) => {
-    const response = await apiClient.get(`${API_ENDPOINTS.PROJECTS}/${projectId}`);
+  getById: async (projectId, { includeTasks = false, tasksLimit = 200, tasksBeforeId = null } = {}) => {
+    const response = await apiClient.get(`${API_ENDPOINTS.PROJECTS}/${projectId}`, {
+      params: includeTasks
+        ? { include: 'tasks', tasks_limit: tasksLimit, tasks_before_id: tasksBeforeId || undefined }
+        : undefined,
+    });
     return response.data;
   },
 
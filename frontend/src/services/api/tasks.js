@@ -115,8 +115,16 @@ export const tasksAPI = {
   },
 
 
-  getTimeline: async (taskId) => {
-    const response = await apiClient.get(`${API_ENDPOINTS.TASKS}/${taskId}/timeline`);
+  getTimeline: async (taskId, { before, limit } = {}) => {
+    const response = await apiClient.get(
+      `${API_ENDPOINTS.TASKS}/${taskId}/timeline`,
+      {
+        params: {
+          before: before || undefined,
+          limit: limit || undefined
+        }
+      }
+    );
     return response.data;
   },
 